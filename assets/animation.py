@@ -0,0 +1,164 @@
+"""
+Animações de sprites a partir de GIFs (ou outros arquivos com vários frames).
+
+``load_animation`` decodifica o arquivo uma única vez, já no tamanho do jogo,
+e guarda o ``FrameSet`` no cache compartilhado de assets. Todas as
+instâncias que usam a mesma animação compartilham os frames; cada
+``AnimatedSprite`` só guarda o próprio relógio e troca ``self.image`` por
+uma referência ao frame da vez, sem alocar nada por frame.
+
+A decodificação de vários frames usa o Pillow, se instalado. Sem ele, só o
+primeiro frame é carregado (pelo pygame) e a animação fica estática.
+"""
+import os
+import bisect
+from typing import List, Optional, Sequence
+
+import pygame
+
+from assets.loader import (asset_cache, finish_image, load_image, open_asset, asset_exists,
+                           remember_asset)
+
+try:
+    from PIL import Image, ImageSequence
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# GIFs com atraso de até 10 ms são exibidos a 100 ms pelos navegadores; fazemos igual
+_MIN_GIF_DELAY = 0.02
+_DEFAULT_DELAY = 0.1
+_warned_no_pil = False
+
+
+class FrameSet:
+    """Frames (Surfaces) de uma animação e a duração de cada um, em segundos."""
+    __slots__ = ("frames", "durations", "ends", "total")
+
+    def __init__(self, frames: Sequence[pygame.Surface], durations: Sequence[float]):
+        self.frames = tuple(frames)
+        self.durations = tuple(durations)
+        ends = []
+        elapsed = 0.0
+        for duration in self.durations:
+            elapsed += duration
+            ends.append(elapsed)
+        self.ends = ends      # fim de cada frame, para busca binária
+        self.total = elapsed
+
+    def __len__(self):
+        return len(self.frames)
+
+    def index_at(self, t: float, loop: bool = True) -> int:
+        """Índice do frame visível no instante t (segundos desde o início)."""
+        if loop and self.total > 0:
+            t %= self.total
+        index = bisect.bisect_right(self.ends, t)
+        return index if index < len(self.frames) else len(self.frames) - 1
+
+    def get_size(self):
+        return self.frames[0].get_size()
+
+
+def _gif_delay(frame) -> float:
+    delay = frame.info.get("duration", 0) / 1000.0
+    return delay if delay > _MIN_GIF_DELAY else _DEFAULT_DELAY
+
+
+def _decode_frames(path: str, size) -> Optional[FrameSet]:
+    """Decodifica todos os frames com o Pillow."""
+    with open_asset(path) as f:
+        with Image.open(f) as image:
+            frames: List[pygame.Surface] = []
+            durations: List[float] = []
+            for frame in ImageSequence.Iterator(image):
+                rgba = frame.convert("RGBA")
+                surface = pygame.image.frombytes(rgba.tobytes(), rgba.size, "RGBA")
+                if size is not None:
+                    surface = pygame.transform.scale(surface, size)
+                surface = finish_image(surface)
+                if surface is None:
+                    return None
+                frames.append(surface)
+                durations.append(_gif_delay(frame))
+    return FrameSet(frames, durations) if frames else None
+
+
+def load_animation(path: str, size=None) -> Optional[FrameSet]:
+    """
+    Carrega uma animação, decodificando só na primeira vez.
+
+    Args:
+        path: Arquivo com vários frames (ex.: GIF)
+        size: Tupla (width, height) de todos os frames. None mantém o original
+
+    Returns:
+        FrameSet compartilhado (não modifique os frames) ou None se falhar
+    """
+    global _warned_no_pil
+    key = ("animation", os.path.normpath(path), tuple(size) if size else None)
+    frame_set = asset_cache.get(key)
+    if frame_set is not None:
+        return frame_set
+    if not asset_exists(path):
+        print(f"Aviso: Animação não encontrada: {path}")
+        return None
+
+    if PIL_AVAILABLE:
+        try:
+            frame_set = _decode_frames(path, size)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Erro ao carregar animação {path}: {e}")
+            return None
+    else:
+        if not _warned_no_pil:
+            print("Aviso: Pillow não instalado; animações usam apenas o primeiro frame")
+            _warned_no_pil = True
+        image = load_image(path, size)
+        frame_set = FrameSet([image], [_DEFAULT_DELAY]) if image is not None else None
+
+    if frame_set is not None:
+        remember_asset(key, frame_set)
+    return frame_set
+
+
+class AnimatedSprite(pygame.sprite.Sprite):
+    """
+    Sprite cuja imagem pode ser uma Surface fixa ou um FrameSet animado.
+
+    Subclasses chamam ``animate(dt)`` no update; com imagem fixa não faz nada.
+    """
+
+    def __init__(self, image, loop: bool = True, start_time: float = 0.0):
+        """
+        Args:
+            image: Surface estática ou FrameSet
+            loop: Reinicia a animação ao chegar no fim
+            start_time: Tempo inicial na animação (desencontra instâncias iguais)
+        """
+        super().__init__()
+        self.set_image(image, loop, start_time)
+
+    def set_image(self, image, loop: bool = True, start_time: float = 0.0):
+        """Troca a imagem (Surface ou FrameSet) e reinicia o relógio da animação."""
+        self.loop = loop
+        self.anim_time = start_time
+        if isinstance(image, FrameSet):
+            self.frame_set = image
+            self.frame_index = image.index_at(start_time, loop)
+            self.image = image.frames[self.frame_index]
+        else:
+            self.frame_set = None
+            self.frame_index = 0
+            self.image = image
+
+    def animate(self, dt: float):
+        """Avança o relógio da animação e troca o frame se preciso."""
+        frame_set = self.frame_set
+        if frame_set is None:
+            return
+        self.anim_time += dt
+        index = frame_set.index_at(self.anim_time, self.loop)
+        if index != self.frame_index:
+            self.frame_index = index
+            self.image = frame_set.frames[index]
@@ -0,0 +1,126 @@
+"""
+Atlas de texturas para os sprites pequenos (itens, efeitos e ícones do HUD).
+
+Os sprites são empacotados, já no tamanho usado no jogo, em uma ou poucas
+Surfaces grandes ("páginas"). Quem desenha recebe subsurfaces dessas páginas,
+então os blits de um frame leem todos da mesma textura em vez de dezenas de
+Surfaces espalhadas pela memória.
+
+O empacotamento usa prateleiras (shelf packing): os sprites pendentes são
+ordenados pela altura e colocados da esquerda para a direita em faixas
+horizontais; quando a página enche, uma nova é aberta. O atlas só cresce:
+sprites registrados depois entram no espaço livre da última página (ou numa
+página nova), e as regiões já entregues nunca mudam de lugar. Assim as
+subsurfaces guardadas por cenas e sprites vivos continuam válidas.
+
+Os nomes são globais; cada cena usa o seu prefixo ("novogame/item_banana",
+"game/item_banana") para não sobrescrever os sprites das outras.
+
+Uso:
+    from assets.atlas import sprite_atlas
+    sprite_atlas.add_many({"novogame/banana": banana_img, "hud_heart": heart_img})
+    image = sprite_atlas.get("novogame/banana")  # subsurface da página
+"""
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from core.config import ATLAS_PAGE_SIZE
+
+
+class TextureAtlas:
+    """Empacota Surfaces nomeadas em páginas e entrega subsurfaces."""
+
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE, padding: int = 1):
+        """
+        Args:
+            page_size: Largura/altura de cada página, em pixels
+            padding: Espaço vazio entre sprites vizinhos
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.sources: Dict[str, pygame.Surface] = {}
+        self.pages: List[pygame.Surface] = []
+        self.regions: Dict[str, Tuple[int, pygame.Rect]] = {}  # nome -> (página, região)
+        self._subsurfaces: Dict[str, pygame.Surface] = {}
+        self._pending: Dict[str, pygame.Surface] = {}
+        # Página sendo preenchida e posição na prateleira atual
+        self._open_page: Optional[int] = None
+        self._x = self._y = self._shelf_height = 0
+
+    def add(self, name: str, surface: pygame.Surface):
+        """Registra um sprite. Ele é colocado no atlas no próximo get()."""
+        if self.sources.get(name) is surface:
+            return
+        self.sources[name] = surface
+        placed = self.regions.get(name)
+        if placed is not None and placed[1].size == surface.get_size():
+            # Mesmo nome e tamanho: troca os pixels no lugar, a subsurface segue válida
+            page_index, rect = placed
+            self.pages[page_index].fill((0, 0, 0, 0), rect)
+            self._copy(surface, page_index, rect)
+            return
+        self._pending[name] = surface
+
+    def add_many(self, surfaces: Dict[str, pygame.Surface]):
+        """Registra vários sprites de uma vez."""
+        for name, surface in surfaces.items():
+            self.add(name, surface)
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        """Subsurface do sprite dentro do atlas, ou None se não registrado."""
+        if self._pending:
+            self._place_pending()
+        return self._subsurfaces.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sources
+
+    def _place_pending(self):
+        """Coloca os sprites pendentes, dos mais altos aos mais baixos, sem mover os já colocados."""
+        pending = self._pending
+        self._pending = {}
+        order = sorted(pending, key=lambda n: (pending[n].get_height(), pending[n].get_width()),
+                       reverse=True)
+        for name in order:
+            page_index, rect = self._allocate(*pending[name].get_size())
+            self._copy(pending[name], page_index, rect)
+            self.regions[name] = (page_index, rect)
+            self._subsurfaces[name] = self.pages[page_index].subsurface(rect)
+
+    def _allocate(self, w: int, h: int) -> Tuple[int, pygame.Rect]:
+        """Reserva uma região w×h (shelf packing). Returns: (página, Rect)."""
+        pad = self.padding
+        limit = self.page_size
+        if w > limit or h > limit:
+            # Sprite maior que a página: ganha uma página só para ele
+            self.pages.append(self._new_page((w, h)))
+            return len(self.pages) - 1, pygame.Rect(0, 0, w, h)
+        if self._open_page is not None and self._x + w > limit:
+            # Nova prateleira
+            self._x, self._y = 0, self._y + self._shelf_height + pad
+            self._shelf_height = 0
+        if self._open_page is None or self._y + h > limit:
+            # Sem página aberta ou página cheia: abre outra
+            self.pages.append(self._new_page((limit, limit)))
+            self._open_page = len(self.pages) - 1
+            self._x = self._y = self._shelf_height = 0
+        rect = pygame.Rect(self._x, self._y, w, h)
+        self._x += w + pad
+        self._shelf_height = max(self._shelf_height, h)
+        return self._open_page, rect
+
+    def _copy(self, surface: pygame.Surface, page_index: int, rect: pygame.Rect):
+        # BLEND_RGBA_MAX sobre a região zerada copia os pixels e o alfa exatos
+        self.pages[page_index].blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+    @staticmethod
+    def _new_page(size: Tuple[int, int]) -> pygame.Surface:
+        page = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        return page
+
+
+# Atlas global dos sprites pequenos
+sprite_atlas = TextureAtlas()
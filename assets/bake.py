@@ -0,0 +1,245 @@
+"""
+Bake de imagens: cache em disco de imagens já decodificadas e redimensionadas.
+
+Cada par (imagem de origem, tamanho no jogo) vira um arquivo de pixels RGBA
+crus em ``BAKE_DIR``. Em vez de decodificar o PNG inteiro e redimensioná-lo
+a cada construção de cena, ``load_image`` mapeia o arquivo em memória e cria
+a Surface com ``pygame.image.frombuffer``, sem cópia.
+
+O manifesto guarda o hash SHA-1 do conteúdo de cada origem: rodar o bake de
+novo só refaz o que mudou. Em tempo de jogo a validade é checada pelo
+tamanho e mtime da origem (um stat), sem reler o arquivo.
+
+Os pares a assar são descobertos construindo as cenas de forma headless e
+registrando cada imagem pedida:
+
+    python -m assets.bake            # assa o que mudou
+    python -m assets.bake --force    # refaz tudo
+    python -m assets.bake --clean    # apaga o cache
+
+Formato de cada arquivo (little-endian):
+    "DNBK" largura:u16 altura:u16 (preenchido até 16 bytes) pixels RGBA
+"""
+import os
+import json
+import mmap
+import struct
+import hashlib
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+import pygame
+
+from core.config import BAKE_DIR
+
+MAGIC = b"DNBK"
+_HEADER = struct.Struct("<4sHH")
+_HEADER_SIZE = 16  # cabeçalho alinhado: pixels começam em múltiplo de 16
+MANIFEST_NAME = "manifest.json"
+
+_manifest: Optional[Dict[str, Dict]] = None
+_manifest_lock = threading.Lock()
+
+# Pares (caminho, tamanho) pedidos enquanto a gravação está ativa (usado pelo CLI)
+requested: Set[Tuple[str, Tuple[int, int]]] = set()
+recording = False
+
+
+def _key(path: str, size: Tuple[int, int]) -> str:
+    return f"{os.path.normpath(path)}|{size[0]}x{size[1]}"
+
+
+def _manifest_path(bake_dir: str) -> str:
+    return os.path.join(bake_dir, MANIFEST_NAME)
+
+
+def _read_manifest(bake_dir: str) -> Dict[str, Dict]:
+    try:
+        with open(_manifest_path(bake_dir), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_manifest() -> Dict[str, Dict]:
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                _manifest = _read_manifest(BAKE_DIR)
+    return _manifest
+
+
+def reload_manifest():
+    """Descarta o manifesto em memória (relido no próximo load_baked)."""
+    global _manifest
+    _manifest = None
+
+
+def load_baked(path: str, size) -> Optional[pygame.Surface]:
+    """
+    Surface da versão assada de (path, size), se existir e estiver atualizada.
+
+    A Surface compartilha a memória do arquivo mapeado; o mapeamento vive
+    enquanto ela viver. Pode ser chamada fora da thread principal.
+
+    Args:
+        path: Imagem de origem
+        size: Tamanho no jogo (None nunca tem versão assada)
+
+    Returns:
+        Surface RGBA (ainda sem convert_alpha) ou None
+    """
+    if size is None:
+        return None
+    size = (int(size[0]), int(size[1]))
+    if recording:
+        requested.add((os.path.normpath(path), size))
+
+    entry = _get_manifest().get(_key(path, size))
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(path)
+        if stat.st_size != entry["source_size"] or stat.st_mtime_ns != entry["source_mtime"]:
+            return None  # origem mudou depois do bake
+        with open(os.path.join(BAKE_DIR, entry["file"]), "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, height = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or (width, height) != size:
+            return None
+        return pygame.image.frombuffer(memoryview(data)[_HEADER_SIZE:], size, "RGBA")
+    except (OSError, ValueError, struct.error, pygame.error):
+        return None
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bake(pairs, bake_dir: str = BAKE_DIR, force: bool = False) -> Tuple[int, int]:
+    """
+    Assa os pares (caminho, tamanho), refazendo só as origens alteradas.
+
+    Args:
+        pairs: Iterável de (caminho da imagem, (largura, altura))
+        bake_dir: Diretório de saída
+        force: Refaz tudo, ignorando os hashes
+
+    Returns:
+        (assados agora, reaproveitados)
+    """
+    os.makedirs(bake_dir, exist_ok=True)
+    manifest = _read_manifest(bake_dir)
+    hashes: Dict[str, str] = {}
+    built = reused = 0
+
+    for path, size in sorted(pairs):
+        if not os.path.exists(path):
+            continue
+        key = _key(path, size)
+        source_hash = hashes.get(path) or hashes.setdefault(path, _hash_file(path))
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".raw"
+        out_path = os.path.join(bake_dir, file_name)
+        stat = os.stat(path)
+        entry = manifest.get(key)
+
+        if (not force and entry is not None and entry["hash"] == source_hash
+                and os.path.exists(out_path)):
+            # Conteúdo igual: só atualiza o stat (ex.: checkout mudou o mtime)
+            entry["source_size"] = stat.st_size
+            entry["source_mtime"] = stat.st_mtime_ns
+            reused += 1
+            continue
+
+        image = pygame.transform.scale(pygame.image.load(path), size)
+        pixels = pygame.image.tobytes(image, "RGBA")
+        with open(out_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, size[0], size[1]).ljust(_HEADER_SIZE, b"\0"))
+            f.write(pixels)
+        manifest[key] = {
+            "file": file_name,
+            "hash": source_hash,
+            "source_size": stat.st_size,
+            "source_mtime": stat.st_mtime_ns,
+        }
+        built += 1
+
+    with open(_manifest_path(bake_dir), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    reload_manifest()
+    return built, reused
+
+
+def collect_game_images() -> Set[Tuple[str, Tuple[int, int]]]:
+    """
+    Descobre os pares (imagem, tamanho) usados pelo jogo.
+
+    Constrói as cenas de forma headless, passando por todos os níveis, e
+    registra cada imagem pedida ao loader.
+    """
+    global recording
+    from core.headless import init_headless
+    init_headless()
+    try:
+        pygame.mixer.init()  # as cenas tocam música ao construir
+    except pygame.error:
+        pass
+    from assets.loader import asset_cache
+    from ui.hud import init_hud_icons
+    from scenes.game_scene import GameScene as LegacyGameScene
+    from scenes.novogame_scene import GameScene
+
+    requested.clear()
+    asset_cache.clear()
+    recording = True
+    try:
+        init_hud_icons()
+        LegacyGameScene()
+        scene = GameScene()
+        for level in range(1, scene.max_level + 1):
+            spec = scene._level_asset_spec(level)
+            for path, size in spec["images"].values():
+                load_baked(path, size)
+            scene.load_level(level)
+    finally:
+        recording = False
+    return set(requested)
+
+
+def clean(bake_dir: str = BAKE_DIR):
+    """Apaga os arquivos assados e o manifesto."""
+    if not os.path.isdir(bake_dir):
+        return
+    for name in os.listdir(bake_dir):
+        if name.endswith(".raw") or name == MANIFEST_NAME:
+            os.remove(os.path.join(bake_dir, name))
+    reload_manifest()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Assa as imagens do jogo nos tamanhos usados")
+    parser.add_argument("--force", action="store_true", help="refaz todas as imagens")
+    parser.add_argument("--clean", action="store_true", help="apaga o cache assado e sai")
+    parser.add_argument("--out", default=BAKE_DIR, help="diretório de saída")
+    args = parser.parse_args(argv)
+
+    if args.clean:
+        clean(args.out)
+        print(f"Cache assado removido de {args.out}")
+        return
+
+    pairs = collect_game_images()
+    built, reused = bake(pairs, args.out, args.force)
+    print(f"{len(pairs)} imagens: {built} assadas, {reused} reaproveitadas -> {args.out}")
+
+
+if __name__ == "__main__":
+    # Roda pelo módulo importado: o loader usa o estado de assets.bake, não de __main__
+    from assets.bake import main as bake_main
+    bake_main()
@@ -4,8 +4,168 @@ Centraliza o carregamento de imagens, sons e música com tratamento de erros.
 """
 import pygame
 import os
+import io
+import threading
+from collections import OrderedDict
+from core.config import ASSET_CACHE_BUDGET
+from assets.bake import load_baked
+from assets.pack import get_asset_pack
+from assets.pcm_cache import load_pcm, store_pcm, source_signature, should_cache
 
-def load_image(path, size=None, convert_alpha=True):
+class AssetCache:
+    """
+    Cache de assets compartilhado pelo processo, com despejo LRU por orçamento
+    de memória. Também lembra caminhos inexistentes (cache negativo), para não
+    repetir o stat nem o aviso a cada construção de cena.
+    """
+    
+    def __init__(self, budget=ASSET_CACHE_BUDGET):
+        """
+        Args:
+            budget: Memória máxima, em bytes, ocupada pelos assets em cache
+        """
+        self.budget = budget
+        self.entries = OrderedDict()  # chave -> (asset, bytes)
+        self.total_bytes = 0
+        self.missing = set()   # caminhos que não existem
+        self.present = set()   # caminhos já confirmados
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Retorna o asset em cache (marcando como recente) ou None."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, asset, size):
+        """Guarda um asset, despejando os menos usados se passar do orçamento."""
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self.entries[key] = (asset, size)
+            self.total_bytes += size
+            # Nunca despeja o asset recém-inserido
+            while self.total_bytes > self.budget and len(self.entries) > 1:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+    
+    def exists(self, path):
+        """os.path.exists (pacote primeiro) com cache positivo e negativo."""
+        with self._lock:
+            if path in self.present:
+                return True
+            if path in self.missing:
+                return False
+        # O stat fica fora da trava; dois threads no mesmo caminho chegam ao mesmo resultado
+        pack = get_asset_pack()
+        found = (pack is not None and path in pack) or os.path.exists(path)
+        with self._lock:
+            (self.present if found else self.missing).add(path)
+        return found
+    
+    def known_missing(self, path):
+        """True se o caminho já foi confirmado como inexistente (sem stat)."""
+        with self._lock:
+            return path in self.missing
+    
+    def clear(self):
+        """Esvazia o cache (assets e resultados de existência)."""
+        with self._lock:
+            self.entries.clear()
+            self.total_bytes = 0
+            self.missing.clear()
+            self.present.clear()
+
+# Cache global de assets
+asset_cache = AssetCache()
+
+def asset_exists(path):
+    """Verifica se um arquivo de asset existe, usando o cache de existência."""
+    return asset_cache.exists(os.path.normpath(path))
+
+def open_asset(path):
+    """
+    Abre um asset para leitura: do pacote (sem cópia) se estiver lá, senão do disco.
+    
+    Returns:
+        Objeto file-like binário (fechar após o uso)
+    """
+    pack = get_asset_pack()
+    if pack is not None:
+        packed = pack.open(path)
+        if packed is not None:
+            return packed
+    return open(path, "rb")
+
+def _image_source(path):
+    """Arquivo do pacote (file-like) ou o próprio caminho, para pygame.image.load."""
+    pack = get_asset_pack()
+    packed = pack.open(path) if pack is not None else None
+    return packed if packed is not None else path
+
+def _wav_samples(view):
+    """
+    Amostras PCM de um WAV já no formato do mixer, como memoryview sem cópia.
+    Retorna None se o arquivo não for WAV PCM compatível.
+    """
+    mixer = pygame.mixer.get_init()
+    if not mixer or len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        return None
+    frequency, sample_format, channels = mixer
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = bytes(view[pos:pos + 4])
+        chunk_size = int.from_bytes(view[pos + 4:pos + 8], "little")
+        body = pos + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            fmt = (int.from_bytes(view[body:body + 2], "little"),        # 1 = PCM
+                   int.from_bytes(view[body + 2:body + 4], "little"),    # canais
+                   int.from_bytes(view[body + 4:body + 8], "little"),    # taxa
+                   int.from_bytes(view[body + 14:body + 16], "little"))  # bits
+        elif chunk_id == b"data" and fmt is not None:
+            audio_format, wav_channels, rate, bits = fmt
+            same_format = (bits == 16 and sample_format == -16) or (bits == 8 and sample_format == 8)
+            if audio_format == 1 and wav_channels == channels and rate == frequency and same_format:
+                return view[body:body + chunk_size]
+            return None
+        pos = body + chunk_size + (chunk_size & 1)
+    return None
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+def _sound_bytes(sound):
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, sample_format, channels = mixer
+    return int(sound.get_length() * frequency * channels * (abs(sample_format) // 8))
+
+def image_cache_key(path, size=None, convert_alpha=True):
+    """Chave de uma imagem no asset_cache (a mesma usada por load_image)."""
+    return ("image", os.path.normpath(path), tuple(size) if size else None, convert_alpha)
+
+def remember_asset(key, asset):
+    """Guarda no asset_cache uma Surface ou Sound já carregado."""
+    if isinstance(asset, pygame.Surface):
+        asset_cache.put(key, asset, _surface_bytes(asset))
+    elif hasattr(asset, "frames"):  # FrameSet de assets/animation.py
+        asset_cache.put(key, asset, sum(_surface_bytes(frame) for frame in asset.frames))
+    else:
+        asset_cache.put(key, asset, _sound_bytes(asset))
+
+def load_image(path, size=None, convert_alpha=True, cache=True):
     """
     Carrega uma imagem com tratamento de erros robusto.
     
@@ -13,23 +173,49 @@ def load_image(path, size=None, convert_alpha=True):
         path: Caminho para o arquivo de imagem
         size: Tupla (width, height) para redimensionar. None mantém tamanho original
         convert_alpha: Se True, otimiza a imagem para transparência
+        cache: Se True, usa/guarda o resultado no cache compartilhado
+    
+    Returns:
+        Surface do pygame ou None se falhar. Imagens em cache são
+        compartilhadas: não modifique a Surface retornada.
+    """
+    key = image_cache_key(path, size, convert_alpha)
+    if cache:
+        image = asset_cache.get(key)
+        if image is not None:
+            return image
+    
+    image = decode_image(path, size)
+    if image is None:
+        return None
+    image = finish_image(image, convert_alpha)
+    if cache and image is not None:
+        remember_asset(key, image)
+    return image
+
+def decode_image(path, size=None):
+    """
+    Lê e decodifica uma imagem sem convertê-la para o formato da tela.
+    Pode ser chamada fora da thread principal (não depende do display).
+    
+    Args:
+        path: Caminho para o arquivo de imagem
+        size: Tupla (width, height) para redimensionar. None mantém tamanho original
     
     Returns:
         Surface do pygame ou None se falhar
     """
     try:
-        if not os.path.exists(path):
-            print(f"Aviso: Imagem não encontrada: {path}")
+        if not _check_exists(path, "Imagem não encontrada"):
             return None
-            
-        # Carrega a imagem
-        image = pygame.image.load(path)
         
-        # Otimiza para performance
-        if convert_alpha:
-            image = image.convert_alpha()
-        else:
-            image = image.convert()
+        # Versão já redimensionada do bake (assets/bake.py), se atualizada
+        image = load_baked(path, size)
+        if image is not None:
+            return image
+            
+        # Carrega a imagem (do pacote, se houver, senão do disco)
+        image = pygame.image.load(_image_source(path), os.path.basename(path))
             
         # Redimensiona se necessário
         if size is not None:
@@ -44,24 +230,84 @@ def load_image(path, size=None, convert_alpha=True):
         print(f"Erro inesperado ao carregar imagem {path}: {e}")
         return None
 
-def load_sound(path, volume=1.0):
+def _check_exists(path, warning):
+    """Checa existência pelo cache; o aviso de arquivo ausente sai só uma vez."""
+    path = os.path.normpath(path)
+    if asset_cache.known_missing(path):
+        return False
+    if asset_cache.exists(path):
+        return True
+    print(f"Aviso: {warning}: {path}")
+    return False
+
+def finish_image(image, convert_alpha=True):
+    """
+    Converte uma imagem decodificada para o formato da tela.
+    Deve rodar na thread principal, com o modo de vídeo já definido.
+    
+    Args:
+        image: Surface retornada por decode_image
+        convert_alpha: Se True, otimiza a imagem para transparência
+    
+    Returns:
+        Surface convertida, ou None se falhar
+    """
+    try:
+        # Otimiza para performance
+        if convert_alpha:
+            return image.convert_alpha()
+        return image.convert()
+    except pygame.error as e:
+        print(f"Erro ao converter imagem: {e}")
+        return None
+
+def load_sound(path, volume=1.0, cache=True):
     """
     Carrega um arquivo de som com tratamento de erros.
     
     Args:
         path: Caminho para o arquivo de som
         volume: Volume inicial (0.0 a 1.0)
+        cache: Se True, usa/guarda o resultado no cache compartilhado
     
     Returns:
-        Sound object do pygame ou None se falhar
+        Sound object do pygame ou None se falhar. Sons em cache são
+        compartilhados entre quem pede o mesmo (caminho, volume).
     """
+    key = ("sound", os.path.normpath(path), volume)
+    sound = asset_cache.get(key) if cache else None
+    if sound is not None:
+        return sound
     try:
-        if not os.path.exists(path):
-            print(f"Aviso: Som não encontrado: {path}")
+        if not _check_exists(path, "Som não encontrado"):
             return None
             
-        sound = pygame.mixer.Sound(path)
+        # Amostras já decodificadas do cache de PCM (MP3s e WAVs grandes)
+        signature = source_signature(path)
+        cacheable = should_cache(path, signature)
+        sound = load_pcm(path, signature) if cacheable else None
+        if sound is not None:
+            sound.set_volume(volume)
+            if cache:
+                remember_asset(key, sound)
+            return sound
+        
+        pack = get_asset_pack()
+        view = pack.view(path) if pack is not None else None
+        if view is None:
+            sound = pygame.mixer.Sound(path)
+        else:
+            # WAV já no formato do mixer vai direto como buffer; o resto é decodificado
+            samples = _wav_samples(view)
+            if samples is not None:
+                sound = pygame.mixer.Sound(buffer=samples)
+            else:
+                sound = pygame.mixer.Sound(file=pack.open(path))
+        if cacheable:
+            store_pcm(path, sound, signature)
         sound.set_volume(volume)
+        if cache:
+            remember_asset(key, sound)
         return sound
         
     except pygame.error as e:
@@ -71,22 +317,32 @@ def load_sound(path, volume=1.0):
         print(f"Erro inesperado ao carregar som {path}: {e}")
         return None
 
-def load_music(path):
+def load_music(path, data=None):
     """
     Carrega música de fundo.
     
     Args:
         path: Caminho para o arquivo de música
+        data: Conteúdo do arquivo já lido (ex.: pelo LevelPreloader); evita I/O
     
     Returns:
         True se carregou com sucesso, False caso contrário
     """
     try:
-        if not os.path.exists(path):
-            print(f"Aviso: Música não encontrada: {path}")
+        if data is not None:
+            # namehint ajuda o SDL a identificar o formato pelo nome
+            pygame.mixer.music.load(io.BytesIO(data), os.path.basename(path))
+            return True
+            
+        if not _check_exists(path, "Música não encontrada"):
             return False
             
-        pygame.mixer.music.load(path)
+        pack = get_asset_pack()
+        packed = pack.open(path) if pack is not None else None
+        if packed is not None:
+            pygame.mixer.music.load(packed, os.path.basename(path))
+        else:
+            pygame.mixer.music.load(path)
         return True
         
     except pygame.error as e:
@@ -111,10 +367,14 @@ def create_placeholder_surface(size, color=(255, 0, 255)):
     surface.fill(color)
     return surface
 
-def preload_game_assets():
+def preload_game_assets(progress=None):
     """
     Pré-carrega todos os assets do jogo para verificar integridade.
     Útil para debugging e validação durante desenvolvimento.
+    Imagens e sons são decodificados em paralelo (assets/parallel.py).
+    
+    Args:
+        progress: Callback opcional (prontos, total, nome) a cada asset carregado
     
     Returns:
         Dict com status do carregamento de cada asset
@@ -157,9 +417,15 @@ def preload_game_assets():
         'boss': 'assets/audio/boss_music.wav'
     }
     
+    # Dispara imagens e sons de uma vez no pool de threads
+    from assets.parallel import ParallelLoader
+    loader = ParallelLoader(progress)
+    image_handles = {name: loader.image(path) for name, path in image_paths.items()}
+    sound_handles = {name: loader.sound(path) for name, path in sound_paths.items()}
+    
     # Testa carregamento de imagens
     for name, path in image_paths.items():
-        image = load_image(path)
+        image = image_handles[name].result()
         assets_status['images'][name] = {
             'path': path,
             'loaded': image is not None,
@@ -168,7 +434,7 @@ def preload_game_assets():
     
     # Testa carregamento de sons
     for name, path in sound_paths.items():
-        sound = load_sound(path)
+        sound = sound_handles[name].result()
         assets_status['sounds'][name] = {
             'path': path,
             'loaded': sound is not None,
@@ -209,11 +475,3 @@ def print_assets_report():
     print("\n" + "=" * 60)
     print("Legenda: ✓=Carregado ✗=Falha 📁=Arquivo existe ❌=Arquivo não encontrado")
     print("=" * 60)
-
-# Inicialização automática para verificar pygame
-try:
-    if not pygame.get_init():
-        pygame.init()
-        pygame.mixer.init()
-except Exception as e:
-    print(f"Aviso: Erro na inicialização do pygame: {e}")
\ No newline at end of file
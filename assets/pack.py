@@ -0,0 +1,225 @@
+"""
+Pacote de assets em arquivo único, lido por mmap.
+
+Em vez de centenas de stat/open contra a árvore ``assets/``, o jogo mapeia
+um único arquivo em memória e entrega ``memoryview``s dos arquivos
+empacotados, sem cópia. ``assets/loader.py`` procura primeiro no pacote e só
+depois nos arquivos soltos, então o pacote é opcional.
+
+Os nomes no pacote são os caminhos relativos ao diretório do jogo, com "/"
+(ex.: ``assets/images/itens/banana.png``), exatamente como o código os monta.
+
+Gerar o pacote:
+    python -m assets.pack                 # empacota assets/ em PACK_PATH
+    python -m assets.pack --list          # lista o conteúdo do pacote
+
+Formato (little-endian):
+    cabeçalho  "DNPK" versão:u16 alinhamento:u16 n:u32 tamanho_nomes:u32
+    índice     n × (offset_nome:u32 tamanho_nome:u16 pad:u16 offset:u64 tamanho:u64),
+               ordenado pelo nome
+    nomes      UTF-8 concatenados
+    dados      cada arquivo começa num múltiplo do alinhamento
+"""
+import os
+import io
+import bisect
+import mmap
+import struct
+import threading
+from typing import List, Optional
+
+from core.config import PACK_PATH
+
+MAGIC = b"DNPK"
+VERSION = 1
+ALIGNMENT = 16
+
+_HEADER = struct.Struct("<4sHHII")
+_ENTRY = struct.Struct("<IHxxQQ")
+
+# Arquivos que não vão para o pacote
+_SKIP_DIRS = {"__pycache__", "baked"}
+# (vídeos ficam soltos: o player de cutscenes abre o arquivo pelo caminho)
+_SKIP_EXTENSIONS = {".py", ".pyc", ".pak", ".mp4", ".avi", ".mov", ".webm"}
+
+
+def pack_name(path: str) -> str:
+    """Nome de um caminho dentro do pacote."""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+class MemoryFile(io.RawIOBase):
+    """Arquivo somente leitura sobre um memoryview (para APIs que pedem file-like)."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._view[self._pos:self._pos + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._pos += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+class AssetPack:
+    """Pacote de assets mapeado em memória."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Arquivo .pak gerado por ``python -m assets.pack``
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, names_size = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Pacote de assets inválido: {path}")
+
+        names_start = _HEADER.size + count * _ENTRY.size
+        names_blob = bytes(self._data[names_start:names_start + names_size])
+        self.names: List[str] = []
+        self._spans = []
+        for i in range(count):
+            name_offset, name_size, offset, size = _ENTRY.unpack_from(self._data, _HEADER.size + i * _ENTRY.size)
+            self.names.append(names_blob[name_offset:name_offset + name_size].decode("utf-8"))
+            self._spans.append((offset, size))
+        self._view = memoryview(self._data)
+
+    def _find(self, name: str) -> int:
+        i = bisect.bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            return i
+        return -1
+
+    def __contains__(self, path: str) -> bool:
+        return self._find(pack_name(path)) >= 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def view(self, path: str) -> Optional[memoryview]:
+        """memoryview (sem cópia) do arquivo empacotado, ou None se não houver."""
+        i = self._find(pack_name(path))
+        if i < 0:
+            return None
+        offset, size = self._spans[i]
+        return self._view[offset:offset + size]
+
+    def open(self, path: str) -> Optional[MemoryFile]:
+        """File-like somente leitura do arquivo empacotado, ou None."""
+        view = self.view(path)
+        return MemoryFile(view) if view is not None else None
+
+
+_pack: Optional[AssetPack] = None
+_pack_loaded = False
+_pack_lock = threading.Lock()
+
+
+def get_asset_pack() -> Optional[AssetPack]:
+    """Pacote padrão (PACK_PATH), aberto uma vez; None se não existir."""
+    global _pack, _pack_loaded
+    if not _pack_loaded:
+        with _pack_lock:
+            if not _pack_loaded:
+                if os.path.exists(PACK_PATH):
+                    try:
+                        _pack = AssetPack(PACK_PATH)
+                    except (OSError, ValueError, struct.error) as e:
+                        print(f"Aviso: Pacote de assets ignorado ({PACK_PATH}): {e}")
+                _pack_loaded = True
+    return _pack
+
+
+def collect_files(root: str) -> List[str]:
+    """Arquivos de asset sob root, como nomes de pacote."""
+    files = []
+    for folder, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        for name in names:
+            if os.path.splitext(name)[1].lower() not in _SKIP_EXTENSIONS:
+                files.append(pack_name(os.path.join(folder, name)))
+    return sorted(files)
+
+
+def write_pack(files: List[str], out_path: str = PACK_PATH) -> int:
+    """
+    Escreve um pacote com os arquivos dados.
+
+    Args:
+        files: Caminhos (relativos ao diretório do jogo) a empacotar
+        out_path: Arquivo de saída
+
+    Returns:
+        Tamanho do pacote em bytes
+    """
+    names = sorted(pack_name(f) for f in files)
+    encoded = [name.encode("utf-8") for name in names]
+    names_blob = b"".join(encoded)
+    index_end = _HEADER.size + len(names) * _ENTRY.size + len(names_blob)
+
+    entries = []
+    offset = -(-index_end // ALIGNMENT) * ALIGNMENT
+    name_offset = 0
+    for name, raw_name in zip(names, encoded):
+        size = os.path.getsize(name)
+        entries.append(_ENTRY.pack(name_offset, len(raw_name), offset, size))
+        name_offset += len(raw_name)
+        offset = -(-(offset + size) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, ALIGNMENT, len(names), len(names_blob)))
+        out.write(b"".join(entries))
+        out.write(names_blob)
+        for name in names:
+            out.write(b"\0" * (-out.tell() % ALIGNMENT))
+            with open(name, "rb") as f:
+                out.write(f.read())
+        total = out.tell()
+    os.replace(tmp_path, out_path)
+    return total
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Empacota os assets do jogo em um único arquivo")
+    parser.add_argument("root", nargs="?", default="assets", help="diretório de assets")
+    parser.add_argument("--out", default=PACK_PATH, help="arquivo de saída")
+    parser.add_argument("--list", action="store_true", help="lista o conteúdo do pacote e sai")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        pack = AssetPack(args.out)
+        for name in pack.names:
+            print(f"{len(pack.view(name)):>10}  {name}")
+        print(f"{len(pack)} arquivos em {args.out}")
+        return
+
+    files = collect_files(args.root)
+    total = write_pack(files, args.out)
+    print(f"{len(files)} arquivos empacotados em {args.out} ({total / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
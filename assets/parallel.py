@@ -0,0 +1,139 @@
+"""
+Carregamento paralelo de assets com um pool de threads.
+
+A leitura e a decodificação (PNG, WAV, MP3...) acontecem em C e liberam o
+GIL, então vários arquivos podem ser decodificados ao mesmo tempo. Só a
+conversão para o formato da tela (``convert_alpha``) fica na thread
+principal, feita quando o resultado é pedido.
+
+Cada pedido devolve um ``AssetHandle`` parecido com um Future: quem precisa
+de um asset chama ``result()`` e só espera por ele, enquanto os demais
+continuam decodificando em segundo plano.
+
+Uso:
+    loader = ParallelLoader(progress=lambda done, total, name: ...)
+    bg = loader.image("assets/images/fundos/cozinha.png", (800, 600))
+    hit = loader.sound("assets/audio/hit.wav", 0.7)
+    background = bg.result()   # espera só pelo background
+    loader.wait()              # termina o resto
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from assets.loader import (asset_cache, decode_image, finish_image, load_sound,
+                           image_cache_key, remember_asset)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Pool de threads compartilhado pelos carregamentos em segundo plano."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = min(4, os.cpu_count() or 1)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader")
+    return _executor
+
+
+class AssetHandle:
+    """Resultado futuro de um pedido ao ParallelLoader."""
+
+    def __init__(self, loader, name, future=None, finish=None, value=None):
+        self.name = name
+        self._loader = loader
+        self._future = future
+        self._finish = finish      # etapa final na thread principal (ou None)
+        self._value = value
+        self._resolved = future is None
+
+    def done(self) -> bool:
+        """True se o resultado já pode ser pego sem esperar a decodificação."""
+        return self._resolved or self._future.done()
+
+    def result(self):
+        """
+        Retorna o asset (Surface, Sound ou None se falhou), esperando se preciso.
+        Deve ser chamado na thread principal.
+        """
+        if not self._resolved:
+            value = self._future.result()
+            if self._finish is not None:
+                value = self._finish(value)
+            self._value = value
+            self._resolved = True
+            self._loader._completed(self)
+        return self._value
+
+
+class ParallelLoader:
+    """Distribui a decodificação de imagens e sons num pool de threads."""
+
+    def __init__(self, progress: Optional[Callable[[int, int, str], None]] = None):
+        """
+        Args:
+            progress: Chamado na thread principal a cada asset pronto,
+                      com (prontos, total, nome)
+        """
+        self.progress = progress
+        self.handles: List[AssetHandle] = []
+        self.completed = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.handles)
+
+    def _add(self, handle: AssetHandle) -> AssetHandle:
+        self.handles.append(handle)
+        if handle._resolved:
+            self._completed(handle)
+        return handle
+
+    def _completed(self, handle: AssetHandle):
+        self.completed += 1
+        if self.progress is not None:
+            self.progress(self.completed, self.total, handle.name)
+
+    def image(self, path, size=None, convert_alpha=True) -> AssetHandle:
+        """Pede uma imagem; mesmo cache e chaves de load_image."""
+        key = image_cache_key(path, size, convert_alpha)
+        cached = asset_cache.get(key)
+        if cached is not None:
+            return self._add(AssetHandle(self, path, value=cached))
+
+        def finish(image):
+            if image is None:
+                return None
+            image = finish_image(image, convert_alpha)
+            if image is not None:
+                remember_asset(key, image)
+            return image
+
+        future = get_executor().submit(decode_image, path, size)
+        return self._add(AssetHandle(self, path, future, finish))
+
+    def sound(self, path, volume=1.0) -> AssetHandle:
+        """Pede um som; o Sound é criado inteiro na thread de trabalho."""
+        future = get_executor().submit(load_sound, path, volume)
+        return self._add(AssetHandle(self, path, future))
+
+    def poll(self) -> int:
+        """Finaliza os assets já decodificados, sem bloquear. Retorna quantos faltam."""
+        pending = 0
+        for handle in self.handles:
+            if handle._resolved:
+                continue
+            if handle.done():
+                handle.result()
+            else:
+                pending += 1
+        return pending
+
+    def wait(self, handles: Optional[List[AssetHandle]] = None):
+        """Espera e finaliza os handles dados (todos, se None)."""
+        for handle in (self.handles if handles is None else handles):
+            handle.result()
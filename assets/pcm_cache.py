@@ -0,0 +1,102 @@
+"""
+Cache em disco de sons já decodificados (PCM no formato do mixer).
+
+MP3s e WAVs grandes ou em outra taxa/formato são decodificados e
+convertidos a cada ``load_sound``. Aqui o resultado da primeira
+decodificação (``Sound.get_raw()``) é gravado em ``PCM_CACHE_DIR``; nas
+próximas vezes o arquivo é mapeado em memória e entregue direto a
+``pygame.mixer.Sound(buffer=...)``.
+
+Cada arquivo guarda no cabeçalho a configuração do mixer e a assinatura da
+origem (tamanho e mtime). Se qualquer uma mudar, a entrada é ignorada e
+regravada na próxima carga.
+
+Formato (little-endian, cabeçalho de 32 bytes):
+    "DNPC" frequência:u32 formato:i16 canais:u16 tamanho_origem:u64 mtime_origem:i64
+    amostras PCM
+"""
+import os
+import mmap
+import struct
+import hashlib
+from typing import Optional, Tuple
+
+import pygame
+
+from core.config import PCM_CACHE_DIR, PCM_CACHE_MIN_BYTES
+from assets.pack import get_asset_pack, pack_name
+
+MAGIC = b"DNPC"
+_HEADER = struct.Struct("<4sIhHQq4x")
+
+
+def source_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(tamanho, mtime_ns) da origem, no pacote ou no disco; None se não existir."""
+    pack = get_asset_pack()
+    if pack is not None:
+        view = pack.view(path)
+        if view is not None:
+            return len(view), os.stat(pack.path).st_mtime_ns
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def should_cache(path: str, signature: Optional[Tuple[int, int]]) -> bool:
+    """Vale a pena cachear: formatos comprimidos ou WAVs grandes."""
+    if signature is None:
+        return False
+    return not path.lower().endswith(".wav") or signature[0] >= PCM_CACHE_MIN_BYTES
+
+
+def _cache_path(path: str, mixer) -> str:
+    key = f"{pack_name(path)}|{mixer[0]}|{mixer[1]}|{mixer[2]}"
+    return os.path.join(PCM_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".pcm")
+
+
+def load_pcm(path: str, signature: Optional[Tuple[int, int]] = None) -> Optional[pygame.mixer.Sound]:
+    """
+    Som já decodificado do cache, se válido para a origem e o mixer atuais.
+
+    Args:
+        path: Arquivo de som de origem
+        signature: Resultado de source_signature(path), se já calculado
+
+    Returns:
+        Sound ou None (sem entrada válida ou mixer desligado)
+    """
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return None
+    if signature is None:
+        signature = source_signature(path)
+    if signature is None:
+        return None
+    try:
+        with open(_cache_path(path, mixer), "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, frequency, sample_format, channels, size, mtime = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or (frequency, sample_format, channels) != mixer or (size, mtime) != signature:
+            return None
+        return pygame.mixer.Sound(buffer=memoryview(data)[_HEADER.size:])
+    except (OSError, ValueError, struct.error, pygame.error):
+        return None
+
+
+def store_pcm(path: str, sound: pygame.mixer.Sound, signature: Tuple[int, int]):
+    """Grava as amostras decodificadas de um som no cache (falhas são ignoradas)."""
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return
+    out_path = _cache_path(path, mixer)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, mixer[0], mixer[1], mixer[2], signature[0], signature[1]))
+            f.write(sound.get_raw())
+        os.replace(tmp_path, out_path)
+    except (OSError, pygame.error) as e:
+        print(f"Aviso: Não foi possível gravar o cache de áudio de {path}: {e}")
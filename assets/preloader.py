@@ -0,0 +1,112 @@
+"""
+Pré-carregamento em segundo plano dos assets do próximo nível.
+
+Uma thread de trabalho lê e decodifica as imagens e lê o arquivo de música
+do nível seguinte enquanto o jogador ainda joga o atual. A thread principal
+só faz a conversão para o formato da tela (``convert_alpha``), que é barata
+e não toca o disco.
+
+As imagens entregues vão para o ``asset_cache`` com a mesma chave de
+``load_image``, então quem carregar o mesmo arquivo depois não o decodifica
+de novo; imagens que já estavam no cache nem são lidas pela thread.
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from assets.loader import (asset_cache, decode_image, finish_image, asset_exists, open_asset,
+                           image_cache_key, remember_asset)
+
+
+class _PreloadJob:
+    """Pedido de um nível: a thread escreve só no próprio job."""
+
+    def __init__(self, level: int, images: Dict[str, Tuple[str, Tuple[int, int]]],
+                 music_path: Optional[str], cutscene_path: Optional[str]):
+        self.level = level
+        self.specs = dict(images)
+        self.music_path = music_path
+        self.cutscene_path = cutscene_path
+        self.images: Dict[str, object] = {}
+        self.music: Optional[bytes] = None
+        self.cutscene_exists = False
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"preload-level-{level}", daemon=True)
+
+    def run(self):
+        for name, (path, size) in self.specs.items():
+            if asset_cache.get(image_cache_key(path, size)) is None:
+                self.images[name] = decode_image(path, size)
+        if self.music_path and asset_exists(self.music_path):
+            try:
+                with open_asset(self.music_path) as f:
+                    self.music = f.read()
+            except OSError:
+                self.music = None
+        self.cutscene_exists = bool(self.cutscene_path) and os.path.exists(self.cutscene_path)
+        self.done.set()
+
+
+class LevelPreloader:
+    """Decodifica numa thread os assets de um nível e entrega prontos."""
+
+    def __init__(self):
+        self._job: Optional[_PreloadJob] = None
+
+    @property
+    def level(self) -> Optional[int]:
+        """Nível pedido e ainda não entregue (None se nenhum)."""
+        return self._job.level if self._job is not None else None
+
+    def request(self, level: int, images: Dict[str, Tuple[str, Tuple[int, int]]],
+                music_path: Optional[str] = None, cutscene_path: Optional[str] = None):
+        """
+        Inicia o pré-carregamento de um nível (ignora pedidos repetidos).
+
+        Um pedido de outro nível substitui o anterior: a thread antiga termina
+        no próprio job, que é descartado, e nunca mistura resultados com o novo.
+
+        Args:
+            level: Número do nível
+            images: {nome: (caminho, tamanho)} das imagens do nível
+            music_path: Arquivo de música do nível
+            cutscene_path: Vídeo de transição a verificar
+        """
+        if level == self.level:
+            return
+        self._job = _PreloadJob(level, images, music_path, cutscene_path)
+        self._job.thread.start()
+
+    def is_ready(self, level: int) -> bool:
+        """True se o nível foi pedido e a thread já terminou."""
+        job = self._job
+        return job is not None and job.level == level and job.done.is_set()
+
+    def take(self, level: int) -> Optional[Dict]:
+        """
+        Entrega os assets do nível, se já estiverem prontos. Nunca bloqueia.
+
+        Returns:
+            Dict com "images" (Surfaces convertidas; falhas ficam de fora), "music" (bytes ou
+            None), "music_path" e "cutscene_exists"; None se não estiver pronto
+        """
+        if not self.is_ready(level):
+            return None
+        job = self._job
+        self._job = None
+        images = {}
+        for name, (path, size) in job.specs.items():
+            key = image_cache_key(path, size)
+            image = asset_cache.get(key)
+            if image is None and job.images.get(name) is not None:
+                image = finish_image(job.images[name])
+                if image is not None:
+                    remember_asset(key, image)
+            if image is not None:
+                images[name] = image
+        return {
+            "images": images,
+            "music": job.music,
+            "music_path": job.music_path,
+            "cutscene_exists": job.cutscene_exists,
+        }
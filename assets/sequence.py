@@ -0,0 +1,143 @@
+"""
+Streaming de sequências de imagens (cutscenes feitas de PNG/JPG numerados).
+
+Em vez de carregar todos os frames antes de começar, uma thread de trabalho
+decodifica só uma janela à frente do frame exibido, limitada em quantidade
+(``CUTSCENE_LOOKAHEAD``) e em bytes (``CUTSCENE_MEMORY_BUDGET``). Frames já
+mostrados são liberados, então a memória não cresce com a duração da cena.
+
+A decodificação (``decode_image``) roda na thread; a conversão para o
+formato da tela é feita na thread principal, quando o frame é pedido.
+
+Uso:
+    stream = FrameStream(paths, (WIDTH, HEIGHT))
+    if stream.ready():
+        frame = stream.get(index)   # None se ainda não decodificou
+    stream.close()
+"""
+import threading
+from typing import Dict, List, Optional, Sequence, Set
+
+import pygame
+
+from assets.loader import decode_image, finish_image
+from core.config import CUTSCENE_LOOKAHEAD, CUTSCENE_MEMORY_BUDGET, CUTSCENE_START_FRAMES
+
+
+class FrameStream:
+    """Decodifica uma sequência de imagens em segundo plano, numa janela limitada."""
+
+    def __init__(self, paths: Sequence[str], size=None, lookahead: int = CUTSCENE_LOOKAHEAD,
+                 memory_budget: int = CUTSCENE_MEMORY_BUDGET,
+                 start_frames: int = CUTSCENE_START_FRAMES):
+        """
+        Args:
+            paths: Arquivos dos frames, em ordem
+            size: Tupla (width, height) de todos os frames. None mantém o original
+            lookahead: Máximo de frames decodificados à frente do atual
+            memory_budget: Máximo de bytes nessa janela (sempre cabe ao menos um frame)
+            start_frames: Frames prontos necessários para ready()
+        """
+        self.paths: List[str] = list(paths)
+        self.size = size
+        self.lookahead = max(1, lookahead)
+        self.memory_budget = memory_budget
+        self.start_frames = max(1, min(start_frames, len(self.paths)))
+        self.position = 0             # frame atual da apresentação
+        self.buffered_bytes = 0
+        self.failed = 0               # frames que não puderam ser decodificados
+        self._frames: Dict[int, Optional[pygame.Surface]] = {}
+        self._converted: Set[int] = set()   # frames já no formato da tela
+        self._next = 0                # próximo frame que a thread vai decodificar
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._work, name="cutscene-stream", daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def _has_room(self) -> bool:
+        count = len(self._frames)
+        if count == 0:
+            return True
+        return count < self.lookahead and self.buffered_bytes < self.memory_budget
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._next < len(self.paths) and not self._has_room():
+                    self._cond.wait()
+                if self._closed or self._next >= len(self.paths):
+                    return
+                # A apresentação pode ter passado à frente: não decodifica o que já saiu
+                index = self._next = max(self._next, self.position)
+            image = decode_image(self.paths[index], self.size)
+            with self._cond:
+                if self._closed:
+                    return
+                self._next = index + 1
+                if index < self.position:
+                    continue  # ficou para trás enquanto decodificava
+                if image is not None:
+                    self.buffered_bytes += _surface_bytes(image)
+                else:
+                    self.failed += 1
+                self._frames[index] = image
+                self._cond.notify_all()
+
+    def ready(self) -> bool:
+        """True quando os primeiros frames estão prontos (ou a sequência acabou)."""
+        with self._cond:
+            end = min(len(self.paths), self.position + self.start_frames)
+            return all(i in self._frames for i in range(self.position, end))
+
+    def get(self, index: int) -> Optional[pygame.Surface]:
+        """
+        Retorna o frame dado, já no formato da tela, sem bloquear.
+        Frames anteriores a ele são liberados.
+
+        Args:
+            index: Índice do frame (não deve voltar para trás)
+
+        Returns:
+            Surface do frame ou None se ainda não decodificado (ou se falhou)
+        """
+        with self._cond:
+            if index > self.position:
+                self._release_before(index)
+                self.position = index
+                self._cond.notify_all()
+            image = self._frames.get(index)
+            if image is None or index in self._converted:
+                return image
+        converted = finish_image(image, convert_alpha=False)
+        with self._cond:
+            if self._frames.get(index) is image:
+                self._frames[index] = converted
+                self._converted.add(index)
+                self.buffered_bytes -= _surface_bytes(image)
+                if converted is not None:
+                    self.buffered_bytes += _surface_bytes(converted)
+        return converted
+
+    def _release_before(self, index: int):
+        for old in [i for i in self._frames if i < index]:
+            image = self._frames.pop(old)
+            self._converted.discard(old)
+            if image is not None:
+                self.buffered_bytes -= _surface_bytes(image)
+
+    def close(self):
+        """Para a thread e libera os frames guardados."""
+        with self._cond:
+            self._closed = True
+            self._frames.clear()
+            self._converted.clear()
+            self.buffered_bytes = 0
+            self._cond.notify_all()
+
+
+def _surface_bytes(image: pygame.Surface) -> int:
+    width, height = image.get_size()
+    return width * height * image.get_bytesize()
@@ -0,0 +1,134 @@
+"""
+Narrowphase de colisões por pixel, com máscaras pré-calculadas.
+
+O teste por retângulo considera colisão mesmo quando só as partes
+transparentes dos sprites se tocam (os itens de 100x100 são quase todos
+transparentes). Aqui cada imagem distinta ganha, uma única vez, uma
+``CollisionShape``: a ``pygame.mask.Mask`` dos pixels visíveis e um círculo
+que os envolve. A ordem dos testes vai do mais barato ao mais caro:
+
+1. retângulo (feito antes, pela broadphase em ``core.spatial_hash``);
+2. círculos envolventes: rejeita sem olhar pixels;
+3. ``Mask.overlap`` só para o que passou pelos dois.
+
+As formas ficam num cache fraco indexado pela própria Surface: somem junto
+com a imagem. ``precompute_shapes`` calcula as formas no carregamento do
+nível; imagens que escaparem disso são calculadas no primeiro teste.
+``collision_stats`` conta quantos acertos de retângulo cada etapa rejeitou.
+"""
+import math
+import weakref
+from typing import Optional
+
+import pygame
+
+
+class CollisionShape:
+    """Máscara de pixels visíveis de uma imagem e o círculo que a envolve."""
+    __slots__ = ("mask", "center", "radius", "empty")
+
+    def __init__(self, surface: pygame.Surface):
+        self.mask = pygame.mask.from_surface(surface)
+        self.empty = self.mask.count() == 0
+        if self.empty:
+            self.center = (0.0, 0.0)
+            self.radius = 0.0
+            return
+        # Centro dos pixels visíveis; raio até o canto mais distante das partes
+        # visíveis (cobre imagens com várias partes separadas)
+        cx, cy = self.mask.centroid()
+        self.center = (cx + 0.5, cy + 0.5)
+        self.radius = max(math.hypot(x - self.center[0], y - self.center[1])
+                          for rect in self.mask.get_bounding_rects()
+                          for x, y in (rect.topleft, rect.topright, rect.bottomleft, rect.bottomright))
+
+
+class CollisionStats:
+    """Contadores da narrowphase."""
+
+    def __init__(self):
+        self.rect_hits = 0          # pares que colidiram por retângulo
+        self.circle_rejected = 0    # ...descartados pelos círculos
+        self.mask_rejected = 0      # ...descartados pela máscara
+        self.pixel_hits = 0         # colisões confirmadas
+        self.shapes_built = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.circle_rejected + self.mask_rejected
+
+    def as_dict(self) -> dict:
+        return {
+            "rect_hits": self.rect_hits,
+            "circle_rejected": self.circle_rejected,
+            "mask_rejected": self.mask_rejected,
+            "pixel_hits": self.pixel_hits,
+            "shapes_built": self.shapes_built,
+        }
+
+    def reset(self):
+        self.__init__()
+
+
+collision_stats = CollisionStats()
+_shapes: "weakref.WeakKeyDictionary[pygame.Surface, CollisionShape]" = weakref.WeakKeyDictionary()
+
+
+def shape_for(surface: pygame.Surface) -> CollisionShape:
+    """Forma de colisão da imagem, calculada na primeira vez."""
+    shape = _shapes.get(surface)
+    if shape is None:
+        shape = _shapes[surface] = CollisionShape(surface)
+        collision_stats.shapes_built += 1
+    return shape
+
+
+def precompute_shapes(*images):
+    """
+    Calcula de antemão as formas de colisão (chamar ao carregar o nível).
+
+    Args:
+        images: Surfaces, FrameSets (todos os frames) ou None (ignorado)
+    """
+    for image in images:
+        if image is None:
+            continue
+        for surface in getattr(image, "frames", (image,)):
+            shape_for(surface)
+
+
+def _image_of(sprite) -> Optional[pygame.Surface]:
+    # Sprites podem desenhar outra imagem que não self.image (ex.: Neide com escudo)
+    return getattr(sprite, "collision_image", None) or getattr(sprite, "image", None)
+
+
+def pixel_collide(a, b) -> bool:
+    """
+    Testa se os pixels visíveis de dois sprites se sobrepõem.
+    Os retângulos devem já ter colidido (o par conta como acerto de retângulo).
+
+    Args:
+        a, b: Sprites com rect e image (desenhada em rect.topleft)
+    """
+    collision_stats.rect_hits += 1
+    image_a, image_b = _image_of(a), _image_of(b)
+    if image_a is None or image_b is None:
+        collision_stats.pixel_hits += 1
+        return True
+    shape_a, shape_b = shape_for(image_a), shape_for(image_b)
+    if shape_a.empty or shape_b.empty:
+        collision_stats.mask_rejected += 1
+        return False
+    ax, ay = a.rect.topleft
+    bx, by = b.rect.topleft
+    dx = (bx + shape_b.center[0]) - (ax + shape_a.center[0])
+    dy = (by + shape_b.center[1]) - (ay + shape_a.center[1])
+    reach = shape_a.radius + shape_b.radius
+    if dx * dx + dy * dy > reach * reach:
+        collision_stats.circle_rejected += 1
+        return False
+    if shape_a.mask.overlap(shape_b.mask, (bx - ax, by - ay)) is None:
+        collision_stats.mask_rejected += 1
+        return False
+    collision_stats.pixel_hits += 1
+    return True
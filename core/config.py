@@ -1,3 +1,56 @@
+import os
+
 WIDTH = 800
 HEIGHT = 600
 FPS = 60
+# Simulação em passo fixo (cenas com fixed_update/render(alpha))
+TICK_RATE = 60
+MAX_TICKS_PER_FRAME = 5
+# Tracing de frames (core/tracing.py)
+TRACE_BUFFER_SIZE = 65536
+# Dirty rects: acima desta fração da tela alterada o frame é completo
+DIRTY_RECT_FULL_RATIO = 0.5
+# Pré-carrega o próximo nível a partir desta fração dos pontos necessários
+PRELOAD_PROGRESS = 0.8
+# Replays: frames entre keyframes de estado (600 = 10 s a 60 FPS)
+REPLAY_KEYFRAME_INTERVAL = 600
+# Orçamento de memória do cache de assets (assets/loader.py), em bytes
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024
+# Atlas de sprites (assets/atlas.py): lado máximo de cada página, em pixels
+ATLAS_PAGE_SIZE = 1024
+# Imagens pré-redimensionadas geradas por `python -m assets.bake`
+BAKE_DIR = os.path.join("assets", "baked")
+# Pacote de assets em arquivo único gerado por `python -m assets.pack`
+PACK_PATH = os.path.join("assets", "assets.pak")
+# Sons decodificados em PCM (assets/pcm_cache.py): MP3s e WAVs a partir deste tamanho
+PCM_CACHE_DIR = os.path.join(BAKE_DIR, "pcm")
+PCM_CACHE_MIN_BYTES = 256 * 1024
+# Canais do mixer: os primeiros ficam para a música; o resto em pools por categoria
+MUSIC_CHANNELS = 2
+VOICE_POOLS = {"ui": 3, "combat": 5, "special": 2}
+# Música: duração (s) e curva ("equal_power" ou "linear") do crossfade entre faixas
+MUSIC_CROSSFADE_TIME = 1.5
+MUSIC_CROSSFADE_CURVE = "equal_power"
+# Cutscenes em vídeo: frames decodificados mantidos à frente da apresentação
+VIDEO_QUEUE_SIZE = 8
+# Cutscenes em sequência de imagens (assets/sequence.py): janela de frames
+# decodificados à frente, limite de memória dela e frames prontos para começar
+CUTSCENE_LOOKAHEAD = 24
+CUTSCENE_MEMORY_BUDGET = 48 * 1024 * 1024
+CUTSCENE_START_FRAMES = 3
+# Cutscenes: atraso/adiantamento máximo (s) dos frames em relação ao áudio
+CUTSCENE_SYNC_TOLERANCE = 0.04
+# Partículas (core/particles.py): máximo de partículas vivas ao mesmo tempo
+PARTICLE_CAPACITY = 32768
+# Sprites de partículas pré-renderizados (tamanho, cor e alpha quantizados), em LRU
+PARTICLE_SPRITE_CACHE_SIZE = 4096
+# Pools de sprites (entities/pool.py): máximo de sprites mortos guardados para reuso
+SPRITE_POOL_MAX_FREE = 64
+# Governador de qualidade (core/quality.py): janela de frames medida e limites,
+# em fração do tempo de frame de FPS, para baixar e para subir de nível
+QUALITY_WINDOW = 60
+QUALITY_DOWNGRADE_RATIO = 0.9
+QUALITY_UPGRADE_RATIO = 0.5
+QUALITY_UPGRADE_DELAY = 5.0
+# Spatial hash de colisões (core/spatial_hash.py): lado de cada célula, em pixels
+SPATIAL_HASH_CELL_SIZE = 64
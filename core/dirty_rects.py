@@ -0,0 +1,79 @@
+"""
+Renderização por retângulos sujos (dirty rects).
+
+Em vez de redesenhar o background inteiro e chamar ``display.flip()`` todo
+frame, a cena apaga apenas as regiões desenhadas no frame anterior e informa
+as regiões desenhadas no atual. O ``run_game`` envia só essas regiões para
+``pygame.display.update(rects)``. Quando a área alterada passa de um limite
+(ou a cena pede, ex.: transições e tremor de câmera) o frame volta a ser
+completo e o flip normal é usado.
+"""
+import pygame
+
+from core.config import DIRTY_RECT_FULL_RATIO
+
+
+class DirtyRectRenderer:
+    """Rastreia as regiões alteradas de uma cena entre frames."""
+
+    def __init__(self, screen_size, full_redraw_ratio=DIRTY_RECT_FULL_RATIO):
+        """
+        Args:
+            screen_size: Tupla (width, height) da tela
+            full_redraw_ratio: Fração da tela alterada a partir da qual o frame é completo
+        """
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full_redraw_area = full_redraw_ratio * self.screen_rect.width * self.screen_rect.height
+        self.previous: list = []   # regiões desenhadas no frame anterior
+        self.current: list = []    # regiões desenhadas neste frame
+        self.force_full = True     # primeiro frame sempre completo
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def request_full_redraw(self):
+        """Força o próximo frame a ser redesenhado e enviado por inteiro."""
+        self.force_full = True
+
+    def begin(self, screen, background):
+        """
+        Prepara o frame: apaga as regiões do frame anterior com o background.
+
+        Returns:
+            True se o frame será completo (background inteiro já desenhado)
+        """
+        self.current = []
+        if self.force_full:
+            screen.blit(background, (0, 0))
+            return True
+        for rect in self.previous:
+            screen.blit(background, rect, rect)
+        return False
+
+    def add(self, rects):
+        """Registra regiões desenhadas (um Rect ou lista de Rects)."""
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self.current.append(rects)
+        else:
+            self.current.extend(rects)
+
+    def finish(self):
+        """
+        Encerra o frame.
+
+        Returns:
+            Lista de Rects para display.update, ou None para um flip completo
+        """
+        screen_rect = self.screen_rect
+        current = [r.clip(screen_rect) for r in self.current]
+        current = [r for r in current if r.width and r.height]
+        dirty = self.previous + current
+        self.previous = current
+
+        if self.force_full or sum(r.width * r.height for r in dirty) > self.full_redraw_area:
+            self.force_full = False
+            self.full_frames += 1
+            return None
+        self.partial_frames += 1
+        return dirty
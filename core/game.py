@@ -1,36 +1,94 @@
+import time
 import pygame
-from core.config import WIDTH, HEIGHT, FPS
+from core.config import WIDTH, HEIGHT, FPS, TICK_RATE
+from core.timestep import FixedTimestep, advance_scene
+from core.tracing import tracer
+from core.music import music_controller
+from core.startup import startup
+from core.quality import quality
 from ui.hud import init_hud_icons
-# importe a função
-from core.video_player import play_cutscene_fullscreen
 
-def run_game(width, height, fps, starting_scene_factory):
-    pygame.init()
-    try:
-        pygame.mixer.init()
-    except Exception:
-        pass
-    screen = pygame.display.set_mode((width, height))
-    pygame.display.set_caption("Dona Neide: Manhã do Caos")
-    init_hud_icons()
+def run_game(width, height, fps, starting_scene_factory, tick_rate=TICK_RATE,
+             recorder=None, replay=None):
+    """
+    Loop principal do jogo.
+
+    Args:
+        recorder: ReplayRecorder opcional que grava as entradas de cada frame
+        replay: ReplayPlayer opcional; as entradas gravadas substituem o teclado
+    """
+    with startup.phase("pygame.init"):
+        pygame.init()
+    with startup.phase("pygame.mixer.init"):
+        try:
+            pygame.mixer.init()
+        except Exception:
+            pass
+    with startup.phase("display.set_mode"):
+        screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption("Dona Neide: Manhã do Caos")
+    with startup.phase("init_hud_icons"):
+        init_hud_icons()
 
     clock = pygame.time.Clock()
-    active_scene = starting_scene_factory()
+    # Cenas com fixed_update rodam em passo fixo; as demais recebem o dt bruto
+    timestep = FixedTimestep(tick_rate)
+    replay_frames = None
+    if replay is not None:
+        active_scene, timestep, replay_frames = replay.seek(starting_scene_factory)
+    else:
+        if recorder is not None:
+            recorder.start()
+        with startup.phase("cena inicial"):
+            active_scene = starting_scene_factory()
 
     while active_scene is not None:
         dt = clock.tick(fps) / 1000.0
-        events = pygame.event.get()
-        keys = pygame.key.get_pressed()
-        for event in events:
-            if event.type == pygame.QUIT:
-                active_scene = None
+        frame_start = time.perf_counter()
+        with tracer.span("frame"):
+            with tracer.span("events"):
+                events = pygame.event.get()
+                keys = pygame.key.get_pressed()
+            if any(event.type == pygame.QUIT for event in events):
+                break
+            if replay_frames is not None:
+                # Replay: dt e entradas vêm do arquivo, não do relógio/teclado
+                recorded = next(replay_frames, None)
+                if recorded is None:
+                    break
+                dt, keys, events = recorded
+            elif recorder is not None:
+                recorder.record(active_scene, timestep, dt, keys, events)
+            for event in events:
+                # F9 liga/desliga o tracing; ao desligar, exporta o que foi gravado
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    if not tracer.toggle():
+                        print(f"Trace exportado: {tracer.export_chrome()}")
+                        tracer.clear()
 
-        active_scene.process_input(events, keys)
-        active_scene.update(dt)
-        # Antes de renderizar ou após, verifica se active_scene.request_cutscene
-        # Mas normalmente, a cena mesma chama a cutscene.
-        active_scene.render(screen)
-        pygame.display.flip()
+            with tracer.span("process_input"):
+                active_scene.process_input(events, keys)
+            with tracer.span("update"):
+                alpha = advance_scene(active_scene, dt, timestep)
+            # Crossfade de música avança mesmo entre cenas (ex.: fade-out no game over)
+            music_controller.update(dt)
+            # Antes de renderizar ou após, verifica se active_scene.request_cutscene
+            # Mas normalmente, a cena mesma chama a cutscene.
+            # render pode devolver as regiões alteradas (dirty rects);
+            # None significa que a tela inteira deve ser enviada
+            with tracer.span("render"):
+                if alpha is None:
+                    dirty = active_scene.render(screen)
+                else:
+                    dirty = active_scene.render(screen, alpha)
+            with tracer.span("flip"):
+                if dirty is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty)
+            startup.first_frame()
+        # Tempo de trabalho do frame (sem a espera do tick) decide o nível de qualidade
+        quality.record_frame(time.perf_counter() - frame_start, dt)
 
         # Avança cena
         next_scene = active_scene.next_scene
@@ -39,5 +97,10 @@ def run_game(width, height, fps, starting_scene_factory):
             # Por exemplo, se next_scene for uma instância de CutsceneScene, deixe fluir
             # Se a cena atual indicar que precisa tocar vídeo, faça aqui:
             active_scene = next_scene
+            timestep.reset()
         # Caso queira que GameScene inicie cutscene, ela mesma chamará play_cutscene_fullscreen
+    if recorder is not None:
+        recorder.close()
+    if tracer.enabled and tracer.count:
+        print(f"Trace exportado: {tracer.export_chrome()}")
     pygame.quit()
@@ -0,0 +1,202 @@
+"""
+Execução headless de cenas, sem janela, sem vsync e sem áudio.
+
+Usado em CI para rodar muitas sessões de ``novogame_scene.GameScene`` o mais
+rápido que a CPU permitir. A cena é avançada com dt sintético e entrada
+roteirizada; ``render()`` nunca é chamado e o mixer fica desligado, de modo
+que nenhum som é tocado.
+
+Uso:
+    python -m core.headless --seconds 300 --sessions 10 --seed 42 --random-input
+"""
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import contextlib
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import pygame
+
+from core.config import WIDTH, HEIGHT, TICK_RATE
+
+
+def init_headless():
+    """Inicializa o pygame com os drivers dummy de vídeo e áudio."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    # Sem mixer: load_sound devolve None e as cenas não tocam nada
+    pygame.mixer.quit()
+    # convert_alpha() exige um modo de vídeo definido
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+class ScriptedKeys:
+    """Substituto de pygame.key.get_pressed() controlado pelo roteiro."""
+
+    def __init__(self):
+        self.pressed = set()
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class InputScript:
+    """
+    Roteiro de entrada: lista de (tempo, tecla, pressionada).
+
+    Exemplo: [(0.5, pygame.K_LEFT, True), (1.2, pygame.K_LEFT, False)]
+    """
+
+    def __init__(self, actions: List[Tuple[float, int, bool]]):
+        self.actions = sorted(actions, key=lambda action: action[0])
+        self.index = 0
+
+    @classmethod
+    def from_json(cls, path: str) -> "InputScript":
+        """Carrega roteiro JSON no formato [[tempo, "nome_da_tecla", true], ...]."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([(t, pygame.key.key_code(name), bool(down)) for t, name, down in data])
+
+    def poll(self, sim_time: float, keys: ScriptedKeys) -> List[pygame.event.Event]:
+        """Aplica as ações até sim_time e retorna os eventos gerados."""
+        events = []
+        while self.index < len(self.actions) and self.actions[self.index][0] <= sim_time:
+            _, key, down = self.actions[self.index]
+            self.index += 1
+            if down:
+                keys.pressed.add(key)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+            else:
+                keys.pressed.discard(key)
+                events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode=""))
+        return events
+
+
+class RandomInput:
+    """Entrada pseudoaleatória reprodutível: anda para os lados e usa o escudo."""
+
+    def __init__(self, seed: Optional[int] = None, change_interval: float = 0.5):
+        self.rng = random.Random(seed)  # RNG próprio, não interfere no jogo
+        self.change_interval = change_interval
+        self.next_change = 0.0
+
+    def poll(self, sim_time: float, keys: ScriptedKeys) -> List[pygame.event.Event]:
+        if sim_time < self.next_change:
+            return []
+        self.next_change = sim_time + self.change_interval
+        events = []
+        keys.pressed.discard(pygame.K_LEFT)
+        keys.pressed.discard(pygame.K_RIGHT)
+        move = self.rng.choice((None, pygame.K_LEFT, pygame.K_RIGHT))
+        if move is not None:
+            keys.pressed.add(move)
+        if self.rng.random() < 0.2:
+            keys.pressed.add(pygame.K_SPACE)
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" "))
+        else:
+            keys.pressed.discard(pygame.K_SPACE)
+        return events
+
+
+@dataclass
+class HeadlessReport:
+    """Resultado de uma sessão headless."""
+    frames: int
+    simulated_seconds: float
+    wall_seconds: float          # só a simulação, sem construir a cena
+    setup_seconds: float = 0.0   # construção da cena inicial (carregamento de assets)
+
+    @property
+    def speedup(self) -> float:
+        """Segundos simulados por segundo de relógio."""
+        return self.simulated_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+def run_headless(scene_factory, duration: float = 60.0, dt: float = 1.0 / TICK_RATE,
+                 script=None, seed: Optional[int] = None, quiet: bool = True) -> HeadlessReport:
+    """
+    Avança uma cena sem renderizar, tão rápido quanto possível.
+
+    Args:
+        scene_factory: Função que cria a cena inicial
+        duration: Segundos de jogo a simular
+        dt: Passo sintético por frame
+        script: InputScript/RandomInput (None = nenhuma tecla)
+        seed: Semente do RNG global usado por itens e partículas
+        quiet: Suprime os avisos impressos pelo carregamento de assets
+
+    Returns:
+        HeadlessReport com frames, tempo simulado, tempo de relógio da simulação
+        e tempo de construção da cena
+    """
+    if seed is not None:
+        random.seed(seed)
+    keys = ScriptedKeys()
+    # Contagem inteira de frames: somar dt em float acumula erro (7201 frames em 120 s)
+    total_frames = round(duration / dt)
+    frames = 0
+
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull if quiet else sys.stdout):
+        setup_start = time.perf_counter()
+        scene = scene_factory()
+        start = time.perf_counter()
+        while scene is not None and frames < total_frames:
+            sim_time = frames * dt
+            events = script.poll(sim_time, keys) if script is not None else []
+            scene.process_input(events, keys)
+            if hasattr(scene, "fixed_update"):
+                scene.fixed_update(dt)
+            else:
+                scene.update(dt)
+            frames += 1
+            scene = scene.next_scene
+        wall = time.perf_counter() - start
+
+    return HeadlessReport(frames, frames * dt, wall, start - setup_start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roda sessões headless do GameScene.")
+    parser.add_argument("--seconds", type=float, default=60.0, help="tempo simulado por sessão")
+    parser.add_argument("--dt", type=float, default=1.0 / TICK_RATE, help="passo sintético")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--script", help="roteiro de entrada JSON")
+    parser.add_argument("--random-input", action="store_true", help="entrada pseudoaleatória")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    from scenes.novogame_scene import GameScene
+
+    total_sim = total_wall = 0.0
+    for session in range(args.sessions):
+        seed = None if args.seed is None else args.seed + session
+        if args.script:
+            script = InputScript.from_json(args.script)
+        elif args.random_input:
+            script = RandomInput(seed)
+        else:
+            script = None
+        report = run_headless(lambda: GameScene(level=args.level), args.seconds,
+                              args.dt, script, seed)
+        total_sim += report.simulated_seconds
+        total_wall += report.wall_seconds
+        print(f"sessão {session}: {report.frames} frames, "
+              f"{report.simulated_seconds:.1f}s simulados em {report.wall_seconds:.3f}s "
+              f"({report.speedup:.1f}x, cena criada em {report.setup_seconds:.3f}s)")
+
+    if args.sessions > 1 and total_wall > 0:
+        print(f"total: {total_sim / total_wall:.1f} segundos simulados por segundo")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
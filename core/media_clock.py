@@ -0,0 +1,94 @@
+"""
+Relógio de apresentação para cutscenes, guiado pelo áudio.
+
+O mixer do pygame toca o som em tempo real, mas não informa a posição de
+reprodução. ``MediaClock`` marca o instante em que o som começou a tocar e
+mede o tempo decorrido desde então com ``time.perf_counter``: é a posição
+do áudio, independente de quantos frames o jogo conseguiu desenhar. Sem
+áudio, o relógio é só o tempo real desde ``start()``.
+
+Quem apresenta os frames pergunta ``time()`` e escolhe o frame daquele
+instante, pulando os atrasados e segurando o atual se o próximo não estiver
+pronto. ``SyncStats`` acumula o drift medido e os frames descartados.
+"""
+import time
+from typing import Optional
+
+import pygame
+
+
+class MediaClock:
+    """Posição (em segundos) da mídia em reprodução."""
+
+    def __init__(self, sound: Optional[pygame.mixer.Sound] = None):
+        """
+        Args:
+            sound: Áudio que dita o tempo. None usa só o tempo real
+        """
+        self.sound = sound
+        self.channel = None
+        self._start: Optional[float] = None
+
+    @property
+    def started(self) -> bool:
+        return self._start is not None
+
+    def start(self, offset: float = 0.0):
+        """
+        Começa a tocar o áudio (se houver) e zera o relógio.
+
+        Args:
+            offset: Posição inicial, em segundos (ex.: tempo do primeiro frame)
+        """
+        if self.sound is not None:
+            self.channel = self.sound.play()
+        self._start = time.perf_counter() - offset
+
+    def time(self) -> float:
+        """Posição atual em segundos (0.0 antes de start())."""
+        if self._start is None:
+            return 0.0
+        return time.perf_counter() - self._start
+
+    def stop(self):
+        """Para o áudio."""
+        if self.channel is not None:
+            self.channel.stop()
+            self.channel = None
+
+
+class SyncStats:
+    """Estatísticas de sincronia entre frames exibidos e o relógio."""
+
+    def __init__(self):
+        self.shown = 0
+        self.dropped = 0       # frames pulados para alcançar o áudio
+        self.held = 0          # vezes em que o frame anterior foi mantido
+        self.max_drift = 0.0
+        self._drift_total = 0.0
+
+    def frame_shown(self, frame_time: float, clock_time: float):
+        """Registra um frame exibido (tempo do frame e do relógio, em segundos)."""
+        drift = abs(clock_time - frame_time)
+        self.shown += 1
+        self._drift_total += drift
+        if drift > self.max_drift:
+            self.max_drift = drift
+
+    @property
+    def mean_drift(self) -> float:
+        return self._drift_total / self.shown if self.shown else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "shown": self.shown,
+            "dropped": self.dropped,
+            "held": self.held,
+            "mean_drift": self.mean_drift,
+            "max_drift": self.max_drift,
+        }
+
+    def summary(self) -> str:
+        return (f"{self.shown} frames exibidos, {self.dropped} descartados, "
+                f"{self.held} repetidos, drift médio {self.mean_drift * 1000:.1f} ms "
+                f"(máx {self.max_drift * 1000:.1f} ms)")
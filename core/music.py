@@ -0,0 +1,193 @@
+"""
+Controle de música sem travar o loop: pré-carga em segundo plano e crossfade.
+
+``pygame.mixer.music`` só tem um stream: trocar de faixa exige
+``fadeout`` + ``load`` + ``play`` no mesmo frame, o que lê o arquivo na
+thread principal e corta o fade. Aqui cada faixa é decodificada numa thread
+de trabalho (via ``load_sound``, que aproveita o cache de PCM) e tocada como
+``Sound`` em um dos dois canais reservados para música (``MUSIC_CHANNELS``).
+A troca faz crossfade entre os dois canais ao longo de ``update(dt)``.
+
+``play()`` nunca bloqueia: se a faixa ainda não estiver pronta, a atual
+continua tocando até a nova terminar de carregar. Chamar ``prefetch()``
+antes (ex.: junto do pré-carregamento do próximo nível) faz a troca
+acontecer no frame exato.
+
+Cada faixa decodificada ocupa dezenas de MB de PCM, então o controlador
+guarda no máximo a atual, a que está saindo no crossfade, a pedida por
+``play()`` e uma pré-carga: um ``prefetch()`` novo descarta a pré-carga
+anterior que ainda não tocou.
+
+Uso:
+    from core.music import music_controller
+    music_controller.prefetch("assets/audio/boss_music.wav")
+    music_controller.play("assets/audio/boss_music.wav")
+    music_controller.update(dt)  # uma vez por tick
+"""
+import math
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+import pygame
+
+from core.config import MUSIC_CROSSFADE_TIME, MUSIC_CROSSFADE_CURVE
+from assets.loader import load_sound
+from assets.parallel import get_executor
+
+
+def _equal_power(t: float) -> float:
+    return math.sin(t * math.pi / 2)
+
+
+def _linear(t: float) -> float:
+    return t
+
+
+CURVES = {"equal_power": _equal_power, "linear": _linear}
+
+
+class MusicController:
+    """Toca música em dois canais do mixer com crossfade entre faixas."""
+
+    def __init__(self, channels=(0, 1), fade_time: float = MUSIC_CROSSFADE_TIME,
+                 curve: str = MUSIC_CROSSFADE_CURVE):
+        """
+        Args:
+            channels: Índices dos dois canais reservados para música
+            fade_time: Duração padrão do crossfade, em segundos
+            curve: Nome da curva de ganho em CURVES
+        """
+        self.channel_ids = channels
+        self.fade_time = fade_time
+        self.curve = CURVES[curve]
+        self.volume = 1.0
+        self.tracks: Dict[str, Future] = {}
+        self.current: Optional[str] = None   # faixa tocando (ou entrando)
+        self.wanted: Optional[str] = None    # faixa pedida por play()
+        self._channels = None
+        self._active = 0                     # canal da faixa atual
+        self._fading = False
+        self._fade_elapsed = 0.0
+        self._fade_duration = fade_time
+        self._previous: Optional[str] = None
+        self._requested_fade: Optional[float] = None
+
+    def _get_channels(self):
+        if self._channels is None and pygame.mixer.get_init():
+            try:
+                self._channels = [pygame.mixer.Channel(i) for i in self.channel_ids]
+            except pygame.error:
+                return None
+        return self._channels
+
+    def prefetch(self, path: str):
+        """
+        Começa a decodificar uma faixa em segundo plano (pedidos repetidos são ignorados).
+        Descarta a pré-carga anterior que não chegou a tocar.
+        """
+        if path in self.tracks:
+            return
+        for other in list(self.tracks):
+            if other not in (self.current, self._previous, self.wanted):
+                self.tracks.pop(other).cancel()
+        self.tracks[path] = get_executor().submit(load_sound, path, 1.0, False)
+
+    def is_ready(self, path: str) -> bool:
+        """True se a faixa já foi decodificada."""
+        future = self.tracks.get(path)
+        return future is not None and future.done()
+
+    def play(self, path: str, fade_time: Optional[float] = None):
+        """
+        Troca para a faixa dada (em loop), com crossfade. Não bloqueia.
+
+        Args:
+            path: Arquivo da música
+            fade_time: Duração do crossfade; None usa o padrão
+        """
+        if path == self.wanted:
+            return
+        self.wanted = path
+        self._requested_fade = fade_time
+        self.prefetch(path)
+
+    def stop(self, fade_time: Optional[float] = None):
+        """Silencia a música com fade-out."""
+        self.wanted = None
+        self._requested_fade = fade_time
+        if self.current is not None:
+            self._start_fade(None)
+
+    def pause(self):
+        channels = self._get_channels()
+        if channels:
+            for channel in channels:
+                channel.pause()
+
+    def unpause(self):
+        channels = self._get_channels()
+        if channels:
+            for channel in channels:
+                channel.unpause()
+
+    def set_volume(self, volume: float):
+        """Volume geral da música (0.0 a 1.0)."""
+        self.volume = volume
+        if not self._fading:
+            self._apply_volumes(1.0)
+
+    def update(self, dt: float):
+        """Inicia trocas cujas faixas ficaram prontas e avança o crossfade."""
+        if self.wanted is not None and self.wanted != self.current and self.is_ready(self.wanted):
+            self._start_fade(self.wanted)
+        if self._fading:
+            self._fade_elapsed += dt
+            t = 1.0 if self._fade_duration <= 0 else min(1.0, self._fade_elapsed / self._fade_duration)
+            self._apply_volumes(t)
+            if t >= 1.0:
+                self._finish_fade()
+
+    def _start_fade(self, path: Optional[str]):
+        channels = self._get_channels()
+        fade = self.fade_time if self._requested_fade is None else self._requested_fade
+        self._requested_fade = None
+        if self._fading:
+            self._finish_fade()  # troca no meio de outra: encerra a anterior na hora
+        self._previous = self.current
+        self.current = path
+        self._fade_elapsed = 0.0
+        self._fade_duration = fade
+        self._fading = True
+        if channels is None:
+            self._finish_fade()
+            return
+        self._active = 1 - self._active
+        incoming = channels[self._active]
+        incoming.stop()
+        sound = self.tracks[path].result() if path is not None else None
+        if sound is not None:
+            incoming.set_volume(0.0)
+            incoming.play(sound, loops=-1)
+        self._apply_volumes(0.0)
+
+    def _apply_volumes(self, t: float):
+        channels = self._get_channels()
+        if not channels:
+            return
+        channels[self._active].set_volume(self.volume * self.curve(t))
+        channels[1 - self._active].set_volume(self.volume * self.curve(1.0 - t))
+
+    def _finish_fade(self):
+        self._fading = False
+        channels = self._get_channels()
+        if channels:
+            channels[1 - self._active].stop()
+            self._apply_volumes(1.0)
+        # Libera a faixa que saiu, a menos que tenha sido pedida de novo
+        if self._previous is not None and self._previous not in (self.current, self.wanted):
+            self.tracks.pop(self._previous, None)
+        self._previous = None
+
+
+# Controlador global: a música continua entre cenas (ex.: ao reiniciar o jogo)
+music_controller = MusicController()
@@ -0,0 +1,346 @@
+"""
+Sistema de partículas em estrutura de arrays (NumPy).
+
+Em vez de um objeto Python por partícula, cada atributo fica num array
+pré-alocado com ``PARTICLE_CAPACITY`` posições: posição, velocidade, cor,
+vida, vida máxima e tamanho. As partículas vivas ocupam o prefixo
+``[:count]``; a integração é feita de uma vez sobre esse prefixo e as mortas
+são removidas por troca com as do fim (swap-remove), sem realocar nada.
+Os emissores sorteiam e gravam o lote inteiro de uma vez.
+
+No desenho, tamanho, cor e alpha são quantizados e cada combinação vira um
+sprite pré-renderizado (``ParticleSpriteCache``, um LRU limitado). Todas as
+partículas são desenhadas com uma única chamada a ``Surface.blits()``.
+Cada partícula tem um modo de mistura: "alpha" (translúcido) ou "add"
+(aditivo, usado nas explosões).
+
+O sorteio de cada lote usa um gerador NumPy semeado a partir do ``random``
+global, então replays gravados com semente continuam determinísticos. O
+governador de qualidade não muda quantas partículas são simuladas: cada uma
+recebe uma ordem de detalhe em [0, 1) e só as com ordem abaixo do orçamento
+``particles`` são desenhadas. Assim o estado salvo nos keyframes é o mesmo
+em qualquer nível.
+
+Sem NumPy instalado o sistema fica desligado (nenhuma partícula é criada).
+"""
+import math
+import random
+from collections import OrderedDict
+from itertools import repeat
+from typing import List, Tuple
+
+import pygame
+
+from core.config import PARTICLE_CAPACITY, PARTICLE_SPRITE_CACHE_SIZE
+from core.quality import quality
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+GRAVITY = 200.0
+_warned_no_numpy = False
+
+# Modos de mistura: índice guardado por partícula -> flag do blit
+BLEND_MODES = {"alpha": 0, "add": 1}
+_BLEND_FLAGS = (0, pygame.BLEND_RGB_ADD)
+
+# Quantização das chaves de sprite: 16 níveis por canal e 8 de alpha
+_COLOR_SHIFT = 4
+_ALPHA_SHIFT = 5
+# Regiões sujas devolvidas por render(): blocos de 64 px
+_TILE_SHIFT = 6
+# Razão áurea: ordens de detalhe bem espalhadas mesmo em lotes pequenos
+_GOLDEN = 0.6180339887498949
+
+
+def _batch_rng():
+    """Gerador NumPy para um lote, derivado do RNG global (determinístico em replays)."""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _detail_ranks(n: int):
+    """Ordens de detalhe de um lote: qualquer fração do lote cobre o efeito por igual."""
+    return (np.arange(n) * _GOLDEN) % 1.0
+
+
+class ParticleSpriteCache:
+    """Quadrados de partícula prontos, por (tamanho, cor, alpha, mistura) quantizados."""
+
+    def __init__(self, max_entries: int = PARTICLE_SPRITE_CACHE_SIZE):
+        """
+        Args:
+            max_entries: Máximo de sprites guardados; os menos usados saem primeiro
+        """
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[int, Tuple[pygame.Surface, int]]" = OrderedDict()
+        self.built = 0
+
+    def get(self, key: int) -> Tuple[pygame.Surface, int]:
+        """
+        Retorna (sprite, flag de blit) da chave, criando se preciso.
+
+        Args:
+            key: Chave empacotada por ParticleSystem._sprite_keys
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        entry = self._build(key)
+        self.entries[key] = entry
+        self.built += 1
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _build(key: int) -> Tuple[pygame.Surface, int]:
+        blend = key & 1
+        alpha_level = (key >> 1) & 0xF
+        b = (key >> 5) & 0x1F
+        g = (key >> 10) & 0x1F
+        r = (key >> 15) & 0x1F
+        size = key >> 20
+        # Centro de cada faixa quantizada
+        half = 1 << (_COLOR_SHIFT - 1)
+        color = ((r << _COLOR_SHIFT) + half, (g << _COLOR_SHIFT) + half, (b << _COLOR_SHIFT) + half)
+        alpha = min(255, (alpha_level << _ALPHA_SHIFT) + (1 << (_ALPHA_SHIFT - 1)))
+        sprite = pygame.Surface((size * 2, size * 2))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        if blend:
+            # Aditivo ignora o alpha da surface: a cor já sai multiplicada por ele
+            sprite.fill(tuple(c * alpha // 255 for c in color))
+        else:
+            sprite.fill(color)
+            sprite.set_alpha(alpha)
+        return sprite, _BLEND_FLAGS[blend]
+
+    def clear(self):
+        self.entries.clear()
+
+
+class ParticleSystem:
+    """Sistema avançado de partículas para efeitos visuais impressionantes."""
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, sprite_cache: "ParticleSpriteCache" = None):
+        """
+        Args:
+            capacity: Máximo de partículas vivas; as excedentes de um lote são descartadas
+            sprite_cache: Cache de sprites a usar. None usa o compartilhado
+        """
+        global _warned_no_numpy
+        self.count = 0
+        self.dropped = 0   # partículas descartadas por falta de espaço
+        self.gravity = GRAVITY
+        self.sprites = particle_sprites if sprite_cache is None else sprite_cache
+        if not NUMPY_AVAILABLE:
+            if not _warned_no_numpy:
+                print("Aviso: NumPy não instalado; efeitos de partículas desativados")
+                _warned_no_numpy = True
+            self.capacity = 0
+            return
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.life = np.zeros(capacity, np.float32)
+        self.max_life = np.zeros(capacity, np.float32)
+        self.size = np.zeros(capacity, np.float32)
+        self.blend = np.zeros(capacity, np.uint8)
+        self.rank = np.zeros(capacity, np.float32)
+        self._arrays = (self.pos, self.vel, self.color, self.life, self.max_life, self.size,
+                        self.blend, self.rank)
+
+    @property
+    def max_particles(self) -> int:
+        return self.capacity
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, vx, vy, color, life, size, max_life=None, blend="alpha", rank=None):
+        """
+        Grava um lote de partículas. Cada argumento pode ser um escalar (igual
+        para todo o lote) ou um array com um valor por partícula.
+
+        Args:
+            x, y: Posição inicial
+            vx, vy: Velocidade inicial (pixels/s)
+            color: Cor (r, g, b) ou array (n, 3)
+            life: Tempo de vida em segundos
+            size: Tamanho inicial (meia largura do quadrado, em pixels)
+            max_life: Vida de referência para o fade. None usa life
+            blend: Modo de mistura ("alpha" ou "add"), ou array de índices de BLEND_MODES
+            rank: Ordem de detalhe por partícula. None distribui o lote por igual
+        """
+        if not self.capacity:
+            return
+        n = int(max(np.size(x), np.size(y), np.size(vx), np.size(vy), np.size(life), np.size(size),
+                    np.size(color) // 3))
+        free = self.capacity - self.count
+        if n > free:
+            self.dropped += n - free
+            n = free
+        if n <= 0:
+            return
+        start, end = self.count, self.count + n
+
+        def cut(value):
+            # Lotes maiores que o espaço livre perdem as partículas do fim
+            return value[:n] if np.ndim(value) and len(value) > n else value
+
+        self.pos[start:end, 0] = cut(x)
+        self.pos[start:end, 1] = cut(y)
+        self.vel[start:end, 0] = cut(vx)
+        self.vel[start:end, 1] = cut(vy)
+        self.color[start:end] = cut(np.asarray(color, np.uint8).reshape(-1, 3))
+        self.life[start:end] = cut(life)
+        self.max_life[start:end] = cut(life if max_life is None else max_life)
+        self.size[start:end] = cut(size)
+        self.blend[start:end] = cut(BLEND_MODES[blend] if isinstance(blend, str) else blend)
+        self.rank[start:end] = _detail_ranks(n) if rank is None else cut(rank)
+        self.count = end
+
+    def add_explosion(self, pos: Tuple[int, int], color: Tuple[int, int, int] = (255, 255, 0),
+                      particle_count: int = 15, intensity: float = 1.0, blend: str = "add"):
+        """Adiciona uma explosão de partículas com física realista (aditiva por padrão)."""
+        if not self.capacity or particle_count <= 0:
+            return
+        rng = _batch_rng()
+        n = particle_count
+        angle = rng.uniform(0, 2 * math.pi, n)
+        speed = rng.uniform(50, 150, n) * intensity
+        vx = np.cos(angle) * speed
+        vy = np.sin(angle) * speed - rng.uniform(20, 50, n)  # Bias para cima
+        life = rng.uniform(0.5, 1.5, n)
+        size = rng.integers(2, 6, n)
+        # Variação sutil na cor
+        colors = np.clip(np.asarray(color, np.int16) + rng.integers(-30, 31, (n, 3)), 0, 255)
+        self.emit(pos[0], pos[1], vx, vy, colors, life, size, blend=blend)
+
+    def add_collect_effect(self, pos: Tuple[int, int], color: Tuple[int, int, int] = (0, 255, 0),
+                           blend: str = "alpha"):
+        """Efeito especial para coleta de itens."""
+        if not self.capacity:
+            return
+        n = 8
+        angle = np.arange(n) / n * 2 * math.pi
+        speed = 80
+        self.emit(pos[0], pos[1], np.cos(angle) * speed, np.sin(angle) * speed,
+                  np.tile(np.asarray(color, np.uint8), (n, 1)), 0.8, 4, blend=blend)
+
+    def add_trail(self, pos: Tuple[int, int], velocity: Tuple[float, float],
+                  color: Tuple[int, int, int] = (255, 255, 255), blend: str = "alpha"):
+        """Adiciona rastro de movimento."""
+        # Adiciona partícula de rastro baseada na velocidade
+        vx = -velocity[0] * 0.3 + random.uniform(-20, 20)
+        vy = -velocity[1] * 0.3 + random.uniform(-20, 20)
+        self.emit(pos[0], pos[1], vx, vy, color, 0.3, 2, blend=blend)
+
+    def update(self, dt: float):
+        """Integra todas as partículas e remove as mortas."""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        pos += vel * dt
+        vel[:, 1] += self.gravity * dt
+        life = self.life[:n]
+        life -= dt
+        alive = life > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count == n:
+            return
+        # Swap-remove: vivas do fim ocupam os buracos do prefixo
+        holes = np.flatnonzero(~alive[:alive_count])
+        movers = np.flatnonzero(alive[alive_count:]) + alive_count
+        if len(holes):
+            for array in self._arrays:
+                array[holes] = array[movers]
+        self.count = alive_count
+
+    def _sprite_keys(self, n: int):
+        """Chaves de sprite (int64) e cantos superiores esquerdos das n partículas."""
+        ratio = self.life[:n] / self.max_life[:n]
+        alpha_levels = (255 * ratio).astype(np.int64) >> _ALPHA_SHIFT
+        sizes = np.maximum(1, (self.size[:n] * ratio).astype(np.int64))
+        colors = self.color[:n].astype(np.int64) >> _COLOR_SHIFT
+        keys = ((sizes << 20) | (colors[:, 0] << 15) | (colors[:, 1] << 10) | (colors[:, 2] << 5)
+                | (alpha_levels << 1) | self.blend[:n])
+        lefts = (self.pos[:n, 0] - sizes).astype(np.int32)
+        tops = (self.pos[:n, 1] - sizes).astype(np.int32)
+        visible = alpha_levels > 0
+        detail = quality.budget["particles"]
+        if detail < 1.0:
+            # Orçamento de qualidade: simuladas todas, desenhadas só as de ordem baixa
+            visible &= self.rank[:n] < detail
+        return keys, lefts, tops, visible
+
+    def render(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Desenha todas as partículas num único blits(). Retorna as regiões desenhadas."""
+        n = self.count
+        if n == 0:
+            return []
+        keys, lefts, tops, visible = self._sprite_keys(n)
+        if not visible.all():
+            keys, lefts, tops = keys[visible], lefts[visible], tops[visible]
+            if not len(keys):
+                return []
+        # Um acesso ao cache por combinação distinta, não por partícula
+        unique, inverse = np.unique(keys, return_inverse=True)
+        sprites = np.empty(len(unique), object)
+        flags = np.empty(len(unique), np.int32)
+        for i, key in enumerate(unique.tolist()):
+            sprites[i], flags[i] = self.sprites.get(key)
+        screen.blits(zip(sprites[inverse].tolist(), zip(lefts.tolist(), tops.tolist()),
+                         repeat(None), flags[inverse].tolist()), doreturn=False)
+        return self._dirty_tiles(lefts, tops, int(self.size[:n].max()) * 2)
+
+    @staticmethod
+    def _dirty_tiles(lefts, tops, sprite_size: int) -> List[pygame.Rect]:
+        """Regiões desenhadas, agrupadas em blocos (uma por bloco ocupado, não por partícula)."""
+        # Blocos à esquerda/acima da tela viram o bloco -1 (deslocados +1 para a chave)
+        tile_x = np.clip(lefts >> _TILE_SHIFT, -1, 0xFFFE).astype(np.int64) + 1
+        tile_y = np.clip(tops >> _TILE_SHIFT, -1, 0xFFFE).astype(np.int64) + 1
+        tile = 1 << _TILE_SHIFT
+        # A partícula começa no bloco e pode passar da borda: margem do maior sprite
+        extent = tile + sprite_size
+        return [pygame.Rect(((key & 0xFFFF) - 1) * tile, ((key >> 16) - 1) * tile, extent, extent)
+                for key in np.unique((tile_y << 16) | tile_x).tolist()]
+
+    def clear(self):
+        """Limpa todas as partículas."""
+        self.count = 0
+
+    def capture_state(self) -> List[List]:
+        """Estado serializável das partículas (keyframes de replay)."""
+        n = self.count
+        if n == 0:
+            return []
+        return [[x, y, vx, vy, color, life, max_life, size, blend, rank]
+                for (x, y), (vx, vy), color, life, max_life, size, blend, rank in zip(
+                    self.pos[:n].tolist(), self.vel[:n].tolist(), self.color[:n].tolist(),
+                    self.life[:n].tolist(), self.max_life[:n].tolist(), self.size[:n].tolist(),
+                    self.blend[:n].tolist(), self.rank[:n].tolist())]
+
+    def restore_state(self, state: List[List]):
+        """Restaura partículas salvas por capture_state."""
+        self.count = 0
+        if not state or not self.capacity:
+            return
+        # Keyframes antigos não têm o modo de mistura (9º campo) nem a ordem de detalhe (10º)
+        state = [list(entry) + [0, 0.0][len(entry) - 8:] for entry in state]
+        x, y, vx, vy, color, life, max_life, size, blend, rank = zip(*state)
+        self.emit(np.array(x), np.array(y), np.array(vx), np.array(vy), np.array(color),
+                  np.array(life), np.array(size), max_life=np.array(max_life),
+                  blend=np.array(blend, np.uint8), rank=np.array(rank, np.float32))
+
+
+# Cache compartilhado pelos sistemas de partículas de todas as cenas
+particle_sprites = ParticleSpriteCache()
@@ -0,0 +1,143 @@
+"""
+Governador de qualidade adaptativo.
+
+Mede o tempo de trabalho de cada frame (do fim do ``clock.tick`` ao fim do
+flip, sem a espera que limita o FPS) numa janela móvel. Se a média passa de
+``QUALITY_DOWNGRADE_RATIO`` do tempo de frame de ``FPS``, a qualidade desce
+um nível; se fica abaixo de ``QUALITY_UPGRADE_RATIO`` por
+``QUALITY_UPGRADE_DELAY`` segundos, sobe um. Os limites separados e a espera
+para subir (histerese) evitam ficar alternando entre dois níveis.
+
+Cada nível define orçamentos que o resto do jogo consulta:
+
+- ``particles``: fração das partículas desenhadas (todas continuam simuladas)
+- ``overlays``: camadas translúcidas de tela cheia (flash, escurecimento);
+  desligado, são trocadas por versões opacas/baratas
+- ``smooth_scale``: ``smoothscale`` em vez de ``scale`` ao redimensionar
+
+Os orçamentos só são consultados no desenho. A simulação, inclusive a
+quantidade de partículas e o consumo do RNG global, é a mesma em qualquer
+nível, então o estado salvo nos keyframes de replay não depende do nível em
+que a sessão foi gravada ou reproduzida.
+"""
+import time
+from collections import deque
+from typing import Deque, Dict
+
+import pygame
+
+from core.tracing import tracer
+from core.config import (FPS, QUALITY_WINDOW, QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO,
+                         QUALITY_UPGRADE_DELAY)
+
+# Do mais barato ao mais caro; o jogo começa no último
+QUALITY_TIERS = (
+    {"name": "baixa", "particles": 0.25, "overlays": False, "smooth_scale": False},
+    {"name": "média", "particles": 0.5, "overlays": True, "smooth_scale": False},
+    {"name": "alta", "particles": 1.0, "overlays": True, "smooth_scale": True},
+)
+
+_MAX_DECISIONS = 64
+# Um frame isolado muito lento (carregamento, cutscene) pesa no máximo isto
+_SAMPLE_CLAMP = 3.0
+
+
+class QualityGovernor:
+    """Escolhe o nível de qualidade a partir do tempo de frame medido."""
+
+    def __init__(self, fps: int = FPS, window: int = QUALITY_WINDOW, tiers=QUALITY_TIERS):
+        """
+        Args:
+            fps: FPS alvo
+            window: Frames na janela móvel
+            tiers: Níveis de qualidade, do mais barato ao mais caro
+        """
+        self.tiers = tiers
+        self.tier = len(tiers) - 1
+        self.budget: Dict = tiers[self.tier]
+        self.enabled = True
+        self.frame_budget = 1.0 / fps
+        self.samples: Deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self.frames = 0
+        self._calm_time = 0.0   # tempo seguido com folga para subir
+        self.decisions: Deque[dict] = deque(maxlen=_MAX_DECISIONS)
+
+    @property
+    def tier_name(self) -> str:
+        return self.budget["name"]
+
+    def record_frame(self, work_time: float, frame_time: float):
+        """
+        Registra o tempo de trabalho de um frame e decide se muda de nível.
+
+        Args:
+            work_time: Segundos gastos no frame, sem a espera do clock.tick
+            frame_time: Duração total do frame (dt), usada para contar a espera para subir
+        """
+        self.frames += 1
+        work_time = min(work_time, self.frame_budget * _SAMPLE_CLAMP)
+        if len(self.samples) == self.samples.maxlen:
+            self._sum -= self.samples[0]
+        self.samples.append(work_time)
+        self._sum += work_time
+        if not self.enabled or len(self.samples) < self.samples.maxlen:
+            return
+        mean = self._sum / len(self.samples)
+        if mean > self.frame_budget * QUALITY_DOWNGRADE_RATIO:
+            self._calm_time = 0.0
+            if self.tier > 0:
+                self._change(self.tier - 1, mean)
+        elif mean < self.frame_budget * QUALITY_UPGRADE_RATIO:
+            self._calm_time += frame_time
+            if self._calm_time >= QUALITY_UPGRADE_DELAY and self.tier < len(self.tiers) - 1:
+                self._change(self.tier + 1, mean)
+        else:
+            self._calm_time = 0.0
+
+    def _change(self, tier: int, mean: float):
+        if tracer.enabled:
+            now = time.perf_counter_ns()
+            tracer.record(f"quality {self.tier_name} -> {self.tiers[tier]['name']}", now, now)
+        self.decisions.append({
+            "frame": self.frames,
+            "time": time.time(),
+            "from": self.tier_name,
+            "to": self.tiers[tier]["name"],
+            "mean_ms": mean * 1000,
+        })
+        self.set_tier(tier)
+
+    def set_tier(self, tier: int):
+        """Força um nível (ex.: opção do jogador) e recomeça a medição."""
+        self.tier = max(0, min(tier, len(self.tiers) - 1))
+        self.budget = self.tiers[self.tier]
+        self.samples.clear()
+        self._sum = 0.0
+        self._calm_time = 0.0
+
+    def scale(self, surface: pygame.Surface, size, dest: pygame.Surface = None) -> pygame.Surface:
+        """Redimensiona com smoothscale ou scale, conforme o nível."""
+        if self.budget["smooth_scale"] and surface.get_bitsize() in (24, 32):
+            if dest is None:
+                return pygame.transform.smoothscale(surface, size)
+            return pygame.transform.smoothscale(surface, size, dest)
+        if dest is None:
+            return pygame.transform.scale(surface, size)
+        return pygame.transform.scale(surface, size, dest)
+
+    def telemetry(self) -> dict:
+        """Nível atual, média da janela e as últimas decisões."""
+        mean = self._sum / len(self.samples) if self.samples else 0.0
+        return {
+            "tier": self.tier,
+            "tier_name": self.tier_name,
+            "budget": dict(self.budget),
+            "mean_frame_ms": mean * 1000,
+            "target_frame_ms": self.frame_budget * 1000,
+            "decisions": list(self.decisions),
+        }
+
+
+# Governador global: run_game alimenta, cenas e sistemas de efeitos consultam
+quality = QualityGovernor()
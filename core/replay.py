@@ -0,0 +1,276 @@
+"""
+Gravação e reprodução determinística de sessões.
+
+O gravador registra, por frame, o dt, as teclas relevantes pressionadas e os
+eventos de teclado, além da semente do RNG global (usado por ``Item``,
+``ParticleSystem`` e ``_weighted_item_selection``). Reproduzir os mesmos
+frames a partir da mesma semente recria a sessão bit a bit.
+
+A cada ``REPLAY_KEYFRAME_INTERVAL`` frames, se a cena suportar
+``capture_state()``, um keyframe com o estado completo é gravado. Um índice
+de offsets no fim do arquivo permite ir a qualquer frame restaurando o
+keyframe anterior e simulando só o trecho restante.
+
+Formato (little-endian):
+    cabeçalho  "DNRP" versão:u16 semente:i64 tick_rate:f64 nível:u16
+    registros  b"F" dt:f64 teclas:u16 n:u8 n×(tipo:u8 tecla:i32)
+               b"K" frame:u32 tamanho:u32 zlib(json do estado)
+    índice     b"I" n:u32 n×(frame:u32 offset:u64)
+    rodapé     offset_do_índice:u64 "DNRI"
+"""
+import json
+import bisect
+import mmap
+import random
+import struct
+import time
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+import pygame
+
+from core.config import TICK_RATE, REPLAY_KEYFRAME_INTERVAL
+from core.headless import ScriptedKeys
+from core.timestep import FixedTimestep
+
+MAGIC = b"DNRP"
+INDEX_MAGIC = b"DNRI"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHqdH")
+_FRAME = struct.Struct("<dHB")
+_EVENT = struct.Struct("<Bi")
+_KEYFRAME = struct.Struct("<II")
+_INDEX_ENTRY = struct.Struct("<IQ")
+_TRAILER = struct.Struct("<Q4s")
+
+# Teclas consultadas pelas cenas via pygame.key.get_pressed()
+TRACKED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d,
+    pygame.K_SPACE, pygame.K_p, pygame.K_ESCAPE, pygame.K_r,
+)
+_EVENT_TYPES = {pygame.KEYDOWN: 1, pygame.KEYUP: 2}
+_EVENT_CODES = {code: event_type for event_type, code in _EVENT_TYPES.items()}
+
+
+def _decode_frame(payload) -> Tuple[float, ScriptedKeys, List[pygame.event.Event]]:
+    dt, mask, events = payload
+    keys = ScriptedKeys()
+    for bit, key in enumerate(TRACKED_KEYS):
+        if mask & (1 << bit):
+            keys.pressed.add(key)
+    return dt, keys, [pygame.event.Event(_EVENT_CODES[code], key=key, mod=0, unicode="")
+                      for code, key in events]
+
+
+def _capture_keyframe(scene, timestep) -> dict:
+    version, internal, gauss = random.getstate()
+    return {
+        "scene": scene.capture_state(),
+        "random": [version, list(internal), gauss],
+        "accumulator": timestep.accumulator,
+        "dropped_time": timestep.dropped_time,
+    }
+
+
+def _restore_keyframe(keyframe: dict, scene, timestep):
+    scene.restore_state(keyframe["scene"])
+    timestep.accumulator = keyframe["accumulator"]
+    timestep.dropped_time = keyframe["dropped_time"]
+    version, internal, gauss = keyframe["random"]
+    random.setstate((version, tuple(internal), gauss))
+
+
+class ReplayRecorder:
+    """Grava as entradas de uma sessão em arquivo binário compacto."""
+
+    def __init__(self, path: str, seed: Optional[int] = None, level: int = 1,
+                 tick_rate: int = TICK_RATE, keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL):
+        """
+        Args:
+            path: Arquivo de replay a criar
+            seed: Semente do RNG global (None usa o relógio)
+            level: Nível inicial, informativo
+            tick_rate: Ticks por segundo do FixedTimestep usado na sessão
+            keyframe_interval: Frames entre keyframes de estado
+        """
+        self.seed = seed if seed is not None else time.time_ns() & 0x7FFFFFFF
+        self.keyframe_interval = keyframe_interval
+        self.frame = 0
+        self.index: List[Tuple[int, int]] = []
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.seed, float(tick_rate), level))
+
+    def start(self):
+        """Semeia o RNG global. Chamar antes de criar a primeira cena."""
+        random.seed(self.seed)
+
+    def record(self, scene, timestep, dt: float, keys, events):
+        """
+        Registra um frame (chamar antes da cena processar o frame).
+
+        Args:
+            scene: Cena ativa (keyframes só se ela tiver capture_state)
+            timestep: FixedTimestep usado no loop
+            dt: dt do frame
+            keys: Estado do teclado (pygame.key.get_pressed())
+            events: Eventos do frame
+        """
+        if self.frame == 0 and not hasattr(scene, "capture_state"):
+            print(f"Aviso: {type(scene).__name__} não tem capture_state; replay gravado sem "
+                  "keyframes (seek e verify vão re-simular desde o início)")
+        if self.frame % self.keyframe_interval == 0 and hasattr(scene, "capture_state"):
+            payload = zlib.compress(json.dumps(_capture_keyframe(scene, timestep)).encode("utf-8"))
+            self.index.append((self.frame, self._file.tell()))
+            self._file.write(b"K" + _KEYFRAME.pack(self.frame, len(payload)) + payload)
+
+        mask = 0
+        for bit, key in enumerate(TRACKED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        key_events = [(_EVENT_TYPES[e.type], e.key) for e in events if e.type in _EVENT_TYPES]
+        record = [b"F", _FRAME.pack(dt, mask, len(key_events))]
+        record.extend(_EVENT.pack(code, key) for code, key in key_events)
+        self._file.write(b"".join(record))
+        self.frame += 1
+
+    def close(self):
+        """Grava o índice de keyframes e fecha o arquivo."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(b"I" + struct.pack("<I", len(self.index)))
+        for frame, offset in self.index:
+            self._file.write(_INDEX_ENTRY.pack(frame, offset))
+        self._file.write(_TRAILER.pack(index_offset, INDEX_MAGIC))
+        self._file.close()
+
+
+class ReplayPlayer:
+    """Lê um replay e reproduz a sessão, com busca por keyframes."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.seed, self.tick_rate, self.level = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Arquivo de replay inválido: {path}")
+        self._end = len(self._data)
+        self.index = self._read_index()
+        if not self.index:
+            print(f"Aviso: Replay sem keyframes ({path}): seek re-simula desde o início "
+                  "e verify não tem estado para comparar")
+
+    def _read_index(self) -> List[Tuple[int, int]]:
+        size = _TRAILER.size
+        if self._end >= _HEADER.size + size:
+            index_offset, magic = _TRAILER.unpack_from(self._data, self._end - size)
+            if magic == INDEX_MAGIC:
+                (count,) = struct.unpack_from("<I", self._data, index_offset + 1)
+                entries = [_INDEX_ENTRY.unpack_from(self._data, index_offset + 5 + i * _INDEX_ENTRY.size)
+                           for i in range(count)]
+                self._end = index_offset
+                return entries
+        # Sem índice (gravação interrompida): reconstrói varrendo os registros
+        return [(frame, offset) for kind, frame, offset, _ in self._records(_HEADER.size, 0)
+                if kind == b"K"]
+
+    def _records(self, offset: int, frame: int):
+        """Percorre os registros: (tipo, frame, offset, payload)."""
+        data = self._data
+        try:
+            while offset < self._end:
+                kind = data[offset:offset + 1]
+                if kind == b"F":
+                    dt, mask, count = _FRAME.unpack_from(data, offset + 1)
+                    pos = offset + 1 + _FRAME.size
+                    events = [_EVENT.unpack_from(data, pos + i * _EVENT.size) for i in range(count)]
+                    yield kind, frame, offset, (dt, mask, events)
+                    offset = pos + count * _EVENT.size
+                    frame += 1
+                elif kind == b"K":
+                    key_frame, size = _KEYFRAME.unpack_from(data, offset + 1)
+                    pos = offset + 1 + _KEYFRAME.size
+                    yield kind, key_frame, offset, data[pos:pos + size]
+                    offset = pos + size
+                else:
+                    return
+        except struct.error:
+            return  # registro final truncado
+
+    def keyframe_before(self, frame: int) -> Optional[Tuple[int, int]]:
+        """Último keyframe (frame, offset) em ou antes do frame pedido."""
+        position = bisect.bisect_right([entry[0] for entry in self.index], frame)
+        return self.index[position - 1] if position else None
+
+    def frames(self, start_offset: Optional[int] = None, start_frame: int = 0
+               ) -> Iterator[Tuple[float, ScriptedKeys, List[pygame.event.Event]]]:
+        """Itera os frames gravados como (dt, teclas, eventos)."""
+        offset = _HEADER.size if start_offset is None else start_offset
+        for kind, _, _, payload in self._records(offset, start_frame):
+            if kind == b"F":
+                yield _decode_frame(payload)
+
+    def seek(self, scene_factory, frame: int = 0):
+        """
+        Recria a sessão no início do frame pedido.
+
+        Restaura o keyframe mais próximo e simula só os frames restantes.
+
+        Returns:
+            (cena, timestep, iterador dos frames seguintes)
+        """
+        random.seed(self.seed)
+        scene = scene_factory()
+        timestep = FixedTimestep(self.tick_rate)
+        start_frame, offset = 0, None
+        keyframe = self.keyframe_before(frame)
+        if keyframe is not None and keyframe[0] > 0:
+            start_frame, offset = keyframe
+            _, _, _, payload = next(self._records(offset, start_frame))
+            _restore_keyframe(json.loads(zlib.decompress(payload)), scene, timestep)
+
+        frames = self.frames(offset, start_frame)
+        for _ in range(frame - start_frame):
+            step = next(frames, None)
+            if step is None:
+                break
+            scene = self.step(scene, timestep, step)
+        return scene, timestep, frames
+
+    @staticmethod
+    def step(scene, timestep, frame):
+        """Aplica um frame gravado à cena (mesma ordem do run_game)."""
+        dt, keys, events = frame
+        scene.process_input(events, keys)
+        if hasattr(scene, "fixed_update"):
+            timestep.advance(scene, dt)
+        else:
+            scene.update(dt)
+        return scene.next_scene
+
+    def verify(self, scene_factory) -> List[int]:
+        """
+        Reproduz a sessão inteira comparando com os keyframes gravados.
+
+        Returns:
+            Frames cujo estado divergiu do gravado (vazio = reprodução exata)
+        """
+        random.seed(self.seed)
+        scene = scene_factory()
+        timestep = FixedTimestep(self.tick_rate)
+        mismatches = []
+        for kind, frame, _, payload in self._records(_HEADER.size, 0):
+            if scene is None:
+                break
+            if kind == b"K":
+                expected = json.loads(zlib.decompress(payload))
+                actual = json.loads(json.dumps(_capture_keyframe(scene, timestep)))
+                if actual != expected:
+                    mismatches.append(frame)
+                continue
+            scene = self.step(scene, timestep, _decode_frame(payload))
+        return mismatches
+
+    def close(self):
+        self._data.close()
@@ -0,0 +1,281 @@
+"""
+Broadphase de colisões por grade uniforme (spatial hash).
+
+Cada objeto é registrado nas células da grade que o seu ``rect`` toca.
+Consultas (retângulo, raio, k mais próximos) olham só as células da região
+pedida, em vez de percorrer todos os objetos como ``spritecollide``.
+``update(obj)`` é incremental: se o objeto continua nas mesmas células, só
+o retângulo guardado muda. Os acertos de retângulo podem ainda passar pela
+narrowphase por pixel de ``core.collision``.
+
+``SpatialGroup`` é um ``pygame.sprite.Group`` que mantém o próprio hash em
+dia: sprites entram e saem junto com o grupo e são reindexados depois de
+``group.update()``. ``collide()`` substitui ``pygame.sprite.spritecollide``.
+
+Os resultados vêm na ordem de inserção (como ``spritecollide``), então o
+processamento das colisões continua determinístico em replays.
+"""
+import heapq
+import math
+from itertools import count
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+from core.config import SPATIAL_HASH_CELL_SIZE
+from core.collision import pixel_collide
+
+_Cell = Tuple[int, int]
+
+
+class _Entry:
+    __slots__ = ("rect", "cells", "order")
+
+    def __init__(self, rect, cells, order):
+        self.rect = rect      # (x, y, w, h) na última indexação
+        self.cells = cells    # (cx0, cy0, cx1, cy1) inclusivo
+        self.order = order
+
+
+class SpatialHash:
+    """Grade uniforme de células com os objetos que tocam cada uma."""
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE):
+        """
+        Args:
+            cell_size: Lado de cada célula em pixels (próximo do tamanho típico dos objetos)
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[_Cell, Dict[Hashable, None]] = {}
+        self.entries: Dict[Hashable, _Entry] = {}
+        self._order = count()
+        self.queries = 0
+        self.candidates = 0   # objetos examinados pelas consultas (custo da broadphase)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return obj in self.entries
+
+    def _cell_range(self, x, y, w, h):
+        size = self.cell_size
+        # Retângulos vazios ainda ocupam a célula do canto
+        return (int(x // size), int(y // size),
+                int((x + max(w, 1) - 1) // size), int((y + max(h, 1) - 1) // size))
+
+    def _link(self, obj, cells):
+        cx0, cy0, cx1, cy1 = cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self.cells[(cx, cy)] = {}
+                bucket[obj] = None
+
+    def _unlink(self, obj, cells):
+        cx0, cy0, cx1, cy1 = cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(obj, None)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def insert(self, obj, rect=None):
+        """
+        Registra (ou reindexa) um objeto.
+
+        Args:
+            obj: Objeto (normalmente um sprite)
+            rect: Retângulo do objeto. None usa obj.rect
+        """
+        if obj in self.entries:
+            self.update(obj, rect)
+            return
+        rect = tuple(obj.rect if rect is None else rect)
+        cells = self._cell_range(*rect)
+        self.entries[obj] = _Entry(rect, cells, next(self._order))
+        self._link(obj, cells)
+
+    def update(self, obj, rect=None):
+        """Atualiza a posição de um objeto já registrado (incremental)."""
+        entry = self.entries.get(obj)
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        rect = tuple(obj.rect if rect is None else rect)
+        if rect == entry.rect:
+            return
+        entry.rect = rect
+        cells = self._cell_range(*rect)
+        if cells != entry.cells:
+            self._unlink(obj, entry.cells)
+            self._link(obj, cells)
+            entry.cells = cells
+
+    def remove(self, obj):
+        """Remove um objeto (ignora se não estiver registrado)."""
+        entry = self.entries.pop(obj, None)
+        if entry is not None:
+            self._unlink(obj, entry.cells)
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def _gather(self, cells) -> Dict[Hashable, _Entry]:
+        cx0, cy0, cx1, cy1 = cells
+        found = {}
+        buckets = self.cells
+        entries = self.entries
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    for obj in bucket:
+                        found[obj] = entries[obj]
+        self.queries += 1
+        self.candidates += len(found)
+        return found
+
+    @staticmethod
+    def _sorted(found) -> List:
+        return [obj for obj, _ in sorted(found, key=lambda item: item[1].order)]
+
+    def query_rect(self, rect) -> List:
+        """Objetos cujo retângulo colide com rect, na ordem de inserção."""
+        rect = pygame.Rect(rect)
+        found = self._gather(self._cell_range(*rect))
+        return self._sorted((obj, entry) for obj, entry in found.items()
+                            if rect.colliderect(entry.rect))
+
+    def query_radius(self, center, radius: float) -> List:
+        """Objetos cujo retângulo toca o círculo dado, na ordem de inserção."""
+        cx, cy = center
+        found = self._gather(self._cell_range(cx - radius, cy - radius, 2 * radius + 1, 2 * radius + 1))
+        r2 = radius * radius
+        return self._sorted((obj, entry) for obj, entry in found.items()
+                            if _rect_distance2(entry.rect, cx, cy) <= r2)
+
+    def nearest(self, point, k: int = 1, max_radius: Optional[float] = None) -> List:
+        """
+        Os k objetos mais próximos de um ponto (distância até o retângulo).
+
+        Args:
+            point: (x, y)
+            k: Quantidade de objetos
+            max_radius: Ignora objetos mais longe que isso. None procura em tudo
+
+        Returns:
+            Lista ordenada do mais próximo ao mais distante
+        """
+        if k <= 0 or not self.entries:
+            return []
+        px, py = point
+        size = self.cell_size
+        pcx, pcy = int(px // size), int(py // size)
+        limit = math.inf if max_radius is None else max_radius * max_radius
+        # Anéis de células em volta do ponto; para quando nenhum objeto mais perto pode existir
+        best = []   # heap de (-dist2, -order, obj) com os k melhores
+        seen = set()
+        max_ring = self._max_ring(pcx, pcy) if max_radius is None else int(max_radius // size) + 1
+        for ring in range(max_ring + 1):
+            if len(best) == k and (ring - 1) * size > 0 and ((ring - 1) * size) ** 2 > -best[0][0]:
+                break
+            for cell in _ring_cells(pcx, pcy, ring):
+                bucket = self.cells.get(cell)
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    if obj in seen:
+                        continue
+                    seen.add(obj)
+                    entry = self.entries[obj]
+                    d2 = _rect_distance2(entry.rect, px, py)
+                    if d2 > limit:
+                        continue
+                    item = (-d2, -entry.order, obj)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item[:2] > best[0][:2]:
+                        heapq.heapreplace(best, item)
+        self.queries += 1
+        self.candidates += len(seen)
+        return [obj for _, _, obj in sorted(best, key=lambda item: (-item[0], -item[1]))]
+
+    def _max_ring(self, pcx, pcy) -> int:
+        ring = 0
+        for cx0, cy0, cx1, cy1 in (entry.cells for entry in self.entries.values()):
+            ring = max(ring, abs(cx0 - pcx), abs(cx1 - pcx), abs(cy0 - pcy), abs(cy1 - pcy))
+        return ring
+
+
+def _rect_distance2(rect, px, py) -> float:
+    """Quadrado da distância de um ponto até um retângulo (0 se dentro)."""
+    x, y, w, h = rect
+    dx = max(x - px, 0, px - (x + w))
+    dy = max(y - py, 0, py - (y + h))
+    return dx * dx + dy * dy
+
+
+def _ring_cells(cx, cy, ring):
+    """Células na borda do quadrado de raio ring em volta de (cx, cy)."""
+    if ring == 0:
+        yield (cx, cy)
+        return
+    for x in range(cx - ring, cx + ring + 1):
+        yield (x, cy - ring)
+        yield (x, cy + ring)
+    for y in range(cy - ring + 1, cy + ring):
+        yield (cx - ring, y)
+        yield (cx + ring, y)
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """Grupo de sprites com um SpatialHash sincronizado."""
+
+    def __init__(self, *sprites, cell_size: int = SPATIAL_HASH_CELL_SIZE):
+        self.spatial = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.spatial.insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.spatial.remove(sprite)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.reindex()
+
+    def reindex(self):
+        """Atualiza a posição de todos os sprites no hash (após movê-los fora de update)."""
+        update = self.spatial.update
+        for sprite in self.sprites():
+            update(sprite)
+
+
+def collide(sprite, group: SpatialGroup, dokill: bool, pixel_perfect: bool = False) -> List:
+    """
+    Equivalente a pygame.sprite.spritecollide usando o spatial hash do grupo.
+
+    Args:
+        sprite: Sprite com rect (ex.: o player)
+        group: SpatialGroup com os alvos
+        dokill: Remove os sprites atingidos de todos os grupos
+        pixel_perfect: Confirma cada acerto de retângulo pelos pixels visíveis
+
+    Returns:
+        Sprites que colidem, na ordem de inserção
+    """
+    hits = group.spatial.query_rect(sprite.rect)
+    if pixel_perfect and hits:
+        hits = [hit for hit in hits if pixel_collide(sprite, hit)]
+    if dokill:
+        for hit in hits:
+            hit.kill()
+    return hits
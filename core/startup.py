@@ -0,0 +1,93 @@
+"""
+Relatório do tempo de inicialização, do início do processo ao primeiro frame.
+
+Ligado por ``python main.py --startup-report``. Mede o tempo de parede de
+cada import de módulo (na primeira vez que ele é importado) e de cada fase
+de inicialização marcada com ``startup.phase(nome)``, e imprime o relatório
+quando o primeiro frame é apresentado. Desligado, ``phase()`` devolve um
+contexto vazio e ``first_frame()`` não faz nada.
+
+Este módulo só usa a biblioteca padrão, para poder ser importado antes de
+todo o resto sem aparecer na própria medição.
+"""
+import sys
+import time
+import builtins
+import contextlib
+from typing import List, Tuple
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class StartupReport:
+    """Coleta tempos de imports e de fases da inicialização."""
+
+    def __init__(self):
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []    # (nome, início, duração)
+        self.imports: List[Tuple[str, int, float]] = []     # (módulo, profundidade, duração)
+        self.first_frame_at = None
+        self._depth = 0
+        self._original_import = None
+
+    def enable(self):
+        """Liga a medição e passa a cronometrar imports novos."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Só o primeiro import de cada módulo custa algo; os demais vêm de sys.modules
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._depth += 1
+        began = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.imports.append((name, self._depth, time.perf_counter() - began))
+
+    def phase(self, name: str):
+        """Contexto que mede uma fase da inicialização."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._phase(name)
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, began - self.start, time.perf_counter() - began))
+
+    def first_frame(self):
+        """Marca o primeiro frame apresentado, imprime o relatório e desliga a medição."""
+        if not self.enabled or self.first_frame_at is not None:
+            return
+        self.first_frame_at = time.perf_counter() - self.start
+        builtins.__import__ = self._original_import
+        print(self.report())
+
+    def report(self, top: int = 15) -> str:
+        """Texto do relatório: fases em ordem e os imports mais lentos."""
+        lines = ["=" * 60, "RELATÓRIO DE INICIALIZAÇÃO", "=" * 60, "Fases:"]
+        for name, began, duration in self.phases:
+            lines.append(f"  {began * 1000:8.1f} ms  +{duration * 1000:8.1f} ms  {name}")
+        total_imports = sum(d for _, depth, d in self.imports if depth == 0)
+        lines.append(f"Imports ({len(self.imports)} módulos, {total_imports * 1000:.1f} ms "
+                     f"nos de primeiro nível), mais lentos:")
+        for name, depth, duration in sorted(self.imports, key=lambda i: i[2], reverse=True)[:top]:
+            lines.append(f"  {duration * 1000:8.1f} ms  {'  ' * depth}{name}")
+        if self.first_frame_at is not None:
+            lines.append(f"Primeiro frame em {self.first_frame_at * 1000:.1f} ms")
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+
+# Relatório global: main.py liga com --startup-report
+startup = StartupReport()
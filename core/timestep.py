@@ -0,0 +1,116 @@
+"""
+Simulação em passo fixo com renderização interpolada.
+
+Cenas que implementam ``fixed_update(dt)`` e ``render(screen, alpha)`` são
+atualizadas em ticks de duração constante, independente do FPS real. Cenas
+antigas (apenas ``update(dt)``/``render(screen)``) continuam funcionando.
+"""
+from core.config import TICK_RATE, MAX_TICKS_PER_FRAME
+from core.tracing import tracer
+
+
+class FixedTimestep:
+    """Acumulador de tempo que converte o dt do frame em ticks fixos."""
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS_PER_FRAME):
+        """
+        Args:
+            tick_rate: Ticks de simulação por segundo
+            max_ticks: Máximo de ticks executados em um único frame
+        """
+        self.step = 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # tempo descartado por exceder o orçamento
+
+    def reset(self):
+        """Zera o acumulador (ex.: ao trocar de cena)."""
+        self.accumulator = 0.0
+
+    def advance(self, scene, dt):
+        """
+        Executa os ticks pendentes na cena.
+
+        Args:
+            scene: Cena com método fixed_update(dt)
+            dt: Tempo real decorrido desde o último frame, em segundos
+
+        Returns:
+            Fração (0.0 a 1.0) entre o último tick e o próximo, para interpolação
+        """
+        self.accumulator += dt
+        ticks = 0
+        while self.accumulator >= self.step and ticks < self.max_ticks:
+            with tracer.span("tick"):
+                scene.fixed_update(self.step)
+            self.accumulator -= self.step
+            ticks += 1
+            if scene.next_scene is not scene:
+                # Cena mudou no meio do frame: ticks restantes não se aplicam
+                self.accumulator = 0.0
+                return 1.0
+
+        # Orçamento esgotado: o atraso restante é recuperado nos próximos
+        # frames, mas nunca passa de um orçamento inteiro (evita espiral).
+        limit = self.step * self.max_ticks
+        if self.accumulator > limit:
+            self.dropped_time += self.accumulator - limit
+            self.accumulator = limit
+
+        return min(self.accumulator / self.step, 1.0)
+
+
+def advance_scene(scene, dt, timestep):
+    """
+    Avança a cena um frame usando o contrato que ela suporta.
+
+    Returns:
+        Alpha de interpolação, ou None para cenas sem fixed_update
+    """
+    if hasattr(scene, "fixed_update"):
+        return timestep.advance(scene, dt)
+    scene.update(dt)
+    return None
+
+
+def _iter_sprites(objs):
+    for obj in objs:
+        if obj is None:
+            continue
+        if hasattr(obj, "sprites"):
+            yield from obj.sprites()
+        else:
+            yield obj
+
+
+def store_previous_positions(*objs):
+    """Guarda a posição atual de sprites/grupos antes de um tick."""
+    for sprite in _iter_sprites(objs):
+        sprite.prev_pos = sprite.rect.topleft
+
+
+def interpolated_topleft(sprite, alpha):
+    """Posição do sprite interpolada entre o tick anterior e o atual."""
+    x, y = sprite.rect.topleft
+    prev = getattr(sprite, "prev_pos", None)
+    if prev is None or alpha >= 1.0:
+        return x, y
+    return (round(prev[0] + (x - prev[0]) * alpha),
+            round(prev[1] + (y - prev[1]) * alpha))
+
+
+def draw_interpolated(screen, sprites, alpha):
+    """
+    Desenha sprites na posição interpolada em um único Surface.blits.
+
+    Returns:
+        Lista de Rects desenhados
+    """
+    if alpha is None:
+        alpha = 1.0
+    if hasattr(sprites, "sprites"):
+        sprites = sprites.sprites()
+    batch = [(s.image, interpolated_topleft(s, alpha)) for s in sprites]
+    if not batch:
+        return []
+    return screen.blits(batch)
@@ -0,0 +1,137 @@
+"""
+Tracing por fase do frame com exportação no formato Chrome trace-event.
+
+Os spans ficam num buffer circular pré-alocado e podem ser exportados a
+qualquer momento para JSON (abrir em chrome://tracing ou ui.perfetto.dev).
+Desligado, ``tracer.span()`` devolve sempre o mesmo objeto vazio, então o
+custo é uma checagem de atributo por span e o código pode ficar no build.
+
+Uso:
+    from core.tracing import tracer
+    with tracer.span("update"):
+        ...
+
+Ative com a variável de ambiente DONA_NEIDE_TRACE=1 ou pela tecla F9.
+"""
+import os
+import json
+import time
+import threading
+
+from core.config import TRACE_BUFFER_SIZE
+
+_now_ns = time.perf_counter_ns
+_get_ident = threading.get_ident
+
+
+class _NullSpan:
+    """Span vazio usado quando o tracing está desligado."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = _now_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.record(self.name, self.start, _now_ns())
+        return False
+
+
+class FrameTracer:
+    """Coletor de spans aninhados em buffer circular de tamanho fixo."""
+
+    def __init__(self, capacity=TRACE_BUFFER_SIZE, enabled=False):
+        """
+        Args:
+            capacity: Número máximo de spans mantidos (os mais antigos são sobrescritos)
+            enabled: Começa gravando
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.names = [None] * capacity
+        self.starts = [0] * capacity
+        self.ends = [0] * capacity
+        self.threads = [0] * capacity
+        self.count = 0  # total de spans já gravados (inclui sobrescritos)
+        self.origin = _now_ns()
+
+    def span(self, name):
+        """Context manager que mede o bloco com o nome dado."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name, start_ns, end_ns):
+        """Grava um span já medido (tempos de time.perf_counter_ns)."""
+        i = self.count % self.capacity
+        self.names[i] = name
+        self.starts[i] = start_ns
+        self.ends[i] = end_ns
+        self.threads[i] = _get_ident()
+        self.count += 1
+
+    def toggle(self):
+        """Liga/desliga a gravação. Retorna o novo estado."""
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def clear(self):
+        """Descarta todos os spans gravados."""
+        self.count = 0
+
+    def events(self):
+        """Spans gravados em ordem cronológica no formato trace-event."""
+        stored = min(self.count, self.capacity)
+        first = self.count - stored
+        tids = {}
+        events = []
+        for n in range(first, self.count):
+            i = n % self.capacity
+            tid = tids.setdefault(self.threads[i], len(tids) + 1)
+            events.append({
+                "name": self.names[i],
+                "ph": "X",
+                "ts": (self.starts[i] - self.origin) / 1000.0,
+                "dur": (self.ends[i] - self.starts[i]) / 1000.0,
+                "pid": 1,
+                "tid": tid,
+            })
+        return events
+
+    def export_chrome(self, path=None):
+        """
+        Exporta os spans para JSON do Chrome trace-event.
+
+        Args:
+            path: Arquivo de saída. None gera traces/trace_<timestamp>.json
+
+        Returns:
+            Caminho do arquivo escrito
+        """
+        if path is None:
+            os.makedirs("traces", exist_ok=True)
+            path = os.path.join("traces", time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+        return path
+
+
+# Tracer global do jogo
+tracer = FrameTracer(enabled=os.environ.get("DONA_NEIDE_TRACE") == "1")
@@ -1,23 +1,150 @@
 import pygame, sys, os
+import math
+import time
+import queue
+import threading
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from core.config import VIDEO_QUEUE_SIZE, CUTSCENE_SYNC_TOLERANCE
+from core.media_clock import MediaClock, SyncStats
+from core.quality import quality
+from assets.parallel import get_executor
+
+# MoviePy (e com ele numpy, imageio e a sondagem do ffmpeg) só é importado
+# quando uma cutscene em vídeo vai tocar, não na abertura do jogo
+VideoFileClip = None
+MOVIEPY_AVAILABLE = None  # None: ainda não verificado
+
+
+def _load_moviepy() -> bool:
+    """Importa o MoviePy na primeira chamada. Retorna se está disponível."""
+    global VideoFileClip, MOVIEPY_AVAILABLE
+    if MOVIEPY_AVAILABLE is None:
+        try:
+            from moviepy.editor import VideoFileClip
+            MOVIEPY_AVAILABLE = True
+        except ImportError:
+            MOVIEPY_AVAILABLE = False
+    return MOVIEPY_AVAILABLE
+
+_END = object()  # marca o fim do vídeo na fila
+
+
+class FrameDecoder(threading.Thread):
+    """
+    Decodifica os frames de um clipe em segundo plano.
+
+    Os frames vão para uma fila limitada; quando ela enche, a thread espera o
+    apresentador consumir, então a memória fica em VIDEO_QUEUE_SIZE frames.
+
+    O apresentador publica a posição do relógio em ``target``. Se o próximo
+    frame já estiver atrasado além da tolerância, a thread pula direto para o
+    frame dessa posição em vez de decodificar frames que seriam descartados.
+    """
+
+    def __init__(self, clip, fps, max_frames=VIDEO_QUEUE_SIZE, tolerance=CUTSCENE_SYNC_TOLERANCE):
+        super().__init__(name="cutscene-decoder", daemon=True)
+        self.clip = clip
+        self.fps = fps
+        self.tolerance = tolerance
+        self.frames = queue.Queue(maxsize=max_frames)
+        self.stop_event = threading.Event()
+        self.target = 0.0   # posição do relógio, escrita pelo apresentador
+        self.skipped = 0    # frames nunca decodificados por atraso
+        self.error = None
+
+    def run(self):
+        try:
+            # Mesma grade de tempos de clip.iter_frames
+            total = int(self.clip.duration * self.fps)
+            index = 0
+            while index < total:
+                if index / self.fps < self.target - self.tolerance:
+                    # Atrasado: alcança o relógio pulando os frames intermediários
+                    ahead = min(total - 1, math.ceil(self.target * self.fps))
+                    self.skipped += ahead - index
+                    index = ahead
+                t = index / self.fps
+                frame = self.clip.get_frame(t).astype("uint8", copy=False)
+                # swapaxes devolve uma view (h, w, 3) -> (w, h, 3), sem cópia
+                if not self._put((t, frame.swapaxes(0, 1))):
+                    return
+                index += 1
+        except Exception as e:
+            self.error = e
+        self._put(_END)
+
+    def _put(self, item):
+        while not self.stop_event.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def stop(self):
+        """Interrompe a decodificação e espera a thread terminar."""
+        self.stop_event.set()
+        # Esvazia a fila para destravar um put() pendente
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
+        self.join(timeout=1.0)
+
+
+def _clip_sound(clip):
+    """
+    Converte a trilha do clipe num Sound do mixer (None se não houver).
+    Decodifica a trilha inteira: rodar fora da thread principal.
+    """
+    if clip.audio is None or not pygame.mixer.get_init():
+        return None
+    frequency, _, channels = pygame.mixer.get_init()
+    try:
+        samples = clip.audio.to_soundarray(fps=frequency, nbytes=2, quantize=True)
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        if samples.shape[1] != channels:
+            # Ajusta mono/estéreo ao formato do mixer
+            samples = samples.mean(axis=1, keepdims=True).astype(samples.dtype)
+            if channels > 1:
+                samples = samples.repeat(channels, axis=1)
+        if channels == 1:
+            samples = samples[:, 0]
+        return pygame.sndarray.make_sound(samples.copy(order="C"))
+    except Exception as e:
+        print(f"Aviso: Não foi possível carregar o áudio da cutscene: {e}")
+        return None
 
-try:
-    from moviepy.editor import VideoFileClip
-    MOVIEPY_AVAILABLE = True
-except ImportError:
-    MOVIEPY_AVAILABLE = False
 
 def play_cutscene_fullscreen(video_path, window_size):
     """
     Reproduz vídeo MP4 em fullscreen e retorna ao jogo ao final ou ao pressionar tecla.
-    """
-    if not MOVIEPY_AVAILABLE:
-        print("MoviePy não está instalado. Pulando cutscene.")
-        return
 
+    A decodificação roda numa thread (FrameDecoder) e a trilha de áudio é
+    convertida no pool de carregamento; o relógio só começa quando o áudio
+    fica pronto. A thread principal só copia cada frame para uma Surface
+    pré-alocada e escala direto na tela.
+    O tempo vem do áudio do clipe (MediaClock): frames atrasados além de
+    CUTSCENE_SYNC_TOLERANCE são descartados se já houver um mais novo na
+    fila, e o decodificador pula para a posição do relógio. Em máquinas
+    lentas a imagem perde fluidez, mas segue o som em vez de congelar.
+
+    Returns:
+        Dict de SyncStats ("shown", "dropped", "held", "mean_drift",
+        "max_drift") ou None se não reproduziu
+    """
     if not os.path.exists(video_path):
         print(f"Cutscene não encontrada: {video_path}")
         return
 
+    if not _load_moviepy():
+        print("MoviePy não está instalado. Pulando cutscene.")
+        return
+
     try:
         clip = VideoFileClip(video_path)
     except Exception as e:
@@ -31,25 +158,84 @@ def play_cutscene_fullscreen(video_path, window_size):
         info = pygame.display.Info()
         screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
 
-    clock = pygame.time.Clock()
     fps = clip.fps or 30
+    frame_time = 1.0 / fps
+    # Surface única que recebe cada frame decodificado
+    frame_surface = pygame.Surface(clip.size).convert()
+    scaled = frame_surface.get_size() != screen.get_size()
+
+    decoder = FrameDecoder(clip, fps)
+    decoder.start()
+    audio = get_executor().submit(_clip_sound, clip)
+    media_clock = None
+    sync = SyncStats()
+    quit_game = False
+
+    try:
+        while not quit_game:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    quit_game = True
+                elif event.type == pygame.KEYDOWN:
+                    return sync.as_dict()
+            if quit_game:
+                break
+
+            if media_clock is None:
+                # Áudio ainda sendo convertido: espera sem deixar de tratar eventos
+                try:
+                    media_clock = MediaClock(audio.result(timeout=frame_time))
+                except FutureTimeout:
+                    continue
+
+            decoder.target = media_clock.time()
+            try:
+                item = decoder.frames.get(timeout=frame_time)
+            except queue.Empty:
+                if media_clock.started:
+                    sync.held += 1  # decodificador atrasado: mantém o último frame
+                continue
+            if item is _END:
+                break
+            t, frame = item
+            if not media_clock.started:
+                media_clock.start(t)  # áudio e relógio começam no primeiro frame
+
+            clip_time = media_clock.time()
+            if clip_time > t + CUTSCENE_SYNC_TOLERANCE and not decoder.frames.empty():
+                # Apresentação atrasada e há frame mais novo: pula este para alcançar o áudio.
+                # Sem outro na fila, o atrasado é exibido (melhor que congelar a imagem)
+                sync.dropped += 1
+                continue
+            if t > clip_time:
+                time.sleep(t - clip_time)
+                clip_time = media_clock.time()
+
+            pygame.surfarray.blit_array(frame_surface, frame)
+            if scaled:
+                quality.scale(frame_surface, screen.get_size(), screen)
+            else:
+                screen.blit(frame_surface, (0, 0))
+            pygame.display.flip()
+            sync.frame_shown(t, clip_time)
+
+        sync.dropped += decoder.skipped
+        if decoder.error is not None:
+            print(f"Erro ao decodificar vídeo {video_path}: {decoder.error}")
+    finally:
+        if media_clock is not None:
+            media_clock.stop()
+        decoder.stop()
+        if audio.cancel() or audio.done():
+            clip.close()
+        else:
+            # Conversão do áudio ainda rodando: fecha o clipe quando ela terminar
+            audio.add_done_callback(lambda _: clip.close())
+        if not quit_game:
+            pygame.display.set_mode(window_size)
 
-    for frame in clip.iter_frames(fps=fps, dtype="uint8"):
-        surf = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-        screen.blit(pygame.transform.scale(surf, screen.get_size()), (0, 0))
-        pygame.display.flip()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                clip.close()
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                clip.close()
-                pygame.display.set_mode(window_size)
-                return
-
-        clock.tick(fps)
-
-    clip.close()
-    pygame.display.set_mode(window_size)
\ No newline at end of file
+    if quit_game:
+        pygame.quit()
+        sys.exit()
+    print(f"Cutscene: {sync.summary()}")
+    return sync.as_dict()
@@ -0,0 +1,160 @@
+"""
+Gerenciador de vozes do mixer: pools de canais por categoria, prioridades,
+roubo de voz e agrupamento de disparos repetidos no mesmo frame.
+
+Em vez de ``sound.play()`` (que pega qualquer canal livre e falha em
+silêncio quando acabam), os sons são pedidos com ``play()`` e tocados em
+``flush()``, uma vez por tick:
+
+- cada categoria ("ui", "combat", "special") tem seus próprios canais, então
+  uma rajada de explosões não cala a interface;
+- disparos do mesmo som no mesmo tick viram uma única voz mais alta (até o
+  teto do canal; um disparo isolado toca no volume normal);
+- sem canal livre na categoria, a voz de menor prioridade (depois a mais
+  baixa, depois a mais antiga) é interrompida, desde que não seja mais
+  importante que a nova.
+
+Os primeiros ``MUSIC_CHANNELS`` canais ficam fora dos pools, reservados para
+a música.
+"""
+import math
+from typing import Dict, List, Optional
+
+import pygame
+
+from core.config import VOICE_POOLS, MUSIC_CHANNELS
+
+# Canais extras, fora dos pools, para quem ainda chama sound.play() direto
+_SPARE_CHANNELS = 4
+
+
+class _Voice:
+    """Estado de um canal do pool."""
+    __slots__ = ("channel", "priority", "volume", "started")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.priority = 0
+        self.volume = 0.0
+        self.started = 0
+
+
+class _Request:
+    __slots__ = ("sound", "category", "priority", "volume", "count")
+
+    def __init__(self, sound, category, priority, volume):
+        self.sound = sound
+        self.category = category
+        self.priority = priority
+        self.volume = volume
+        self.count = 1
+
+
+class VoiceManager:
+    """Distribui os sons do jogo pelos canais do mixer."""
+
+    def __init__(self, pools: Optional[Dict[str, int]] = None, first_channel: int = MUSIC_CHANNELS,
+                 base_volume: float = 1.0):
+        """
+        Args:
+            pools: {categoria: número de canais}. None usa VOICE_POOLS
+            first_channel: Primeiro canal usado pelos pools (os anteriores ficam livres)
+            base_volume: Volume de canal de um disparo isolado com volume 1.0 (1.0 = ganho unitário)
+        """
+        self.pool_sizes = dict(VOICE_POOLS if pools is None else pools)
+        self.first_channel = first_channel
+        self.base_volume = base_volume
+        self.pools: Dict[str, List[_Voice]] = {}
+        self.pending: Dict[tuple, _Request] = {}
+        self.tick = 0
+        self.played = 0
+        self.merged = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._setup_channels()
+
+    def _setup_channels(self):
+        if not pygame.mixer.get_init():
+            return
+        total = self.first_channel + sum(self.pool_sizes.values())
+        try:
+            if pygame.mixer.get_num_channels() < total + _SPARE_CHANNELS:
+                pygame.mixer.set_num_channels(total + _SPARE_CHANNELS)
+            # Canais dos pools (e da música) não são escolhidos por sound.play()
+            pygame.mixer.set_reserved(total)
+        except pygame.error:
+            return
+        index = self.first_channel
+        for category, size in self.pool_sizes.items():
+            self.pools[category] = [_Voice(pygame.mixer.Channel(i)) for i in range(index, index + size)]
+            index += size
+
+    def play(self, sound: Optional[pygame.mixer.Sound], category: str = "ui",
+             priority: int = 1, volume: float = 1.0):
+        """
+        Pede um som para o próximo flush().
+
+        Args:
+            sound: Som a tocar (None é ignorado)
+            category: Pool de canais
+            priority: Maior = mais importante; vozes só roubam de prioridade igual ou menor
+            volume: Volume relativo (1.0 = normal), multiplica base_volume e o volume do Sound
+        """
+        if sound is None:
+            return
+        key = (id(sound), category)
+        request = self.pending.get(key)
+        if request is None:
+            self.pending[key] = _Request(sound, category, priority, volume)
+            return
+        # Mesmo som de novo neste tick: uma voz só, mais alta
+        request.count += 1
+        request.priority = max(request.priority, priority)
+        request.volume = max(request.volume, volume)
+        self.merged += 1
+
+    def flush(self):
+        """Toca os sons pedidos desde o último flush. Chamar uma vez por tick."""
+        self.tick += 1
+        if not self.pending:
+            return
+        requests = sorted(self.pending.values(), key=lambda r: r.priority, reverse=True)
+        self.pending.clear()
+        for request in requests:
+            # Soma de energia de n disparos iguais: volume cresce com sqrt(n), até o teto do canal
+            volume = min(1.0, self.base_volume * request.volume * math.sqrt(request.count))
+            voice = self._find_voice(request.category, request.priority)
+            if voice is None:
+                self.dropped += 1
+                continue
+            voice.channel.play(request.sound)
+            voice.channel.set_volume(volume)
+            voice.priority = request.priority
+            voice.volume = volume * request.sound.get_volume()
+            voice.started = self.tick
+            self.played += 1
+
+    def _find_voice(self, category: str, priority: int) -> Optional[_Voice]:
+        pool = self.pools.get(category)
+        if not pool:
+            return None
+        busy = []
+        for voice in pool:
+            if not voice.channel.get_busy():
+                return voice
+            if voice.priority <= priority:
+                busy.append(voice)
+        if not busy:
+            return None
+        # Rouba a de menor prioridade; empate: a mais baixa, depois a mais antiga
+        victim = min(busy, key=lambda v: (v.priority, v.volume, v.started))
+        victim.channel.stop()
+        self.stolen += 1
+        return victim
+
+    def stop_all(self):
+        """Interrompe todas as vozes dos pools e descarta os pedidos."""
+        self.pending.clear()
+        for pool in self.pools.values():
+            for voice in pool:
+                voice.channel.stop()
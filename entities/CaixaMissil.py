@@ -1,15 +1,25 @@
-import pygame
 import math
+from entities.pool import PooledSprite, SpritePool
 
-class CaixaMissil(pygame.sprite.Sprite):
+class CaixaMissil(PooledSprite):
     def __init__(self, x, y, image, target, speed=300):
-        super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(midtop=(x, y))
+        super().__init__(image)
+        self.rect = None
+        self.reset(x, y, image, target, speed)
+
+    def reset(self, x, y, image, target, speed=300):
+        """Reinicia o míssil (também usado ao reaproveitá-lo do pool)."""
+        super().reset(image)
+        if self.rect is None:
+            self.rect = self.image.get_rect(midtop=(x, y))
+        else:
+            self.rect.size = self.image.get_size()
+            self.rect.midtop = (x, y)
         self.target = target
         self.speed = speed
 
     def update(self, dt):
+        self.animate(dt)
         # calcula vetor direção até o alvo
         dir_x = self.target.rect.centerx - self.rect.centerx
         dir_y = self.target.rect.centery - self.rect.centery
@@ -25,3 +35,7 @@ class CaixaMissil(pygame.sprite.Sprite):
         if (self.rect.top > 600 or self.rect.bottom < 0 or
             self.rect.left > 800 or self.rect.right < 0):
             self.kill()
+
+
+# Pool compartilhado pelos chefes: use missile_pool.acquire(...) em vez de CaixaMissil(...)
+missile_pool = SpritePool(CaixaMissil)
@@ -92,9 +92,18 @@ class DonaNeide(pygame.sprite.Sprite):
         self.slip_timer = self.slip_duration
         self.can_move = False
 
-    def draw(self, screen):
+    @property
+    def collision_image(self):
+        """Imagem desenhada no momento (com escudo ou sem), usada na colisão por pixel."""
+        if self.shield_active and self.shield_image:
+            return self.shield_image
+        return self.image
+
+    def draw(self, screen, pos=None):
         # Desenha a imagem do escudo ou sem escudo
+        # pos permite desenhar numa posição interpolada (passo fixo)
+        if pos is None:
+            pos = self.rect.topleft
         if self.shield_active and self.shield_image:
-            screen.blit(self.shield_image, self.rect)
-        else:
-            screen.blit(self.image, self.rect)
\ No newline at end of file
+            return screen.blit(self.shield_image, pos)
+        return screen.blit(self.image, pos)
\ No newline at end of file
@@ -1,11 +1,11 @@
-import pygame, random
-from entities.CaixaMissil import CaixaMissil
+from entities.CaixaMissil import missile_pool
+from assets.animation import AnimatedSprite
 
 
-class EntregadorTemporal(pygame.sprite.Sprite):
-    def __init__(self, image, missile_img, screen_rect, target):
-        super().__init__()
-        self.image = image
+class EntregadorTemporal(AnimatedSprite):
+    def __init__(self, image, missile_img, screen_rect, target, name="Entregador Temporal"):
+        super().__init__(image)
+        self.name = name  # exibido acima da barra de vida
         self.rect = self.image.get_rect(midtop=(screen_rect.centerx, 20))
         self.direction = 1
         self.speed = 100
@@ -19,6 +19,7 @@ class EntregadorTemporal(pygame.sprite.Sprite):
         self.target = target
 
     def update(self, dt):
+        self.animate(dt)
         self.rect.x += self.direction * self.speed * dt
         if self.rect.right > self.screen_rect.right or self.rect.left < self.screen_rect.left:
             self.direction *= -1
@@ -31,7 +32,7 @@ class EntregadorTemporal(pygame.sprite.Sprite):
     def fire_missile(self):
         self.missile_timer = 0
         # passa referência ao jogador
-        return CaixaMissil(self.rect.centerx, self.rect.bottom, self.missile_img, self.target)
+        return missile_pool.acquire(self.rect.centerx, self.rect.bottom, self.missile_img, self.target)
 
 
     def register_hit(self):
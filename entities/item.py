@@ -1,20 +1,33 @@
-import pygame
 import random
 from core.config import WIDTH, HEIGHT
+from entities.pool import PooledSprite, SpritePool
 
-class Item(pygame.sprite.Sprite):
+class Item(PooledSprite):
     def __init__(self, image, tipo, valor, efeito=None, speed_range=(150, 250)):
-        super().__init__()
-        self.image = image
+        super().__init__(image)
+        self.rect = None
+        self.reset(image, tipo, valor, efeito, speed_range)
+
+    def reset(self, image, tipo, valor, efeito=None, speed_range=(150, 250)):
+        """Reinicia o item (também usado ao reaproveitá-lo do pool)."""
+        super().reset(image)
         self.tipo = tipo
         self.valor = valor
         self.efeito = efeito
         self.speed = random.randint(*speed_range)
-        self.rect = self.image.get_rect(
-            midtop=(random.randint(0, WIDTH - self.image.get_width()), -self.image.get_height())
-        )
+        midtop = (random.randint(0, WIDTH - self.image.get_width()), -self.image.get_height())
+        if self.rect is None:
+            self.rect = self.image.get_rect(midtop=midtop)
+        else:
+            self.rect.size = self.image.get_size()
+            self.rect.midtop = midtop
 
     def update(self, dt):
+        self.animate(dt)
         self.rect.y += self.speed * dt
         if self.rect.top > HEIGHT:
             self.kill()
+
+
+# Pool compartilhado pelas cenas: use item_pool.acquire(...) em vez de Item(...)
+item_pool = SpritePool(Item)
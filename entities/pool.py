@@ -0,0 +1,105 @@
+"""
+Pools de sprites reaproveitáveis (itens, mísseis).
+
+Sprites que saem de jogo com ``kill()`` voltam para o pool em vez de virar
+lixo; o próximo ``acquire()`` reinicia um deles com ``reset()`` no lugar de
+construir outro. Isso evita alocação e coleta de lixo nos níveis com muitos
+spawns.
+
+Uso:
+    item = item_pool.acquire(image, tipo, valor, efeito, speed_range)
+    self.items.add(item)
+    ...
+    item.kill()  # sai dos grupos e volta para o pool
+"""
+from typing import Callable, List
+
+from core.config import SPRITE_POOL_MAX_FREE
+from assets.animation import AnimatedSprite
+
+
+class PooledSprite(AnimatedSprite):
+    """
+    Sprite que volta para o seu pool ao ser removido com kill().
+
+    Subclasses estendem ``reset(...)`` com os mesmos argumentos do
+    construtor, deixando o sprite como se tivesse acabado de ser criado, e
+    chamam ``super().reset(image)`` para os campos comuns.
+    """
+
+    def __init__(self, image):
+        super().__init__(image)
+        self.prev_pos = None
+        self._pool = None
+        self._pooled = False   # True enquanto está na lista livre do pool
+
+    def reset(self, image):
+        """Reinicia a imagem, o relógio da animação e a posição anterior."""
+        self.set_image(image)
+        self.prev_pos = None
+
+    def kill(self):
+        super().kill()
+        # Sem isso a interpolação partiria da posição da vida anterior
+        self.prev_pos = None
+        if self._pool is not None and not self._pooled:
+            self._pool.release(self)
+
+
+class SpritePool:
+    """Guarda sprites mortos de uma classe para reuso."""
+
+    def __init__(self, factory: Callable[..., PooledSprite], max_free: int = SPRITE_POOL_MAX_FREE):
+        """
+        Args:
+            factory: Classe (ou função) que cria um sprite novo com os argumentos de acquire
+            max_free: Máximo de sprites livres guardados; os excedentes são descartados
+        """
+        self.factory = factory
+        self.max_free = max_free
+        self.free: List[PooledSprite] = []
+        self.created = 0     # sprites construídos (pool vazio)
+        self.reused = 0      # sprites reaproveitados
+        self.discarded = 0   # sprites devolvidos com o pool cheio
+
+    def acquire(self, *args, **kwargs) -> PooledSprite:
+        """Retorna um sprite pronto, reaproveitado se houver um livre."""
+        if self.free:
+            sprite = self.free.pop()
+            sprite._pooled = False
+            sprite.reset(*args, **kwargs)
+            self.reused += 1
+            return sprite
+        sprite = self.factory(*args, **kwargs)
+        sprite._pool = self
+        self.created += 1
+        return sprite
+
+    def release(self, sprite: PooledSprite):
+        """Devolve um sprite morto (chamado por PooledSprite.kill)."""
+        if len(self.free) >= self.max_free:
+            self.discarded += 1
+            return
+        sprite._pooled = True
+        self.free.append(sprite)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração dos acquire() atendidos com um sprite reaproveitado."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "free": len(self.free),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def release_group(group):
+    """Esvazia um grupo devolvendo os sprites aos pools (em vez de group.empty())."""
+    for sprite in group.sprites():
+        sprite.kill()
@@ -1,8 +1,35 @@
 import sys, os
+import argparse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from core.game import run_game
-from scenes.game_scene import GameScene
+from core.startup import startup
 
 if __name__ == "__main__":
-    run_game(800, 600, 60, lambda: GameScene(level=1))
+    parser = argparse.ArgumentParser(description="Dona Neide: Manhã do Caos")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava a sessão em um replay")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="reproduz um replay gravado")
+    parser.add_argument("--seed", type=int, default=None, help="semente do RNG ao gravar")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="mede imports e inicialização até o primeiro frame")
+    args = parser.parse_args()
+    if args.startup_report:
+        startup.enable()
+
+    with startup.phase("import core.game"):
+        from core.game import run_game
+
+    recorder = replay = None
+    if args.record or args.replay:
+        # Replays usam o GameScene do novogame: só ele salva keyframes (capture_state)
+        with startup.phase("import scenes.novogame_scene"):
+            from scenes.novogame_scene import GameScene
+        from core.replay import ReplayRecorder, ReplayPlayer
+        if args.replay:
+            replay = ReplayPlayer(args.replay)
+        else:
+            recorder = ReplayRecorder(args.record, seed=args.seed)
+    else:
+        with startup.phase("import scenes.game_scene"):
+            from scenes.game_scene import GameScene
+
+    run_game(800, 600, 60, lambda: GameScene(level=1), recorder=recorder, replay=replay)
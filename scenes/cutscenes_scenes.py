@@ -1,6 +1,8 @@
 import pygame, os
-from assets.loader import load_image, load_sound
-from core.config import WIDTH, HEIGHT
+from assets.loader import load_sound, asset_exists
+from assets.sequence import FrameStream
+from core.config import WIDTH, HEIGHT, CUTSCENE_SYNC_TOLERANCE
+from core.media_clock import MediaClock, SyncStats
 from scenes.game_scene import GameScene  # para voltar ao jogo
 
 class CutsceneScene:
@@ -8,24 +10,24 @@ class CutsceneScene:
         self.next_scene = self
         # Pasta de frames: assets/cutscenes/level{level}/
         folder = os.path.join("assets","cutscenes",f"level{level}")
-        # Carregar frames
-        self.frames = []
+        # Frames são decodificados aos poucos, numa janela à frente da exibição
+        paths = []
         if os.path.isdir(folder):
             for f in sorted(os.listdir(folder)):
                 if f.lower().endswith((".png",".jpg","bmp")):
-                    path = os.path.join(folder, f)
-                    img = load_image(path, (WIDTH, HEIGHT))
-                    self.frames.append(img)
-        # Carregar áudio da cutscene
+                    paths.append(os.path.join(folder, f))
+        self.frames = FrameStream(paths, (WIDTH, HEIGHT))
+        self.current_frame = None
+        # Carregar áudio da cutscene (toca quando os primeiros frames ficarem prontos)
         audio_path = os.path.join("assets","cutscenes",f"level{level}", "audio.wav")
-        if os.path.exists(audio_path):
+        if asset_exists(audio_path):
             self.cutscene_sound = load_sound(audio_path)
-            if self.cutscene_sound:
-                self.cutscene_sound.play()
         else:
             self.cutscene_sound = None
-        self.index = 0
-        self.timer = 0.0
+        # O áudio dita o tempo: os frames seguem a posição dele, não o dt
+        self.clock = MediaClock(self.cutscene_sound)
+        self.sync = SyncStats()
+        self.index = -1  # frame exibido
         self.frame_rate = 1/30  # 30 FPS; ajuste se necessário
         self.next_level = next_level
         # Permitir pular cutscene
@@ -37,28 +39,50 @@ class CutsceneScene:
                 # Tecla qualquer pula cutscene
                 self.skip = True
 
+    def finish(self):
+        """Para o áudio, libera os frames e vai para o próximo nível."""
+        self.clock.stop()
+        self.frames.close()
+        if self.sync.shown:
+            print(f"Cutscene: {self.sync.summary()}")
+        self.next_scene = GameScene(self.next_level)
+
     def update(self, dt):
-        if self.skip:
-            # parar áudio e ir para o próximo nível
-            if self.cutscene_sound: self.cutscene_sound.stop()
-            self.next_scene = GameScene(self.next_level)
+        if self.skip or len(self.frames) == 0:
+            # pulada ou sem frames: vai direto para o próximo nível
+            self.finish()
+            return
+        if not self.clock.started:
+            # Começa assim que a janela inicial estiver decodificada
+            if not self.frames.ready():
+                return
+            self.clock.start()
+        now = self.clock.time()
+        target = int(now / self.frame_rate)
+        if target >= len(self.frames):
+            # fim da cutscene
+            self.finish()
+            return
+        if target <= self.index:
             return
-        if not self.frames:
-            # sem frames, pula direto
-            self.next_scene = GameScene(self.next_level)
+        # O próximo frame ainda serve se não estiver atrasado além da tolerância;
+        # senão pula direto para o frame do instante atual do áudio
+        index = self.index + 1
+        if now - index * self.frame_rate > CUTSCENE_SYNC_TOLERANCE:
+            index = target
+        frame = self.frames.get(index)
+        if frame is None:
+            # Ainda não decodificado: segura o frame anterior
+            self.sync.held += 1
             return
-        self.timer += dt
-        if self.timer >= self.frame_rate:
-            self.timer -= self.frame_rate
-            self.index += 1
-            if self.index >= len(self.frames):
-                # fim da cutscene
-                if self.cutscene_sound: self.cutscene_sound.stop()
-                self.next_scene = GameScene(self.next_level)
+        self.sync.dropped += index - self.index - 1
+        self.sync.frame_shown(index * self.frame_rate, now)
+        self.index = index
+        self.current_frame = frame
 
     def render(self, screen):
-        if self.frames and self.index < len(self.frames):
-            screen.blit(self.frames[self.index], (0, 0))
+        if self.current_frame is not None:
+            screen.blit(self.current_frame, (0, 0))
         else:
             # tela preta se nada para mostrar
             screen.fill((0,0,0))
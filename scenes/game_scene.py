@@ -2,19 +2,26 @@
 import pygame, os, random
 from core.config import WIDTH, HEIGHT
 from entities.dona_neide import DonaNeide
-from entities.item import Item
+from entities.item import item_pool
+from entities.pool import release_group
+from core.spatial_hash import SpatialGroup, collide
+from core.collision import precompute_shapes
 from ui.hud import draw_hud
-from assets.loader import load_image, load_sound, load_music
+from assets.loader import load_image, load_sound, load_music, asset_exists
+from assets.atlas import sprite_atlas
 from entities.entregador_temporal import EntregadorTemporal
 from entities.CaixaMissil import CaixaMissil
+from core.timestep import store_previous_positions, interpolated_topleft, draw_interpolated
+from core.dirty_rects import DirtyRectRenderer
 
 class GameScene:
     def __init__(self, level=1):
         self.next_scene = self
+        self.dirty_rects = DirtyRectRenderer((WIDTH, HEIGHT))
 
         # Background fixo
         bg_path = os.path.join("assets", "images", "fundos", "cozinha.png")
-        if os.path.exists(bg_path):
+        if asset_exists(bg_path):
             self.background = load_image(bg_path, (WIDTH, HEIGHT))
         else:
             self.background = pygame.Surface((WIDTH, HEIGHT))
@@ -23,10 +30,12 @@ class GameScene:
         # Carrega Dona Neide e escudo
         neide_path = os.path.join("assets", "images", "personagens", "neide_img.png")
         shield_path = os.path.join("assets", "images", "efeitos", "veia_panescudo.png")
-        neide_img = load_image(neide_path, (64, 64)) if os.path.exists(neide_path) else self.placeholder_surface((64, 64), (255, 200, 200))
-        shield_img = load_image(shield_path, (64, 64)) if os.path.exists(shield_path) else None
+        neide_img = load_image(neide_path, (64, 64)) if asset_exists(neide_path) else self.placeholder_surface((64, 64), (255, 200, 200))
+        shield_img = load_image(shield_path, (64, 64)) if asset_exists(shield_path) else None
         self.player = DonaNeide(neide_img, shield_img)
         self.player_group = pygame.sprite.GroupSingle(self.player)
+        # Máscaras de colisão calculadas uma vez, no carregamento
+        precompute_shapes(neide_img, shield_img)
 
         # Definição de itens
         self.item_definitions = {
@@ -39,8 +48,12 @@ class GameScene:
         self.item_images = {}
         for tipo, data in self.item_definitions.items():
             path = os.path.join("assets", "images", "itens", data["filename"])
-            img = load_image(path, data["size"]) if os.path.exists(path) else self.placeholder_surface(data["size"], (255,255,0))
+            img = load_image(path, data["size"]) if asset_exists(path) else self.placeholder_surface(data["size"], (255,255,0))
             self.item_images[tipo] = {"image": img, "valor": data["valor"], "efeito": data["efeito"]}
+        sprite_atlas.add_many({f"game/item_{tipo}": data["image"] for tipo, data in self.item_images.items()})
+        for tipo, data in self.item_images.items():
+            data["image"] = sprite_atlas.get(f"game/item_{tipo}")
+        precompute_shapes(*(data["image"] for data in self.item_images.values()))
 
         # Configurações de nível
         self.level = level
@@ -59,21 +72,18 @@ class GameScene:
 
         # Sons
         audio_folder = os.path.join("assets","audio")
-        self.sfx_collect   = load_sound(os.path.join(audio_folder,"catch.wav")) or load_sound(os.path.join(audio_folder,"catch.flac"))
-        self.sfx_explosion = load_sound(os.path.join(audio_folder,"explosions.wav"))
-        self.sfx_hit       = load_sound(os.path.join(audio_folder,"hit.wav"))
-        self.sfx_lose_life = load_sound(os.path.join(audio_folder,"lose_life.wav"))
-        self.sfx_missile   = load_sound(os.path.join(audio_folder,"missile_launch.wav"))
-        self.sfx_shield    = load_sound(os.path.join(audio_folder,"shield.wav"))
-        self.sfx_shot      = load_sound(os.path.join(audio_folder,"shot.wav"))
-        self.sfx_levelup   = load_sound(os.path.join(audio_folder,"levelup.wav"))
-        for snd in [self.sfx_collect,self.sfx_explosion,self.sfx_hit,self.sfx_lose_life,self.sfx_missile,self.sfx_shield,self.sfx_shot,self.sfx_levelup]:
-            if snd: snd.set_volume(0.7)
-        if self.sfx_lose_life: self.sfx_lose_life.set_volume(0.8)
-        if self.sfx_missile:   self.sfx_missile.set_volume(0.6)
+        # Volume vai no load_sound: sons em cache são compartilhados por (caminho, volume)
+        self.sfx_collect   = load_sound(os.path.join(audio_folder,"catch.wav"), 0.7) or load_sound(os.path.join(audio_folder,"catch.flac"), 0.7)
+        self.sfx_explosion = load_sound(os.path.join(audio_folder,"explosions.wav"), 0.7)
+        self.sfx_hit       = load_sound(os.path.join(audio_folder,"hit.wav"), 0.7)
+        self.sfx_lose_life = load_sound(os.path.join(audio_folder,"lose_life.wav"), 0.8)
+        self.sfx_missile   = load_sound(os.path.join(audio_folder,"missile_launch.wav"), 0.6)
+        self.sfx_shield    = load_sound(os.path.join(audio_folder,"shield.wav"), 0.7)
+        self.sfx_shot      = load_sound(os.path.join(audio_folder,"shot.wav"), 0.7)
+        self.sfx_levelup   = load_sound(os.path.join(audio_folder,"levelup.wav"), 0.7)
 
         # Inicialização
-        self.items = pygame.sprite.Group()
+        self.items = SpatialGroup()
         self.load_level(self.level)
         self.play_level_music(self.level)
         self.in_transition = True
@@ -89,13 +99,14 @@ class GameScene:
         self.max_items      = cfg.get("max_items",5)
         self.speed_multiplier = cfg.get("speed_multiplier",1.0)
         self.spawn_timer    = 0.0
-        self.items.empty()
+        release_group(self.items)
         # Chefão nível 4
         if level_num==4:
             boss_img    = load_image("assets/images/chefes/entregador_temporal.png",(100,80))
             missile_img = load_image("assets/images/efeitos/caixa_missil.png",(40,40))
             self.boss     = EntregadorTemporal(boss_img,missile_img,pygame.Rect(0,0,WIDTH,HEIGHT),target=self.player)
-            self.missiles = pygame.sprite.Group()
+            self.missiles = SpatialGroup()
+            precompute_shapes(missile_img)
         else:
             self.boss     = None
             self.missiles = None
@@ -114,7 +125,7 @@ class GameScene:
         self.play_level_music(new_level)
         from core.video_player import play_cutscene_fullscreen
         video = os.path.join("assets","cutscenes",f"nivel_{self.level}_to_{new_level}.mp4")
-        if os.path.exists(video): play_cutscene_fullscreen(video,(WIDTH,HEIGHT))
+        if asset_exists(video): play_cutscene_fullscreen(video,(WIDTH,HEIGHT))
         self.level=new_level; self.load_level(new_level)
         self.in_transition=True; self.transition_timer=0.0
         self.play_level_music(new_level)
@@ -130,6 +141,11 @@ class GameScene:
                     if self.sfx_shield:
                         self.sfx_shield.play()
 
+    def fixed_update(self, dt):
+        # Guarda posições do tick anterior para a interpolação no render
+        store_previous_positions(self.player, self.items, self.boss, self.missiles)
+        self.update(dt)
+
     def update(self, dt):
         if self.in_transition:
             self.transition_timer += dt
@@ -149,7 +165,7 @@ class GameScene:
                 if self.sfx_missile: self.sfx_missile.play()
             # Colisões com escudo
             if self.player.shield_active:
-                hits = pygame.sprite.spritecollide(self.player, self.missiles, True)
+                hits = collide(self.player, self.missiles, True, pixel_perfect=True)
                 if hits:
                     self.boss.register_hit()
                     if self.sfx_shield: self.sfx_shield.play()
@@ -168,11 +184,11 @@ class GameScene:
             tipo = random.choice(tipos); d = self.item_images[tipo]
             base = (150,250); mult = self.speed_multiplier
             speed_range = (int(base[0]*mult), int(base[1]*mult))
-            it = Item(image=d["image"], tipo=tipo, valor=d["valor"], efeito=d["efeito"], speed_range=speed_range)
+            it = item_pool.acquire(image=d["image"], tipo=tipo, valor=d["valor"], efeito=d["efeito"], speed_range=speed_range)
             self.items.add(it)
 
         # Colisões itens
-        hits = pygame.sprite.spritecollide(self.player, self.items, True)
+        hits = collide(self.player, self.items, True, pixel_perfect=True)
         for item in hits:
             if item.efeito == "escorregar":
                 self.player.escorregar()
@@ -190,23 +206,28 @@ class GameScene:
             if need and self.player.pontos >= need:
                 self.start_level_transition(self.level+1)
 
-    def render(self, screen):
-        screen.blit(self.background, (0,0))
+    def render(self, screen, alpha=1.0):
+        # Transição usa overlay de tela cheia: frame completo
+        if self.in_transition:
+            self.dirty_rects.request_full_redraw()
+        self.dirty_rects.begin(screen, self.background)
+        add = self.dirty_rects.add
         if not self.in_transition:
-            self.items.draw(screen)
-            self.player.draw(screen)
+            add(draw_interpolated(screen, self.items, alpha))
+            add(self.player.draw(screen, interpolated_topleft(self.player, alpha)))
             # Chefão nível 4
             if self.level == 4 and self.boss and not self.boss.dead:
-                screen.blit(self.boss.image, self.boss.rect)
-                self.missiles.draw(screen)
-                pygame.draw.rect(screen, (200,0,0), (WIDTH//2-100, 30, 200, 20))
+                add(screen.blit(self.boss.image, interpolated_topleft(self.boss, alpha)))
+                add(draw_interpolated(screen, self.missiles, alpha))
+                add(pygame.draw.rect(screen, (200,0,0), (WIDTH//2-100, 30, 200, 20)))
                 v = 1 - self.boss.hits_taken / self.boss.max_hits
-                pygame.draw.rect(screen, (0,200,0), (WIDTH//2-100, 30, int(200*v), 20))
+                add(pygame.draw.rect(screen, (0,200,0), (WIDTH//2-100, 30, int(200*v), 20)))
             # HUD com indicador de escudo pronto
             shield_ready = (self.player.cooldown_timer <= 0.0)
-            draw_hud(screen, self.player.pontos, self.player.vida, shield_ready)
+            add(draw_hud(screen, self.player.pontos, self.player.vida, shield_ready))
         else:
-            overlay = pygame.Surface((WIDTH,HEIGHT)); overlay.set_alpha(180); overlay.fill((0,0,0)); screen.blit(overlay,(0,0))
+            overlay = pygame.Surface((WIDTH,HEIGHT)); overlay.set_alpha(180); overlay.fill((0,0,0)); add(screen.blit(overlay,(0,0)))
             font = pygame.font.SysFont(None,72)
             text = font.render(f"Nível {self.level}", True, (255,255,255))
-            rect = text.get_rect(center=(WIDTH//2, HEIGHT//2)); screen.blit(text, rect)
\ No newline at end of file
+            rect = text.get_rect(center=(WIDTH//2, HEIGHT//2)); add(screen.blit(text, rect))
+        return self.dirty_rects.finish()
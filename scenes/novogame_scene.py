@@ -4,15 +4,29 @@ import random
 import math
 import json
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
-from core.config import WIDTH, HEIGHT
+from core.config import WIDTH, HEIGHT, PRELOAD_PROGRESS
 from entities.dona_neide import DonaNeide
-from entities.item import Item
+from entities.item import item_pool
 from ui.hud import draw_hud
-from assets.loader import load_image, load_sound, load_music, create_placeholder_surface
+from assets.loader import load_image, load_sound, create_placeholder_surface, asset_exists
+from assets.preloader import LevelPreloader
+from assets.parallel import ParallelLoader
+from assets.atlas import sprite_atlas
+from assets.animation import load_animation
 from entities.entregador_temporal import EntregadorTemporal
-from entities.CaixaMissil import CaixaMissil
+from entities.CaixaMissil import missile_pool
+from entities.pool import release_group
+from core.timestep import store_previous_positions, interpolated_topleft, draw_interpolated
+from core.tracing import tracer
+from core.dirty_rects import DirtyRectRenderer
+from core.voice_manager import VoiceManager
+from core.music import music_controller
+from core.particles import ParticleSystem
+from core.quality import quality
+from core.spatial_hash import SpatialGroup, collide
+from core.collision import precompute_shapes
 
 class GameState(Enum):
     """Estados possíveis do jogo para melhor controle de fluxo."""
@@ -23,109 +37,6 @@ class GameState(Enum):
     GAME_OVER = "game_over"
     VICTORY = "victory"
 
-class Particle:
-    """Classe individual para uma partícula com física simples."""
-    
-    def __init__(self, x: float, y: float, vx: float, vy: float, 
-                 color: Tuple[int, int, int], life: float, size: int = 3):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-        self.gravity = 200.0
-    
-    def update(self, dt: float) -> bool:
-        """Atualiza a partícula. Retorna False se deve ser removida."""
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += self.gravity * dt
-        self.life -= dt
-        return self.life > 0
-    
-    def render(self, screen: pygame.Surface):
-        """Renderiza a partícula com fade baseado na vida."""
-        if self.life <= 0:
-            return
-        
-        alpha = int(255 * (self.life / self.max_life))
-        current_size = max(1, int(self.size * (self.life / self.max_life)))
-        
-        # Cria surface temporária com alpha
-        temp_surf = pygame.Surface((current_size * 2, current_size * 2))
-        temp_surf.set_alpha(alpha)
-        temp_surf.fill(self.color)
-        
-        screen.blit(temp_surf, (int(self.x - current_size), int(self.y - current_size)))
-
-class ParticleSystem:
-    """Sistema avançado de partículas para efeitos visuais impressionantes."""
-    
-    def __init__(self):
-        self.particles: List[Particle] = []
-        self.max_particles = 200  # Limite para performance
-    
-    def add_explosion(self, pos: Tuple[int, int], color: Tuple[int, int, int] = (255, 255, 0),
-                     particle_count: int = 15, intensity: float = 1.0):
-        """Adiciona uma explosão de partículas com física realista."""
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150) * intensity
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - random.uniform(20, 50)  # Bias para cima
-            
-            life = random.uniform(0.5, 1.5)
-            size = random.randint(2, 5)
-            
-            # Variação sutil na cor
-            r = max(0, min(255, color[0] + random.randint(-30, 30)))
-            g = max(0, min(255, color[1] + random.randint(-30, 30)))
-            b = max(0, min(255, color[2] + random.randint(-30, 30)))
-            
-            particle = Particle(pos[0], pos[1], vx, vy, (r, g, b), life, size)
-            self.particles.append(particle)
-    
-    def add_collect_effect(self, pos: Tuple[int, int], color: Tuple[int, int, int] = (0, 255, 0)):
-        """Efeito especial para coleta de itens."""
-        for i in range(8):
-            angle = (i / 8) * 2 * math.pi
-            speed = 80
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            particle = Particle(pos[0], pos[1], vx, vy, color, 0.8, 4)
-            self.particles.append(particle)
-    
-    def add_trail(self, pos: Tuple[int, int], velocity: Tuple[float, float], 
-                  color: Tuple[int, int, int] = (255, 255, 255)):
-        """Adiciona rastro de movimento."""
-        # Adiciona partícula de rastro baseada na velocidade
-        vx = -velocity[0] * 0.3 + random.uniform(-20, 20)
-        vy = -velocity[1] * 0.3 + random.uniform(-20, 20)
-        
-        particle = Particle(pos[0], pos[1], vx, vy, color, 0.3, 2)
-        self.particles.append(particle)
-    
-    def update(self, dt: float):
-        """Atualiza todas as partículas e remove as mortas."""
-        self.particles = [p for p in self.particles if p.update(dt)]
-        
-        # Limita número de partículas para performance
-        if len(self.particles) > self.max_particles:
-            self.particles = self.particles[-self.max_particles:]
-    
-    def render(self, screen: pygame.Surface):
-        """Renderiza todas as partículas ativas."""
-        for particle in self.particles:
-            particle.render(screen)
-    
-    def clear(self):
-        """Limpa todas as partículas."""
-        self.particles.clear()
-
 class PowerUpManager:
     """Gerenciador de power-ups temporários para adicionar depth ao gameplay."""
     
@@ -230,6 +141,101 @@ class GameScene:
     Inclui sistemas avançados de partículas, combos, power-ups e estatísticas.
     """
     
+    # Atributos salvos nos keyframes de replay (capture_state/restore_state)
+    _STATE_FIELDS = (
+        "in_transition", "transition_timer", "transition_type", "current_bg",
+        "spawn_timer", "camera_shake", "time_scale", "screen_flash",
+        "difficulty_scaling", "tutorial_message", "tutorial_timer",
+        "auto_save_timer", "checkpoint_data", "total_items_spawned", "frame_count",
+    )
+    _PLAYER_FIELDS = (
+        "vida", "pontos", "speed", "boost_timer", "boost_multiplier", "shield_active",
+        "shield_timer", "cooldown_timer", "slip_timer", "can_move", "dt",
+    )
+    _BOSS_FIELDS = ("direction", "speed", "missile_timer", "missile_interval", "hits_taken", "dead")
+    
+    # Assets carregados no construtor (pré-carregados em paralelo por _prefetch_assets)
+    _BACKGROUND_VARIANTS = {
+        "cozinha": "fundos/cozinha.png",
+        "sala": "fundos/sala.png", 
+        "quintal": "fundos/quintal.png",
+        "espacial": "fundos/espaco.png"
+    }
+    _PLAYER_IMAGES = {
+        "neide": ("personagens/neide_img.png", (64, 64)),
+        "shield": ("efeitos/veia_panescudo.png", (64, 64)),
+    }
+    _ITEM_DEFINITIONS = {
+        "meia": {
+            "filename": "item_0.png", "valor": 1, "size": (100, 100),
+            "efeito": None, "weight": 35, "particles": True,
+            "description": "Meia básica - 1 ponto"
+        },
+        "cubo": {
+            "filename": "item_1.png", "valor": 10, "size": (100, 100),
+            "efeito": None, "weight": 20, "particles": True,
+            "description": "Cubo valioso - 10 pontos"
+        },
+        "caneca": {
+            "filename": "item_2.png", "valor": 5, "size": (68, 68),
+            "efeito": None, "weight": 25, "particles": True,
+            "description": "Caneca útil - 5 pontos"
+        },
+        "banana": {
+            "filename": "banana.png", "valor": -1, "size": (40, 40),
+            "efeito": "escorregar", "weight": 12, "particles": False,
+            "description": "Banana escorregadia - cuidado!"
+        },
+        "toalha": {
+            "filename": "item_3.png", "valor": 0, "size": (38, 38),
+            "efeito": "boost", "weight": 8, "particles": True,
+            "description": "Toalha mágica - velocidade aumentada"
+        },
+        # Novos itens especiais
+        "estrela": {
+            "filename": "estrela.png", "valor": 20, "size": (50, 50),
+            "efeito": "double_points", "weight": 3, "particles": True,
+            "description": "Estrela rara - pontos dobrados!"
+        },
+        "relógio": {
+            "filename": "relogio.png", "valor": 0, "size": (45, 45),
+            "efeito": "slow_motion", "weight": 2, "particles": True,
+            "description": "Relógio temporal - câmera lenta"
+        },
+        "coração": {
+            "filename": "coracao.png", "valor": 0, "size": (40, 40),
+            "efeito": "heal", "weight": 4, "particles": True,
+            "description": "Coração curativo - restaura vida"
+        }
+    }
+    # Sons por categoria: atributo -> (arquivo, volume)
+    _SOUND_CATEGORIES = {
+        "ui": {
+            "sfx_collect": ("catch.wav", 0.6),
+            "sfx_levelup": ("levelup.wav", 0.8),
+            "sfx_shield": ("shield.wav", 0.7),
+        },
+        "combat": {
+            "sfx_explosion": ("explosions.wav", 0.9),
+            "sfx_hit": ("hit.wav", 0.7),
+            "sfx_lose_life": ("lose_life.wav", 1.0),
+            "sfx_missile": ("missile_launch.wav", 0.8),
+            "sfx_shot": ("shot.wav", 0.7),
+        },
+        "special": {
+            "sfx_powerup": ("powerup.wav", 0.8),
+            "sfx_combo": ("combo.wav", 0.6),
+            "sfx_slow_motion": ("slow_motion.wav", 0.5),
+        }
+    }
+    # Prioridade de voz (padrão 1): sons críticos roubam canais dos comuns
+    _SOUND_PRIORITIES = {
+        "sfx_lose_life": 3,
+        "sfx_levelup": 2,
+        "sfx_explosion": 2,
+        "sfx_powerup": 2,
+    }
+    
     def __init__(self, level=1):
         """
         Inicializa uma nova cena de jogo com sistemas avançados.
@@ -239,12 +245,25 @@ class GameScene:
         """
         self.next_scene = self
         self.game_state = GameState.TRANSITIONING
+        self.dirty_rects = DirtyRectRenderer((WIDTH, HEIGHT))
+        # Nível precisa existir antes dos backgrounds (escolhidos por nível)
+        self.level = level
         
         # Sistemas avançados
         self.particle_system = ParticleSystem()
         self.powerup_manager = PowerUpManager()
         self.combo_system = ComboSystem()
         self.stats = GameStats()
+        self.preloader = LevelPreloader()
+        self._preload_requested = set()  # níveis já pedidos ao preloader
+        
+        # Sistema de mixagem dinâmica (usado no volume dos sons carregados)
+        self.master_volume = 1.0
+        self.sfx_volume = 1.0
+        self.music_volume = 0.7
+        
+        # Decodifica imagens e sons em paralelo; os _initialize_* só pegam o resultado
+        self._prefetch_assets()
         
         # Carrega background com variações por nível
         self._initialize_backgrounds()
@@ -257,9 +276,9 @@ class GameScene:
         
         # Configura áudio com mixagem profissional
         self._initialize_enhanced_audio()
+        self._prefetch_handles = {}
         
         # Configurações de progressão e dificuldade adaptativa
-        self.level = level
         self.max_level = 12  # Expandido para mais conteúdo
         self.points_to_next = {
             1: 10, 2: 25, 3: 50, 4: 140, 5: 200, 
@@ -269,7 +288,7 @@ class GameScene:
         self._setup_enhanced_level_configurations()
         
         # Inicializa estado do jogo com grupos organizados
-        self.items = pygame.sprite.Group()
+        self.items = SpatialGroup()
         self.special_effects = pygame.sprite.Group()
         self.ui_elements = pygame.sprite.Group()
         
@@ -310,17 +329,10 @@ class GameScene:
     def _initialize_backgrounds(self):
         """Inicializa backgrounds variados baseados no nível atual."""
         self.backgrounds = {}
-        background_variants = {
-            "cozinha": "fundos/cozinha.png",
-            "sala": "fundos/sala.png", 
-            "quintal": "fundos/quintal.png",
-            "espacial": "fundos/espaco.png"
-        }
-        
         # Carrega todas as variações de background
-        for variant, filename in background_variants.items():
+        for variant, filename in self._BACKGROUND_VARIANTS.items():
             bg_path = os.path.join("assets", "images", filename)
-            bg_img = load_image(bg_path, (WIDTH, HEIGHT))
+            bg_img = self._prefetched_image(bg_path, (WIDTH, HEIGHT))
             if bg_img is None:
                 # Cria background procedural baseado no tema
                 bg_img = self._create_procedural_background(variant)
@@ -381,20 +393,22 @@ class GameScene:
 
     def _initialize_player(self):
         """Inicializa o personagem principal com tratamento robusto de erros."""
-        neide_path = os.path.join("assets", "images", "personagens", "neide_img.png")
-        shield_path = os.path.join("assets", "images", "efeitos", "veia_panescudo.png")
+        neide_file, neide_size = self._PLAYER_IMAGES["neide"]
+        shield_file, shield_size = self._PLAYER_IMAGES["shield"]
         
         # Carrega imagens com fallback melhorado
-        neide_img = load_image(neide_path, (64, 64))
+        neide_img = self._prefetched_image(os.path.join("assets", "images", neide_file), neide_size)
         if neide_img is None:
             neide_img = self._create_character_placeholder((64, 64))
             
-        shield_img = load_image(shield_path, (64, 64))
+        shield_img = self._prefetched_image(os.path.join("assets", "images", shield_file), shield_size)
         if shield_img is None:
             shield_img = self._create_shield_placeholder((64, 64))
         
         self.player = DonaNeide(neide_img, shield_img)
         self.player_group = pygame.sprite.GroupSingle(self.player)
+        # Máscaras de colisão calculadas uma vez, no carregamento
+        precompute_shapes(neide_img, shield_img)
 
     def _create_character_placeholder(self, size: Tuple[int, int]) -> pygame.Surface:
         """Cria placeholder visual melhorado para o personagem."""
@@ -424,55 +438,13 @@ class GameScene:
 
     def _initialize_enhanced_item_system(self):
         """Configura sistema de itens expandido com novos tipos e mecânicas."""
-        self.item_definitions = {
-            "meia": {
-                "filename": "item_0.png", "valor": 1, "size": (100, 100),
-                "efeito": None, "weight": 35, "particles": True,
-                "description": "Meia básica - 1 ponto"
-            },
-            "cubo": {
-                "filename": "item_1.png", "valor": 10, "size": (100, 100),
-                "efeito": None, "weight": 20, "particles": True,
-                "description": "Cubo valioso - 10 pontos"
-            },
-            "caneca": {
-                "filename": "item_2.png", "valor": 5, "size": (68, 68),
-                "efeito": None, "weight": 25, "particles": True,
-                "description": "Caneca útil - 5 pontos"
-            },
-            "banana": {
-                "filename": "banana.png", "valor": -1, "size": (40, 40),
-                "efeito": "escorregar", "weight": 12, "particles": False,
-                "description": "Banana escorregadia - cuidado!"
-            },
-            "toalha": {
-                "filename": "item_3.png", "valor": 0, "size": (38, 38),
-                "efeito": "boost", "weight": 8, "particles": True,
-                "description": "Toalha mágica - velocidade aumentada"
-            },
-            # Novos itens especiais
-            "estrela": {
-                "filename": "estrela.png", "valor": 20, "size": (50, 50),
-                "efeito": "double_points", "weight": 3, "particles": True,
-                "description": "Estrela rara - pontos dobrados!"
-            },
-            "relógio": {
-                "filename": "relogio.png", "valor": 0, "size": (45, 45),
-                "efeito": "slow_motion", "weight": 2, "particles": True,
-                "description": "Relógio temporal - câmera lenta"
-            },
-            "coração": {
-                "filename": "coracao.png", "valor": 0, "size": (40, 40),
-                "efeito": "heal", "weight": 4, "particles": True,
-                "description": "Coração curativo - restaura vida"
-            }
-        }
+        self.item_definitions = self._ITEM_DEFINITIONS
         
         # Carrega todas as imagens de itens com placeholders melhorados
         self.item_images = {}
         for tipo, data in self.item_definitions.items():
             path = os.path.join("assets", "images", "itens", data["filename"])
-            img = load_image(path, data["size"])
+            img = self._prefetched_image(path, data["size"])
             if img is None:
                 img = self._create_item_placeholder(tipo, data["size"])
             
@@ -484,6 +456,12 @@ class GameScene:
                 "particles": data.get("particles", False),
                 "description": data.get("description", "")
             }
+        
+        # Itens desenhados a partir do atlas: uma única textura para todos
+        sprite_atlas.add_many({f"novogame/item_{tipo}": data["image"] for tipo, data in self.item_images.items()})
+        for tipo, data in self.item_images.items():
+            data["image"] = sprite_atlas.get(f"novogame/item_{tipo}")
+        precompute_shapes(*(data["image"] for data in self.item_images.values()))
 
     def _create_item_placeholder(self, item_type: str, size: Tuple[int, int]) -> pygame.Surface:
         """Cria placeholders visuais distintos para cada tipo de item."""
@@ -531,80 +509,95 @@ class GameScene:
         """Sistema de áudio avançado com mixagem dinâmica e efeitos espaciais."""
         audio_folder = os.path.join("assets", "audio")
         
-        # Configuração avançada de sons com categorias e volumes otimizados
-        sound_categories = {
-            "ui": {
-                "sfx_collect": ("catch.wav", 0.6),
-                "sfx_levelup": ("levelup.wav", 0.8),
-                "sfx_shield": ("shield.wav", 0.7),
-            },
-            "combat": {
-                "sfx_explosion": ("explosions.wav", 0.9),
-                "sfx_hit": ("hit.wav", 0.7),
-                "sfx_lose_life": ("lose_life.wav", 1.0),
-                "sfx_missile": ("missile_launch.wav", 0.8),
-                "sfx_shot": ("shot.wav", 0.7),
-            },
-            "special": {
-                "sfx_powerup": ("powerup.wav", 0.8),
-                "sfx_combo": ("combo.wav", 0.6),
-                "sfx_slow_motion": ("slow_motion.wav", 0.5),
-            }
-        }
-        
         # Carrega todos os sons com fallback inteligente para múltiplos formatos
         self.audio_channels = {}
-        for category, sounds in sound_categories.items():
+        for category, sounds in self._SOUND_CATEGORIES.items():
             self.audio_channels[category] = {}
             for attr_name, (filename, volume) in sounds.items():
                 sound = self._load_sound_with_fallback(audio_folder, filename, volume)
                 setattr(self, attr_name, sound)
                 self.audio_channels[category][attr_name] = sound
-
-        # Sistema de mixagem dinâmica
-        self.master_volume = 1.0
-        self.sfx_volume = 1.0
-        self.music_volume = 0.7
         
-        # Canal dedicado para efeitos críticos
-        try:
-            pygame.mixer.set_reserved(1)  # Reserva canal 0 para sons importantes
-        except pygame.error:
-            pass
+        # Pools de canais por categoria, com prioridade e roubo de voz
+        self.voices = VoiceManager()
+        self._sound_category = {attr_name: category
+                                for category, sounds in self._SOUND_CATEGORIES.items()
+                                for attr_name in sounds}
 
-    def _load_sound_with_fallback(self, base_path: str, filename: str, volume: float) -> Optional[pygame.mixer.Sound]:
-        """Carrega som com múltiplos formatos de fallback e tratamento robusto."""
-        sound = None
+    def _play_sfx(self, attr_name: str, volume: float = 1.0):
+        """Pede um efeito sonoro ao VoiceManager (tocado no fim do tick)."""
+        self.voices.play(getattr(self, attr_name, None), self._sound_category.get(attr_name, "ui"),
+                         self._SOUND_PRIORITIES.get(attr_name, 1), volume)
+
+    def _resolve_sound_path(self, base_path: str, filename: str) -> Optional[str]:
+        """Arquivo de som existente: o nome exato ou o mesmo nome em outro formato."""
         # Lista de formatos em ordem de preferência (qualidade vs compatibilidade)
         extensions = [".wav", ".ogg", ".flac", ".mp3"]
         
-        # Tenta carregar o arquivo exato primeiro
+        # Tenta o arquivo exato primeiro
         full_path = os.path.join(base_path, filename)
-        if os.path.exists(full_path):
-            try:
-                sound = load_sound(full_path)
-                if sound:
-                    sound.set_volume(volume * self.sfx_volume * self.master_volume)
-                return sound
-            except pygame.error:
-                pass
+        if asset_exists(full_path):
+            return full_path
         
         # Fallback: tenta diferentes extensões
         base_name = os.path.splitext(filename)[0]
         for ext in extensions:
             try_path = os.path.join(base_path, base_name + ext)
-            if os.path.exists(try_path):
-                try:
-                    sound = load_sound(try_path)
-                    if sound:
-                        sound.set_volume(volume * self.sfx_volume * self.master_volume)
-                    return sound
-                except pygame.error:
-                    continue
-        
-        # Se não conseguiu carregar nenhum som, retorna None silenciosamente
+            if asset_exists(try_path):
+                return try_path
         return None
 
+    def _load_sound_with_fallback(self, base_path: str, filename: str, volume: float) -> Optional[pygame.mixer.Sound]:
+        """Carrega som com múltiplos formatos de fallback e tratamento robusto."""
+        path = self._resolve_sound_path(base_path, filename)
+        if path is None:
+            # Se não encontrou nenhum formato, retorna None silenciosamente
+            return None
+        
+        volume = volume * self.sfx_volume * self.master_volume
+        handle = self._prefetch_handles.pop(("sound", path, volume), None)
+        if handle is not None:
+            return handle.result()
+        try:
+            return load_sound(path, volume)
+        except pygame.error:
+            return None
+
+    def _prefetch_assets(self):
+        """
+        Dispara no pool de threads a decodificação das imagens e sons usados
+        pelos _initialize_*. Cada um pega o seu com _prefetched_image ou
+        _load_sound_with_fallback e só espera pelo próprio asset.
+        """
+        loader = ParallelLoader()
+        images_folder = os.path.join("assets", "images")
+        images = [(os.path.join(images_folder, filename), (WIDTH, HEIGHT))
+                  for filename in self._BACKGROUND_VARIANTS.values()]
+        images += [(os.path.join(images_folder, filename), size)
+                   for filename, size in self._PLAYER_IMAGES.values()]
+        images += [(os.path.join(images_folder, "itens", data["filename"]), data["size"])
+                   for data in self._ITEM_DEFINITIONS.values()]
+        
+        self._prefetch_handles = {}
+        for path, size in images:
+            if asset_exists(path):
+                self._prefetch_handles[("image", path, size)] = loader.image(path, size)
+        
+        audio_folder = os.path.join("assets", "audio")
+        for sounds in self._SOUND_CATEGORIES.values():
+            for filename, volume in sounds.values():
+                path = self._resolve_sound_path(audio_folder, filename)
+                if path is not None:
+                    volume = volume * self.sfx_volume * self.master_volume
+                    self._prefetch_handles[("sound", path, volume)] = loader.sound(path, volume)
+
+    def _prefetched_image(self, path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Imagem pedida em _prefetch_assets (espera só por ela), ou carregada agora."""
+        handle = self._prefetch_handles.pop(("image", path, size), None)
+        if handle is not None:
+            return handle.result()
+        return load_image(path, size)
+
     def _setup_enhanced_level_configurations(self):
         """Configurações avançadas de níveis com progressão adaptativa."""
         self.level_configs = {
@@ -670,8 +663,14 @@ class GameScene:
             }
         }
 
-    def load_level(self, level_num: int):
-        """Carrega configurações específicas do nível com recursos avançados."""
+    def load_level(self, level_num: int, assets: Optional[Dict] = None):
+        """
+        Carrega configurações específicas do nível com recursos avançados.
+        
+        Args:
+            level_num: Número do nível
+            assets: Assets já decodificados pelo LevelPreloader (opcional)
+        """
         if level_num > self.max_level:
             level_num = self.max_level
         
@@ -690,11 +689,11 @@ class GameScene:
         
         # Reset do estado do jogo
         self.spawn_timer = 0.0
-        self.items.empty()
+        release_group(self.items)
         self.particle_system.clear()
         
         # Configura boss se necessário
-        self._setup_boss_for_level(level_num, config)
+        self._setup_boss_for_level(level_num, config, assets)
         
         # Aplica mecânicas especiais
         self._apply_special_mechanics(config["special_mechanics"])
@@ -703,34 +702,68 @@ class GameScene:
         self.combo_system = ComboSystem()
         self.powerup_manager = PowerUpManager()
 
-    def _setup_boss_for_level(self, level_num: int, config: Dict):
+    def _level_asset_spec(self, level_num: int) -> Dict:
+        """Lista os arquivos de que um nível precisa (usado também no pré-carregamento)."""
+        config = self.level_configs.get(level_num, self.level_configs[1])
+        images = {}
+        if config.get("boss") == "entregador_temporal":
+            images["boss"] = (os.path.join("assets", "images", "chefes", "entregador_temporal.png"), (100, 80))
+            images["missile"] = (os.path.join("assets", "images", "efeitos", "caixa_missil.png"), (40, 40))
+        return {
+            "images": images,
+            "music_path": os.path.join("assets", "audio", config.get("music", "background_music.mp3")),
+            "cutscene_path": os.path.join("assets", "cutscenes", f"nivel_{level_num - 1}_to_{level_num}.mp4"),
+        }
+
+    def _preload_level(self, level_num: int):
+        """Pede ao LevelPreloader os assets do nível em segundo plano (uma vez por nível)."""
+        if level_num > self.max_level or level_num in self._preload_requested:
+            return
+        self._preload_requested.add(level_num)
+        spec = self._level_asset_spec(level_num)
+        self.preloader.request(level_num, spec["images"], None, spec["cutscene_path"])
+        # A música é decodificada pelo MusicController, pronta para o crossfade
+        music_controller.prefetch(spec["music_path"])
+
+    def _level_image(self, name: str, spec: Dict, assets: Optional[Dict]) -> Optional[pygame.Surface]:
+        """Imagem do nível: pré-carregada se disponível, senão carregada agora."""
+        if assets is not None and name in assets["images"]:
+            return assets["images"][name]
+        path, size = spec["images"][name]
+        return load_image(path, size)
+
+    def _setup_boss_for_level(self, level_num: int, config: Dict, assets: Optional[Dict] = None):
         """Configura boss específico para o nível."""
         boss_type = config.get("boss")
         
         if boss_type == "entregador_temporal":
-            boss_img_path = os.path.join("assets", "images", "chefes", "entregador_temporal.png")
-            missile_img_path = os.path.join("assets", "images", "efeitos", "caixa_missil.png")
+            spec = self._level_asset_spec(level_num)
             
-            boss_img = load_image(boss_img_path, (100, 80))
+            boss_img = self._level_image("boss", spec, assets)
             if boss_img is None:
                 boss_img = self._create_boss_placeholder("entregador", (100, 80))
             
-            missile_img = load_image(missile_img_path, (40, 40))
+            missile_img = self._level_image("missile", spec, assets)
             if missile_img is None:
                 missile_img = self._create_missile_placeholder((40, 40))
+            sprite_atlas.add("novogame/missile", missile_img)
+            missile_img = sprite_atlas.get("novogame/missile")
             
             self.boss = EntregadorTemporal(
                 boss_img, missile_img, 
                 pygame.Rect(0, 0, WIDTH, HEIGHT), 
                 target=self.player
             )
-            self.missiles = pygame.sprite.Group()
+            self.missiles = SpatialGroup()
+            precompute_shapes(self.boss.missile_img)
             self.game_state = GameState.BOSS_FIGHT
             
         elif boss_type in ["mega_boss", "final_boss"]:
             # Placeholder para bosses futuros
             self.boss = self._create_advanced_boss(boss_type)
-            self.missiles = pygame.sprite.Group()
+            self.missiles = SpatialGroup()
+            if self.boss is not None:
+                precompute_shapes(self.boss.missile_img)
             self.game_state = GameState.BOSS_FIGHT
         else:
             self.boss = None
@@ -765,9 +798,26 @@ class GameScene:
         return surf
 
     def _create_advanced_boss(self, boss_type: str):
-        """Placeholder para bosses avançados futuros."""
-        # Implementação simplificada para bosses avançados
-        return None
+        """Bosses dos níveis avançados: o mega boss é o Fanhos, com projéteis animados."""
+        if boss_type != "mega_boss":
+            # Final boss ainda não implementado
+            return None
+        
+        boss_img = load_image(os.path.join("assets", "images", "chefes", "fanhos.png"), (110, 90))
+        if boss_img is None:
+            boss_img = self._create_boss_placeholder("fanhos", (110, 90))
+        
+        # GIF decodificado uma vez; todos os projéteis compartilham os frames
+        projectile = load_animation(os.path.join("assets", "images", "itens", "fanhos_proj.gif"), (40, 40))
+        if projectile is None:
+            projectile = self._create_missile_placeholder((40, 40))
+        
+        return EntregadorTemporal(
+            boss_img, projectile,
+            pygame.Rect(0, 0, WIDTH, HEIGHT),
+            target=self.player,
+            name="Fanhos"
+        )
 
     def _apply_special_mechanics(self, mechanics: List[str]):
         """Aplica mecânicas especiais do nível."""
@@ -791,23 +841,16 @@ class GameScene:
         self.tutorial_timer = 3.0  # Mostra por 3 segundos
 
     def play_level_music(self, level_num: int):
-        """Reproduz música apropriada para o nível."""
+        """Troca para a música do nível com crossfade, sem bloquear o frame."""
         config = self.level_configs.get(level_num, {})
         music_file = config.get("music", "background_music.mp3")
         
         audio_folder = os.path.join("assets", "audio")
         music_path = os.path.join(audio_folder, music_file)
         
-        try:
-            pygame.mixer.music.fadeout(500)
-        except:
-            pass
-        
-        if load_music(music_path):
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-            pygame.mixer.music.play(-1)
-        else:
-            pygame.mixer.music.stop()
+        # Decodificada em segundo plano; se ainda não estiver pronta, a atual segue tocando
+        music_controller.set_volume(self.music_volume * self.master_volume)
+        music_controller.play(music_path)
 
     def start_level_transition(self, new_level: int):
         """Inicia transição para novo nível com efeitos visuais."""
@@ -816,19 +859,22 @@ class GameScene:
             return
         
         # Toca som de level up
-        if self.sfx_levelup:
-            self.sfx_levelup.play()
+        self._play_sfx("sfx_levelup")
         
         # Salva estatísticas do nível
         self.stats.levels_completed += 1
         self.stats.max_combo = max(self.stats.max_combo, self.combo_system.max_combo)
         
+        # Assets do novo nível decodificados em segundo plano (None se não prontos)
+        assets = self.preloader.take(new_level)
+        
         # Reproduz cutscene se existir
-        self._play_cutscene_for_transition(self.level, new_level)
+        if assets is None or assets["cutscene_exists"]:
+            self._play_cutscene_for_transition(self.level, new_level)
         
         # Aplica configurações do novo nível
         self.level = new_level
-        self.load_level(new_level)
+        self.load_level(new_level, assets)
         self.play_level_music(new_level)
         
         # Configura transição visual
@@ -849,12 +895,12 @@ class GameScene:
         try:
             from core.video_player import play_cutscene_fullscreen
             cutscene_path = os.path.join("assets", "cutscenes", f"nivel_{from_level}_to_{to_level}.mp4")
-            if os.path.exists(cutscene_path):
+            if asset_exists(cutscene_path):
                 play_cutscene_fullscreen(cutscene_path, (WIDTH, HEIGHT))
         except ImportError:
             pass  # Módulo de vídeo não disponível
 
-    def process_input(self, events: List[pygame.event.Event], keys: pygame.key.ScalarKeyDict):
+    def process_input(self, events: List[pygame.event.Event], keys: pygame.key.ScancodeWrapper):
         """Processa entrada do usuário com controles avançados."""
         self.events = events
         self.keys = keys
@@ -881,8 +927,7 @@ class GameScene:
     def _activate_shield(self):
         """Ativa escudo do player com feedback audiovisual."""
         if not self.player.shield_active and self.player.cooldown_timer <= 0.0:
-            if self.sfx_shield:
-                self.sfx_shield.play()
+            self._play_sfx("sfx_shield")
             
             # Efeito visual de ativação do escudo
             pos = self.player.rect.center
@@ -895,15 +940,22 @@ class GameScene:
         """Alterna estado de pause."""
         if self.game_state == GameState.PLAYING:
             self.game_state = GameState.PAUSED
-            pygame.mixer.music.pause()
+            music_controller.pause()
         elif self.game_state == GameState.PAUSED:
             self.game_state = GameState.PLAYING
-            pygame.mixer.music.unpause()
+            music_controller.unpause()
 
     def _restart_game(self):
         """Reinicia o jogo do nível 1."""
         self.__init__(1)
 
+    def fixed_update(self, dt: float):
+        """Tick de passo fixo: guarda posições para interpolação e atualiza."""
+        store_previous_positions(self.player, self.items, self.boss, self.missiles)
+        self.update(dt)
+        # Sons pedidos neste tick: repetidos viram uma voz só
+        self.voices.flush()
+
     def update(self, dt: float):
         """Atualização principal do jogo com todos os sistemas."""
         # Atualiza sistemas independentes do estado
@@ -924,7 +976,8 @@ class GameScene:
     def _update_independent_systems(self, dt: float):
         """Atualiza sistemas que funcionam independente do estado."""
         # Sistema de partículas
-        self.particle_system.update(dt)
+        with tracer.span("ParticleSystem.update"):
+            self.particle_system.update(dt)
         
         # Power-ups
         self.powerup_manager.update(dt)
@@ -932,6 +985,9 @@ class GameScene:
         # Combo system
         self.combo_system.update(dt)
         
+        # Câmera lenta enquanto o power-up estiver ativo
+        self.time_scale = 0.5 if self.powerup_manager.is_active("slow_motion") else 1.0
+        
         # Estatísticas
         self.stats.time_played += dt
         
@@ -954,6 +1010,8 @@ class GameScene:
 
     def _update_transition(self, dt: float):
         """Atualiza estado de transição."""
+        # Aproveita a tela de transição para preparar o nível seguinte
+        self._preload_level(self.level + 1)
         self.transition_timer += dt
         if self.transition_timer >= self.transition_duration:
             self.in_transition = False
@@ -970,26 +1028,23 @@ class GameScene:
             self.game_state = GameState.PLAYING
             return
         
-        # Atualiza player
-        self.player.update(self.keys, dt * self.time_scale)
-        
-        # Atualiza boss
-        self.boss.update(dt * self.time_scale)
-        
-        # Atualiza mísseis
-        if self.missiles:
-            self.missiles.update(dt * self.time_scale)
+        # Atualiza player, boss e mísseis
+        with tracer.span("boss_fight.entities"):
+            self.player.update(self.keys, dt * self.time_scale)
+            self.boss.update(dt * self.time_scale)
+            if self.missiles:
+                self.missiles.update(dt * self.time_scale)
         
         # Sistema de disparo do boss
         if self.boss.ready_to_fire():
             missile = self.boss.fire_missile()
-            if missile and self.missiles:
+            if missile and self.missiles is not None:
                 self.missiles.add(missile)
-                if self.sfx_missile:
-                    self.sfx_missile.play()
+                self._play_sfx("sfx_missile")
         
         # Colisões
-        self._handle_boss_collisions()
+        with tracer.span("_handle_boss_collisions"):
+            self._handle_boss_collisions()
         
         # Verifica se boss foi derrotado
         if self.boss.dead:
@@ -1002,11 +1057,10 @@ class GameScene:
         
         # Colisão mísseis vs escudo
         if self.player.shield_active:
-            hits = pygame.sprite.spritecollide(self.player, self.missiles, True)
+            hits = collide(self.player, self.missiles, True, pixel_perfect=True)
             for hit in hits:
                 self.boss.register_hit()
-                if self.sfx_shield:
-                    self.sfx_shield.play()
+                self._play_sfx("sfx_shield")
                 
                 # Efeito visual
                 pos = hit.rect.center
@@ -1018,11 +1072,10 @@ class GameScene:
         
         # Colisão mísseis vs player (sem escudo)
         else:
-            hits = pygame.sprite.spritecollide(self.player, self.missiles, True)
+            hits = collide(self.player, self.missiles, True, pixel_perfect=True)
             for hit in hits:
                 self.player.vida -= 1
-                if self.sfx_hit:
-                    self.sfx_hit.play()
+                self._play_sfx("sfx_hit")
                 
                 # Efeito visual de dano
                 pos = self.player.rect.center
@@ -1039,8 +1092,7 @@ class GameScene:
 
     def _handle_boss_defeat(self):
         """Processa derrota do boss."""
-        if self.sfx_explosion:
-            self.sfx_explosion.play()
+        self._play_sfx("sfx_explosion")
         
         # Efeito visual de explosão massiva
         boss_center = self.boss.rect.center
@@ -1068,17 +1120,18 @@ class GameScene:
         # Aplica escala de tempo (slow motion)
         effective_dt = dt * self.time_scale
         
-        # Atualiza player
-        self.player.update(self.keys, effective_dt)
-        
-        # Atualiza itens
-        self.items.update(effective_dt)
+        # Atualiza player e itens
+        with tracer.span("gameplay.entities"):
+            self.player.update(self.keys, effective_dt)
+            self.items.update(effective_dt)
         
         # Sistema de spawn de itens
-        self._update_item_spawning(effective_dt)
+        with tracer.span("_update_item_spawning"):
+            self._update_item_spawning(effective_dt)
         
         # Colisões
-        self._handle_item_collisions()
+        with tracer.span("_handle_item_collisions"):
+            self._handle_item_collisions()
         
         # Verifica condições de avanço de nível
         self._check_level_progression()
@@ -1124,7 +1177,7 @@ class GameScene:
         )
         
         # Cria item
-        item = Item(
+        item = item_pool.acquire(
             image=item_data["image"],
             tipo=item_type,
             valor=item_data["valor"],
@@ -1155,7 +1208,7 @@ class GameScene:
 
     def _handle_item_collisions(self):
         """Processa colisões com itens de forma avançada."""
-        hits = pygame.sprite.spritecollide(self.player, self.items, True)
+        hits = collide(self.player, self.items, True, pixel_perfect=True)
         
         for item in hits:
             self._process_item_collection(item)
@@ -1169,120 +1222,141 @@ class GameScene:
             # Item positivo - efeito verde/dourado
             color = (0, 255, 0) if item.valor < 10 else (255, 215, 0)
             self.particle_system.add_collect_effect(pos, color)
-            def process_input(self, events, keys):
-        self.events = events
-        self.keys = keys
-        # Som de escudo
-        for e in events:
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE:
-                if not self.player.shield_active and self.player.cooldown_timer <= 0.0:
-                    if self.sfx_shield:
-                        self.sfx_shield.play()
-
-    def update(self, dt):
-        if self.in_transition:
-            self.transition_timer += dt
-            if self.transition_timer >= self.transition_duration:
-                self.in_transition = False
-            return
-
-        # Atualiza player e itens
-        self.player.update(self.keys, dt)
-        self.items.update(dt)
-
-        # Lógica boss nível 4
-        if self.level == 4 and self.boss and not self.boss.dead:
-            self.boss.update(dt)
-            self.missiles.update(dt)
             
-            if self.boss.ready_to_fire():
-                m = self.boss.fire_missile()
-                self.missiles.add(m)
-                if self.sfx_missile:
-                    self.sfx_missile.play()
+            # Pontuação com combo e power-up de pontos dobrados
+            combo, multiplier = self.combo_system.add_hit()
+            points = item.valor * multiplier
+            if self.powerup_manager.is_active("double_points"):
+                points *= 2
+            self.player.pontos += int(points)
+            self.stats.items_collected += 1
             
-            # Colisões com escudo
-            if self.player.shield_active:
-                hits = pygame.sprite.spritecollide(self.player, self.missiles, True)
-                if hits:
-                    self.boss.register_hit()
-                    if self.sfx_shield:
-                        self.sfx_shield.play()
-                    if self.boss.dead:
-                        if self.sfx_explosion:
-                            self.sfx_explosion.play()
-                        self.start_level_transition(5)
-            else:
-                # Se não tem escudo ativo, mísseis causam dano
-                hits = pygame.sprite.spritecollide(self.player, self.missiles, True)
-                if hits:
-                    self.player.vida -= 1
-                    if self.sfx_hit:
-                        self.sfx_hit.play()
-                    if self.player.vida <= 0:
-                        self.handle_game_over()
-            return
+            self._play_sfx("sfx_collect")
+            if combo in self.combo_system.multipliers:
+                self._play_sfx("sfx_combo")
+        
+        # Efeitos especiais do item
+        if item.efeito == "escorregar":
+            self.player.escorregar()
+            self.combo_system.reset_combo()
+            self._play_sfx("sfx_hit")
+        elif item.efeito == "boost":
+            self.player.boost_speed()
+        elif item.efeito in ("double_points", "slow_motion"):
+            self.powerup_manager.activate_powerup(item.efeito)
+            self._play_sfx("sfx_powerup")
+        elif item.efeito == "heal":
+            self.player.vida += 1
+            self.particle_system.add_collect_effect(pos, (255, 0, 0))
+        elif item.valor < 0 and not self.player.shield_active:
+            # Item negativo sem escudo causa dano
+            self.player.vida -= abs(item.valor)
+            self.stats.damage_taken += 1
+            self.screen_flash = 0.3
+            self._play_sfx("sfx_lose_life")
 
-        # Spawn de itens regulares
-        self.spawn_timer += dt
-        if self.spawn_timer >= self.spawn_interval and len(self.items) < self.max_items:
-            self.spawn_timer = 0
-            tipos = (["meia", "cubo", "caneca"] if self.level <= 1
-                     else (["meia", "cubo", "caneca", "banana"] if self.level == 2
-                           else ["meia", "cubo", "caneca", "banana", "toalha"]))
-            tipo = random.choice(tipos)
-            d = self.item_images[tipo]
-            base = (150, 250)
-            mult = self.speed_multiplier
-            speed_range = (int(base[0] * mult), int(base[1] * mult))
-            it = Item(image=d["image"], tipo=tipo, valor=d["valor"], efeito=d["efeito"], speed_range=speed_range)
-            self.items.add(it)
+    def _check_level_progression(self):
+        """Avança de nível quando a pontuação necessária é atingida."""
+        points_needed = self.points_to_next.get(self.level)
+        if not points_needed:
+            return
+        if self.player.pontos >= points_needed:
+            self.start_level_transition(self.level + 1)
+        elif self.player.pontos >= points_needed * PRELOAD_PROGRESS:
+            self._preload_level(self.level + 1)
 
-        # Colisões com itens
-        hits = pygame.sprite.spritecollide(self.player, self.items, True)
-        for item in hits:
-            if self.sfx_collect:
-                self.sfx_collect.play()
-                
-            if item.efeito == "escorregar":
-                self.player.escorregar()
-                if self.sfx_hit:
-                    self.sfx_hit.play()
-            elif item.efeito == "boost":
-                self.player.boost_speed()
-            elif item.valor > 0:
-                self.player.pontos += item.valor
-            else:
-                if not self.player.shield_active:
-                    self.player.vida -= abs(item.valor)
-                    if self.sfx_lose_life:
-                        self.sfx_lose_life.play()
-                    if self.player.vida <= 0:
-                        self.handle_game_over()
+    def _update_game_over(self, dt: float):
+        """Atualiza estado de game over (aguarda R para reiniciar)."""
+        self.stats.max_combo = max(self.stats.max_combo, self.combo_system.max_combo)
 
-        # Remover itens que saíram da tela
-        for item in list(self.items):
-            if item.rect.top > HEIGHT:
-                self.items.remove(item)
+    def _auto_save_progress(self):
+        """Guarda um checkpoint em memória com o progresso atual."""
+        self.checkpoint_data = {
+            "level": self.level,
+            "pontos": self.player.pontos,
+            "vida": self.player.vida,
+            "time_played": self.stats.time_played,
+        }
 
-        # Avanço de nível
-        if self.level < self.max_level:
-            need = self.points_to_next.get(self.level)
-            if need and self.player.pontos >= need:
-                self.start_level_transition(self.level + 1)
+    def capture_state(self) -> Dict[str, Any]:
+        """
+        Captura o estado completo da simulação em estruturas compatíveis com JSON.
+        Usado pelos keyframes de replay (core/replay.py).
+        """
+        state = {name: getattr(self, name) for name in self._STATE_FIELDS if hasattr(self, name)}
+        state["level"] = self.level
+        state["game_state"] = self.game_state.value
+        
+        player = {name: getattr(self.player, name) for name in self._PLAYER_FIELDS}
+        player["rect"] = list(self.player.rect)
+        state["player"] = player
+        
+        state["items"] = [{"tipo": item.tipo, "rect": list(item.rect), "speed": item.speed}
+                          for item in self.items]
+        
+        if self.boss is not None:
+            boss = {name: getattr(self.boss, name) for name in self._BOSS_FIELDS}
+            boss["rect"] = list(self.boss.rect)
+            state["boss"] = boss
+        else:
+            state["boss"] = None
+        state["missiles"] = ([{"rect": list(m.rect), "speed": m.speed} for m in self.missiles]
+                             if self.missiles is not None else None)
+        
+        state["particles"] = self.particle_system.capture_state()
+        state["powerups"] = dict(self.powerup_manager.active_powerups)
+        state["combo"] = {
+            "current_combo": self.combo_system.current_combo,
+            "max_combo": self.combo_system.max_combo,
+            "combo_timer": self.combo_system.combo_timer,
+        }
+        state["stats"] = asdict(self.stats)
+        return state
 
-        # Verificar condição de vitória (último nível)
-        if self.level == self.max_level:
-            final_points = self.points_to_next.get(self.max_level - 1, 500)
-            if self.player.pontos >= final_points * 2:  # Dobro dos pontos para vitória
-                self.handle_victory()
+    def restore_state(self, state: Dict[str, Any]):
+        """Restaura um estado salvo por capture_state."""
+        self.level = state["level"]
+        self.load_level(self.level)
+        for name in self._STATE_FIELDS:
+            if name in state:
+                setattr(self, name, state[name])
+        self.game_state = GameState(state["game_state"])
+        self.background = self.backgrounds.get(self.current_bg, self.background)
+        
+        for name in self._PLAYER_FIELDS:
+            setattr(self.player, name, state["player"][name])
+        self.player.rect = pygame.Rect(state["player"]["rect"])
+        
+        release_group(self.items)
+        for data in state["items"]:
+            item_data = self.item_images[data["tipo"]]
+            item = item_pool.acquire(image=item_data["image"], tipo=data["tipo"],
+                        valor=item_data["valor"], efeito=item_data["efeito"])
+            item.speed = data["speed"]
+            item.rect = pygame.Rect(data["rect"])
+            self.items.add(item)
+        
+        if state["boss"] is not None and self.boss is not None:
+            for name in self._BOSS_FIELDS:
+                setattr(self.boss, name, state["boss"][name])
+            self.boss.rect = pygame.Rect(state["boss"]["rect"])
+        if self.missiles is not None:
+            release_group(self.missiles)
+            for data in state["missiles"] or []:
+                missile = missile_pool.acquire(0, 0, self.boss.missile_img, self.player, data["speed"])
+                missile.rect = pygame.Rect(data["rect"])
+                self.missiles.add(missile)
+        
+        self.particle_system.restore_state(state["particles"])
+        self.powerup_manager.active_powerups = dict(state["powerups"])
+        for name, value in state["combo"].items():
+            setattr(self.combo_system, name, value)
+        self.stats = GameStats(**state["stats"])
+        self.dirty_rects.request_full_redraw()
 
     def handle_game_over(self):
         """Lida com o fim de jogo quando o player morre"""
-        try:
-            pygame.mixer.music.fadeout(1000)
-        except:
-            pass
+        music_controller.stop(1.0)
         
         # Toca som de game over se disponível
         audio_folder = os.path.join("assets", "audio")
@@ -1296,10 +1370,7 @@ class GameScene:
 
     def handle_victory(self):
         """Lida com a vitória do jogo"""
-        try:
-            pygame.mixer.music.fadeout(1000)
-        except:
-            pass
+        music_controller.stop(1.0)
         
         # Toca som de vitória se disponível
         audio_folder = os.path.join("assets", "audio")
@@ -1311,47 +1382,60 @@ class GameScene:
         from scenes.victory_scene import VictoryScene
         self.next_scene = VictoryScene(self.player.pontos)
 
-    def render(self, screen):
-        # Desenha o background
-        screen.blit(self.background, (0, 0))
+    def render(self, screen, alpha=1.0):
+        """
+        Desenha a cena.
+        
+        Returns:
+            Lista de regiões alteradas para display.update, ou None para flip completo
+        """
+        # Overlays de tela cheia e tremor de câmera pedem frame completo
+        if (self.in_transition or self.camera_shake > 0 or
+                self.game_state in (GameState.GAME_OVER, GameState.VICTORY)):
+            self.dirty_rects.request_full_redraw()
+        add = self.dirty_rects.add
+        
+        # Desenha o background (só sob as regiões do frame anterior)
+        with tracer.span("render.background"):
+            self.dirty_rects.begin(screen, self.background)
         
         if not self.in_transition:
-            # Desenha todos os itens
-            self.items.draw(screen)
-            
-            # Desenha o player
-            self.player.draw(screen)
+            # Desenha itens e player
+            with tracer.span("render.sprites"):
+                add(draw_interpolated(screen, self.items, alpha))
+                add(self.player.draw(screen, interpolated_topleft(self.player, alpha)))
             
-            # Chefão nível 4 - Boss battle
-            if self.level == 4 and self.boss and not self.boss.dead:
+            # Chefão do nível (4 e 8) - Boss battle
+            if self.boss and not self.boss.dead:
                 # Desenha o boss
-                screen.blit(self.boss.image, self.boss.rect)
+                add(screen.blit(self.boss.image, interpolated_topleft(self.boss, alpha)))
                 
                 # Desenha os mísseis
-                self.missiles.draw(screen)
+                add(draw_interpolated(screen, self.missiles, alpha))
                 
                 # Barra de vida do boss (fundo vermelho)
                 boss_health_bg = pygame.Rect(WIDTH//2 - 100, 30, 200, 20)
-                pygame.draw.rect(screen, (200, 0, 0), boss_health_bg)
+                add(pygame.draw.rect(screen, (200, 0, 0), boss_health_bg))
                 
                 # Barra de vida do boss (vida atual em verde)
                 health_percentage = 1 - (self.boss.hits_taken / self.boss.max_hits)
                 health_width = int(200 * health_percentage)
                 boss_health_fg = pygame.Rect(WIDTH//2 - 100, 30, health_width, 20)
-                pygame.draw.rect(screen, (0, 200, 0), boss_health_fg)
+                add(pygame.draw.rect(screen, (0, 200, 0), boss_health_fg))
                 
                 # Borda da barra de vida do boss
-                pygame.draw.rect(screen, (255, 255, 255), boss_health_bg, 2)
+                add(pygame.draw.rect(screen, (255, 255, 255), boss_health_bg, 2))
                 
                 # Nome do boss
                 font_boss = pygame.font.SysFont(None, 36)
-                boss_text = font_boss.render("Entregador Temporal", True, (255, 255, 255))
+                boss_text = font_boss.render(self.boss.name, True, (255, 255, 255))
                 boss_text_rect = boss_text.get_rect(center=(WIDTH//2, 15))
-                screen.blit(boss_text, boss_text_rect)
+                add(screen.blit(boss_text, boss_text_rect))
             
             # Desenha o HUD com indicador de escudo pronto
             shield_ready = (self.player.cooldown_timer <= 0.0)
-            draw_hud(screen, self.player.pontos, self.player.vida, shield_ready)
+            with tracer.span("render.hud"):
+                add(draw_hud(screen, self.player.pontos, self.player.vida, shield_ready))
             
             # Indicador visual de nível atual (canto superior direito)
             font_level = pygame.font.SysFont(None, 28)
@@ -1363,8 +1447,8 @@ class GameScene:
             level_bg.set_alpha(128)
             level_bg.fill((0, 0, 0))
             level_bg_rect = level_bg.get_rect(topright=(WIDTH - 5, 7))
-            screen.blit(level_bg, level_bg_rect)
-            screen.blit(level_text, level_rect)
+            add(screen.blit(level_bg, level_bg_rect))
+            add(screen.blit(level_text, level_rect))
             
             # Indicador de próximo nível (se não estiver no último nível)
             if self.level < self.max_level:
@@ -1374,32 +1458,35 @@ class GameScene:
                     
                     # Barra de progresso para próximo nível
                     progress_bg = pygame.Rect(10, HEIGHT - 30, 200, 15)
-                    pygame.draw.rect(screen, (100, 100, 100), progress_bg)
+                    add(pygame.draw.rect(screen, (100, 100, 100), progress_bg))
                     
                     progress_fg = pygame.Rect(10, HEIGHT - 30, int(200 * progress), 15)
-                    pygame.draw.rect(screen, (255, 215, 0), progress_fg)  # Dourado
+                    add(pygame.draw.rect(screen, (255, 215, 0), progress_fg))  # Dourado
                     
-                    pygame.draw.rect(screen, (255, 255, 255), progress_bg, 2)
+                    add(pygame.draw.rect(screen, (255, 255, 255), progress_bg, 2))
                     
                     # Texto da barra de progresso
                     font_progress = pygame.font.SysFont(None, 24)
                     progress_text = font_progress.render(f"Próximo nível: {self.player.pontos}/{points_needed}", True, (255, 255, 255))
                     progress_text_rect = progress_text.get_rect(topleft=(10, HEIGHT - 50))
-                    screen.blit(progress_text, progress_text_rect)
+                    add(screen.blit(progress_text, progress_text_rect))
         
         else:
             # Tela de transição entre níveis
-            # Overlay escuro semi-transparente
-            overlay = pygame.Surface((WIDTH, HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
+            # Overlay escuro semi-transparente (opaco em qualidade baixa)
+            if quality.budget["overlays"]:
+                overlay = pygame.Surface((WIDTH, HEIGHT))
+                overlay.set_alpha(180)
+                overlay.fill((0, 0, 0))
+                add(screen.blit(overlay, (0, 0)))
+            else:
+                add(screen.fill((0, 0, 0)))
             
             # Texto principal do nível
             font_main = pygame.font.SysFont(None, 72)
             main_text = font_main.render(f"Nível {self.level}", True, (255, 255, 255))
             main_rect = main_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 30))
-            screen.blit(main_text, main_rect)
+            add(screen.blit(main_text, main_rect))
             
             # Texto secundário com dica ou informação
             font_sub = pygame.font.SysFont(None, 36)
@@ -1411,23 +1498,47 @@ class GameScene:
                 sub_text = font_sub.render("Prepare-se!", True, (200, 200, 200))
             
             sub_rect = sub_text.get_rect(center=(WIDTH//2, HEIGHT//2 + 20))
-            screen.blit(sub_text, sub_rect)
+            add(screen.blit(sub_text, sub_rect))
             
             # Barra de carregamento da transição
             transition_progress = min(self.transition_timer / self.transition_duration, 1.0)
             loading_bg = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 60, 200, 10)
-            pygame.draw.rect(screen, (100, 100, 100), loading_bg)
+            add(pygame.draw.rect(screen, (100, 100, 100), loading_bg))
             
             loading_fg = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 60, int(200 * transition_progress), 10)
-            pygame.draw.rect(screen, (0, 255, 0), loading_fg)
+            add(pygame.draw.rect(screen, (0, 255, 0), loading_fg))
             
-            pygame.draw.rect(screen, (255, 255, 255), loading_bg, 2)
+            add(pygame.draw.rect(screen, (255, 255, 255), loading_bg, 2))
+        
+        # Partículas por cima da cena
+        with tracer.span("ParticleSystem.render"):
+            add(self.particle_system.render(screen))
+        
+        # Fim de jogo / vitória
+        if self.game_state in (GameState.GAME_OVER, GameState.VICTORY):
+            if quality.budget["overlays"]:
+                end_overlay = pygame.Surface((WIDTH, HEIGHT))
+                end_overlay.set_alpha(160)
+                end_overlay.fill((0, 0, 0))
+                add(screen.blit(end_overlay, (0, 0)))
+            font_end = pygame.font.SysFont(None, 64)
+            if self.game_state == GameState.GAME_OVER:
+                end_text = font_end.render("Fim de jogo - R para reiniciar", True, (255, 80, 80))
+            else:
+                end_text = font_end.render("Vitória!", True, (255, 215, 0))
+            add(screen.blit(end_text, end_text.get_rect(center=(WIDTH//2, HEIGHT//2))))
         
         # Efeitos visuais adicionais para feedback
         # Piscar da tela quando o player toma dano (se implementado)
         if hasattr(self.player, 'damage_flash_timer') and self.player.damage_flash_timer > 0:
-            flash_overlay = pygame.Surface((WIDTH, HEIGHT))
-            flash_alpha = int(128 * (self.player.damage_flash_timer / 0.2))  # Assumindo 0.2s de flash
-            flash_overlay.set_alpha(flash_alpha)
-            flash_overlay.fill((255, 0, 0))
-            screen.blit(flash_overlay, (0, 0))
\ No newline at end of file
+            if quality.budget["overlays"]:
+                flash_overlay = pygame.Surface((WIDTH, HEIGHT))
+                flash_alpha = int(128 * (self.player.damage_flash_timer / 0.2))  # Assumindo 0.2s de flash
+                flash_overlay.set_alpha(flash_alpha)
+                flash_overlay.fill((255, 0, 0))
+                add(screen.blit(flash_overlay, (0, 0)))
+            else:
+                # Qualidade baixa: só uma moldura vermelha
+                add(pygame.draw.rect(screen, (255, 0, 0), screen.get_rect(), 8))
+        
+        return self.dirty_rects.finish()
@@ -0,0 +1,42 @@
+"""
+Configuração comum dos testes: pygame sem janela nem áudio real e a raiz do
+repositório no sys.path (os módulos usam caminhos relativos a ela).
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+import pytest
+
+from core.config import WIDTH, HEIGHT
+
+
+@pytest.fixture
+def display():
+    """Modo de vídeo dummy definido (convert/convert_alpha funcionam)."""
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    yield screen
+    pygame.display.quit()
+
+
+@pytest.fixture
+def mixer():
+    """Mixer inicializado no driver de áudio dummy."""
+    pygame.mixer.init()
+    yield
+    pygame.mixer.quit()
+
+
+@pytest.fixture
+def repo_cwd(monkeypatch):
+    """Roda o teste na raiz do repositório (caminhos de assets relativos)."""
+    monkeypatch.chdir(ROOT)
+    return ROOT
@@ -0,0 +1,60 @@
+import pygame
+
+from assets.atlas import TextureAtlas
+
+
+def _sprite(size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+def _overlaps(atlas):
+    placed = list(atlas.regions.values())
+    return any(page_a == page_b and rect_a.colliderect(rect_b)
+               for i, (page_a, rect_a) in enumerate(placed)
+               for page_b, rect_b in placed[i + 1:])
+
+
+def test_packs_sprites_without_overlap(display):
+    atlas = TextureAtlas(page_size=64)
+    sources = {f"s{i}": _sprite((5 + i % 20, 5 + (i * 7) % 25), (i * 8, 100, 50, 200))
+               for i in range(30)}
+    atlas.add_many(sources)
+    for name, source in sources.items():
+        image = atlas.get(name)
+        assert image.get_size() == source.get_size()
+        assert image.get_at((1, 1)) == source.get_at((1, 1))
+    assert not _overlaps(atlas)
+    assert len(atlas.pages) > 1
+
+
+def test_late_additions_keep_existing_regions(display):
+    atlas = TextureAtlas(page_size=64)
+    atlas.add("a", _sprite((20, 20), (255, 0, 0, 255)))
+    first = atlas.get("a")
+    regions = dict(atlas.regions)
+    for i in range(10):
+        atlas.add(f"late{i}", _sprite((16, 16), (0, 255, 0, 255)))
+    assert atlas.get("a") is first
+    assert {name: atlas.regions[name] for name in regions} == regions
+    assert first.get_parent() is atlas.pages[0]
+    assert not _overlaps(atlas)
+
+
+def test_same_size_replacement_is_written_in_place(display):
+    atlas = TextureAtlas(page_size=64)
+    atlas.add("item", _sprite((10, 10), (255, 0, 0, 255)))
+    image = atlas.get("item")
+    atlas.add("item", _sprite((10, 10), (0, 0, 255, 255)))
+    assert atlas.get("item") is image
+    assert image.get_at((5, 5)) == (0, 0, 255, 255)
+
+
+def test_oversized_sprite_gets_its_own_page(display):
+    atlas = TextureAtlas(page_size=32)
+    atlas.add("big", _sprite((40, 10), (1, 2, 3, 255)))
+    assert atlas.get("big") is not None
+    page, rect = atlas.regions["big"]
+    assert atlas.pages[page].get_size() == (40, 10)
+    assert rect.topleft == (0, 0)
@@ -0,0 +1,51 @@
+import os
+
+import pygame
+import pytest
+
+from assets import bake
+
+
+@pytest.fixture
+def bake_dir(tmp_path, monkeypatch):
+    """Diretório de bake temporário, visto também por load_baked."""
+    path = str(tmp_path / "baked")
+    monkeypatch.setattr(bake, "BAKE_DIR", path)
+    bake.reload_manifest()
+    yield path
+    bake.reload_manifest()
+
+
+def _write_png(path, color):
+    surface = pygame.Surface((8, 8), pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.image.save(surface, path)
+
+
+def test_bake_round_trip(tmp_path, bake_dir, display):
+    source = str(tmp_path / "item.png")
+    _write_png(source, (10, 200, 30, 255))
+
+    assert bake.bake([(source, (16, 16))], bake_dir) == (1, 0)
+    image = bake.load_baked(source, (16, 16))
+    assert image is not None
+    assert image.get_size() == (16, 16)
+    expected = pygame.transform.scale(pygame.image.load(source), (16, 16))
+    assert pygame.image.tobytes(image, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    # Tamanho que não foi assado
+    assert bake.load_baked(source, (32, 32)) is None
+
+
+def test_rebake_only_changed_sources(tmp_path, bake_dir, display):
+    source = str(tmp_path / "item.png")
+    _write_png(source, (10, 200, 30, 255))
+    bake.bake([(source, (16, 16))], bake_dir)
+    assert bake.bake([(source, (16, 16))], bake_dir) == (0, 1)
+
+    _write_png(source, (200, 10, 30, 255))
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    # Origem alterada depois do bake: a versão assada é ignorada
+    assert bake.load_baked(source, (16, 16)) is None
+    assert bake.bake([(source, (16, 16))], bake_dir) == (1, 0)
+    assert bake.load_baked(source, (16, 16)).get_at((0, 0)) == (200, 10, 30, 255)
@@ -0,0 +1,32 @@
+from core.headless import run_headless
+
+
+class TickScene:
+    def __init__(self):
+        self.ticks = 0
+        self.next_scene = self
+
+    def process_input(self, events, keys):
+        pass
+
+    def fixed_update(self, dt):
+        self.ticks += 1
+
+
+def test_runs_exact_frame_count():
+    # 120 s a 60 Hz: somar dt em float daria 7201 frames
+    report = run_headless(TickScene, duration=120.0, dt=1 / 60)
+    assert report.frames == 7200
+    assert report.simulated_seconds == 120.0
+
+
+def test_scene_construction_is_not_simulation_time():
+    import time
+
+    def slow_factory():
+        time.sleep(0.2)
+        return TickScene()
+
+    report = run_headless(slow_factory, duration=1.0, dt=1 / 60)
+    assert report.setup_seconds >= 0.2
+    assert report.wall_seconds < 0.2
@@ -0,0 +1,41 @@
+from concurrent.futures import Future
+
+import pytest
+
+import core.music as music
+from core.music import MusicController
+
+
+@pytest.fixture
+def fake_loader(monkeypatch):
+    """Troca a decodificação por Futures prontos (sem ler arquivos)."""
+    class Executor:
+        def submit(self, fn, path, *args):
+            future = Future()
+            future.set_result(None)
+            return future
+
+    monkeypatch.setattr(music, "get_executor", lambda: Executor())
+
+
+def test_unplayed_prefetch_is_evicted(fake_loader):
+    controller = MusicController()
+    controller.play("a.wav")
+    controller.update(0.0)
+    controller.update(10.0)
+    controller.prefetch("b.wav")
+    controller.prefetch("c.wav")
+    # Atual + uma pré-carga; "b" nunca tocou e saiu
+    assert set(controller.tracks) == {"a.wav", "c.wav"}
+
+
+def test_crossfade_releases_previous_track(fake_loader, mixer):
+    controller = MusicController()
+    controller.play("a.wav")
+    controller.update(10.0)
+    controller.prefetch("b.wav")
+    controller.play("b.wav")
+    controller.update(0.0)
+    assert set(controller.tracks) == {"a.wav", "b.wav"}  # crossfade em andamento
+    controller.update(10.0)
+    assert set(controller.tracks) == {"b.wav"}
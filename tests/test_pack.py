@@ -0,0 +1,57 @@
+import io
+import os
+
+import pytest
+
+from assets.pack import ALIGNMENT, AssetPack, collect_files, write_pack
+
+
+@pytest.fixture
+def asset_tree(tmp_path, monkeypatch):
+    """Árvore assets/ pequena com o diretório de trabalho na raiz dela."""
+    monkeypatch.chdir(tmp_path)
+    files = {
+        "assets/images/banana.png": b"\x89PNG" + bytes(range(40)),
+        "assets/audio/catch.wav": b"RIFF" + b"\x01" * 1000,
+        "assets/audio/vazio.ogg": b"",
+        "assets/images/__init__.py": b"",
+        "assets/images/__pycache__/x.pyc": b"x",
+    }
+    for name, data in files.items():
+        os.makedirs(os.path.dirname(name), exist_ok=True)
+        with open(name, "wb") as f:
+            f.write(data)
+    return files
+
+
+def test_collect_files_skips_code(asset_tree):
+    assert collect_files("assets") == [
+        "assets/audio/catch.wav", "assets/audio/vazio.ogg", "assets/images/banana.png",
+    ]
+
+
+def test_pack_round_trip(asset_tree, tmp_path):
+    out = str(tmp_path / "assets.pak")
+    write_pack(collect_files("assets"), out)
+    pack = AssetPack(out)
+    assert len(pack) == 3
+    for name in collect_files("assets"):
+        view = pack.view(name)
+        assert bytes(view) == asset_tree[name]
+        assert pack._spans[pack._find(name)][0] % ALIGNMENT == 0
+    # Caminhos com separador do sistema também são achados
+    assert os.path.join("assets", "images", "banana.png") in pack
+    assert pack.view("assets/images/nada.png") is None
+
+    f = pack.open("assets/audio/catch.wav")
+    assert f.read(4) == b"RIFF"
+    f.seek(-2, io.SEEK_END)
+    assert f.read() == b"\x01\x01"
+    f.close()
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "nao_e_pacote.pak"
+    path.write_bytes(b"XXXX" + b"\0" * 64)
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
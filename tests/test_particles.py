@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from core.particles import ParticleSystem, NUMPY_AVAILABLE
+from core.quality import quality
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy não instalado")
+
+
+@pytest.fixture
+def tier():
+    top = len(quality.tiers) - 1
+    yield quality.set_tier
+    quality.set_tier(top)
+
+
+def test_quality_budget_only_limits_drawing(display, tier):
+    random.seed(1)
+    system = ParticleSystem()
+    system.add_explosion((400, 300), particle_count=200)
+    drawn = {}
+    for level in range(len(quality.tiers)):
+        tier(level)
+        drawn[level] = int(system._sprite_keys(system.count)[3].sum())
+        assert len(system) == 200
+    assert drawn[0] < drawn[1] < drawn[len(quality.tiers) - 1]
+
+
+def test_capture_restore_round_trip(display):
+    random.seed(2)
+    system = ParticleSystem()
+    system.add_explosion((100, 100), particle_count=30)
+    system.add_collect_effect((50, 50))
+    system.update(0.1)
+    state = system.capture_state()
+
+    restored = ParticleSystem()
+    restored.restore_state(state)
+    assert restored.capture_state() == state
+    # Keyframes antigos (sem mistura e ordem de detalhe) continuam válidos
+    restored.restore_state([entry[:8] for entry in state])
+    assert len(restored) == len(state)
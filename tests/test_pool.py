@@ -0,0 +1,45 @@
+import pygame
+
+from entities.item import Item
+from entities.pool import PooledSprite, SpritePool, release_group
+
+
+def _image(size=(10, 10)):
+    return pygame.Surface(size)
+
+
+def test_acquire_reuses_killed_sprites():
+    pool = SpritePool(Item)
+    group = pygame.sprite.Group()
+    first = pool.acquire(_image(), "meia", 1)
+    group.add(first)
+    first.prev_pos = (3, 4)
+    first.kill()
+    assert not group
+    assert pool.stats()["free"] == 1
+
+    second = pool.acquire(_image((20, 20)), "banana", -1, "escorregar")
+    assert second is first
+    assert (second.tipo, second.valor, second.efeito) == ("banana", -1, "escorregar")
+    assert second.rect.size == (20, 20)
+    assert second.prev_pos is None
+    assert pool.stats() == {"free": 0, "created": 1, "reused": 1, "discarded": 0, "hit_rate": 0.5}
+
+
+def test_double_kill_releases_once():
+    pool = SpritePool(PooledSprite)
+    sprite = pool.acquire(_image())
+    sprite.kill()
+    sprite.kill()
+    assert len(pool.free) == 1
+
+
+def test_full_pool_discards_extra_sprites():
+    pool = SpritePool(PooledSprite, max_free=2)
+    sprites = [pool.acquire(_image()) for _ in range(3)]
+    group = pygame.sprite.Group(*sprites)
+    release_group(group)
+    assert not group
+    assert len(pool.free) == 2
+    assert pool.discarded == 1
+    assert pool.created == 3
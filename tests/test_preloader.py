@@ -0,0 +1,61 @@
+import os
+import threading
+
+import assets.preloader as preloader_module
+
+from assets.loader import asset_cache, load_image
+from assets.preloader import LevelPreloader
+
+BOSS = (os.path.join("assets", "images", "chefes", "entregador_temporal.png"), (100, 80))
+
+
+def _wait(preloader, level):
+    preloader._job.thread.join(timeout=5)
+    return preloader.take(level)
+
+
+def test_preloaded_images_go_to_asset_cache(display, repo_cwd):
+    asset_cache.clear()
+    preloader = LevelPreloader()
+    preloader.request(4, {"boss": BOSS, "ausente": ("assets/images/nada.png", (10, 10))})
+    assets = _wait(preloader, 4)
+    # Falhas ficam de fora: quem pedir cai no load_image
+    assert set(assets["images"]) == {"boss"}
+    assert load_image(*BOSS) is assets["images"]["boss"]
+
+
+def test_repeated_request_is_ignored(display, repo_cwd):
+    preloader = LevelPreloader()
+    preloader.request(4, {"boss": BOSS})
+    job = preloader._job
+    preloader.request(4, {"boss": BOSS})
+    assert preloader._job is job
+    assert _wait(preloader, 4) is not None
+    assert preloader.take(4) is None
+
+
+def test_stale_request_never_leaks_into_newer_one(display, repo_cwd, monkeypatch):
+    release = threading.Event()
+    decode = preloader_module.decode_image
+
+    def slow_decode(path, size):
+        if "lento" in path:
+            release.wait(timeout=5)  # segura a thread do pedido antigo
+        return decode(path, size)
+
+    monkeypatch.setattr(preloader_module, "decode_image", slow_decode)
+    preloader = LevelPreloader()
+    old_music = os.path.join("assets", "audio", "boss_intro.mp3")
+    new_music = os.path.join("assets", "audio", "catch.wav")
+    preloader.request(4, {"boss": ("assets/images/lento.png", (10, 10))}, old_music)
+    old_job = preloader._job
+    preloader.request(5, {}, new_music)
+    assets = _wait(preloader, 5)
+    # A thread antiga termina depois da nova
+    release.set()
+    old_job.thread.join(timeout=5)
+
+    with open(new_music, "rb") as f:
+        assert assets["music"] == f.read()
+    assert assets["music_path"] == new_music
+    assert preloader.take(4) is None and preloader.take(5) is None
@@ -0,0 +1,114 @@
+import contextlib
+import io
+
+import pytest
+
+from core.headless import RandomInput, ScriptedKeys
+from core.replay import ReplayRecorder, ReplayPlayer
+from core.timestep import FixedTimestep
+
+FRAMES = 600
+KEYFRAME_INTERVAL = 120
+
+
+def _new_scene():
+    from scenes.novogame_scene import GameScene
+    with contextlib.redirect_stdout(io.StringIO()):
+        return GameScene(level=1)
+
+
+def record_session(path, on_frame=None):
+    """Grava FRAMES frames de entrada pseudoaleatória. Retorna a cena final."""
+    recorder = ReplayRecorder(str(path), seed=7, keyframe_interval=KEYFRAME_INTERVAL)
+    recorder.start()
+    scene = _new_scene()
+    timestep = FixedTimestep()
+    keys = ScriptedKeys()
+    script = RandomInput(3)
+    dt = 1 / 60
+    for frame in range(FRAMES):
+        if on_frame is not None:
+            on_frame(frame)
+        events = script.poll(frame * dt, keys)
+        recorder.record(scene, timestep, dt, keys, events)
+        scene.process_input(events, keys)
+        timestep.advance(scene, dt)
+        scene = scene.next_scene
+    recorder.close()
+    return scene
+
+
+@pytest.fixture
+def replay_file(tmp_path, display, repo_cwd):
+    path = tmp_path / "session.rp"
+    scene = record_session(path)
+    return path, scene
+
+
+def test_record_verify_round_trip(replay_file):
+    path, _ = replay_file
+    player = ReplayPlayer(str(path))
+    try:
+        assert [frame for frame, _ in player.index] == list(range(0, FRAMES, KEYFRAME_INTERVAL))
+        assert player.verify(_new_scene) == []
+    finally:
+        player.close()
+
+
+def test_seek_matches_linear_playback(replay_file):
+    path, final_scene = replay_file
+    player = ReplayPlayer(str(path))
+    try:
+        scene, timestep, frames = player.seek(_new_scene, FRAMES - 50)
+        for frame in frames:
+            scene = player.step(scene, timestep, frame)
+        assert scene.capture_state() == final_scene.capture_state()
+    finally:
+        player.close()
+
+
+def test_verify_reports_divergence(replay_file):
+    path, _ = replay_file
+    player = ReplayPlayer(str(path))
+    try:
+        # Semente errada: a sessão reproduzida diverge da gravada
+        player.seed += 1
+        assert player.verify(_new_scene)
+    finally:
+        player.close()
+
+
+def test_quality_tier_does_not_change_replay_state(tmp_path, display, repo_cwd):
+    from core.quality import quality
+
+    path = tmp_path / "tiers.rp"
+    top = len(quality.tiers) - 1
+    try:
+        # Gravada caindo para o nível mais baixo logo no início, verificada no mais alto
+        record_session(path, on_frame=lambda frame: frame == 1 and quality.set_tier(0))
+        quality.set_tier(top)
+        player = ReplayPlayer(str(path))
+        try:
+            assert player.verify(_new_scene) == []
+        finally:
+            player.close()
+    finally:
+        quality.set_tier(top)
+
+
+def test_warns_when_scene_has_no_keyframes(tmp_path, capsys):
+    class StatelessScene:
+        next_scene = None
+
+    path = tmp_path / "sem_keyframes.rp"
+    recorder = ReplayRecorder(str(path), seed=1)
+    recorder.record(StatelessScene(), FixedTimestep(), 1 / 60, ScriptedKeys(), [])
+    recorder.close()
+    assert "sem keyframes" in capsys.readouterr().out
+
+    player = ReplayPlayer(str(path))
+    try:
+        assert player.index == []
+        assert "sem keyframes" in capsys.readouterr().out
+    finally:
+        player.close()
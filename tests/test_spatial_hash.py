@@ -0,0 +1,92 @@
+import random
+
+import pygame
+import pytest
+
+from core.spatial_hash import SpatialGroup, SpatialHash, collide
+
+
+class Box:
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+def _brute_rect(boxes, rect):
+    return [box for box in boxes if rect.colliderect(box.rect)]
+
+
+@pytest.fixture
+def scattered():
+    rng = random.Random(5)
+    spatial = SpatialHash(cell_size=32)
+    boxes = [Box(rng.randint(-50, 800), rng.randint(-50, 600), rng.randint(1, 80), rng.randint(1, 80))
+             for _ in range(300)]
+    for box in boxes:
+        spatial.insert(box)
+    return spatial, boxes
+
+
+def test_query_rect_matches_brute_force_in_insertion_order(scattered):
+    spatial, boxes = scattered
+    rng = random.Random(9)
+    for _ in range(100):
+        rect = pygame.Rect(rng.randint(-60, 800), rng.randint(-60, 600), rng.randint(1, 200), rng.randint(1, 200))
+        assert spatial.query_rect(rect) == _brute_rect(boxes, rect)
+
+
+def test_update_moves_objects_between_cells(scattered):
+    spatial, boxes = scattered
+    box = boxes[0]
+    box.rect.topleft = (5000, 5000)
+    spatial.update(box)
+    assert spatial.query_rect(pygame.Rect(4990, 4990, 30, 30)) == [box]
+    spatial.remove(box)
+    assert box not in spatial
+    assert spatial.query_rect(pygame.Rect(4990, 4990, 30, 30)) == []
+
+
+def test_nearest_orders_by_distance_then_insertion():
+    spatial = SpatialHash(cell_size=16)
+    far, near, tie_first, tie_second = Box(200, 0), Box(30, 0), Box(0, 60), Box(60, 0)
+    for box in (far, near, tie_first, tie_second):
+        spatial.insert(box)
+    # Distâncias de (5, 5) até os retângulos: near 25, tie_first 55, tie_second 55, far 195
+    assert spatial.nearest((5, 5), k=4) == [near, tie_first, tie_second, far]
+    assert spatial.nearest((5, 5), k=1) == [near]
+    assert spatial.nearest((5, 5), k=4, max_radius=100) == [near, tie_first, tie_second]
+
+
+def test_nearest_matches_brute_force(scattered):
+    spatial, boxes = scattered
+    rng = random.Random(11)
+    for _ in range(50):
+        point = (rng.randint(0, 800), rng.randint(0, 600))
+        expected = sorted(boxes, key=lambda box: (_distance2(box.rect, point), boxes.index(box)))[:5]
+        assert spatial.nearest(point, k=5) == expected
+
+
+def _distance2(rect, point):
+    dx = max(rect.left - point[0], 0, point[0] - rect.right)
+    dy = max(rect.top - point[1], 0, point[1] - rect.bottom)
+    return dx * dx + dy * dy
+
+
+def test_spatial_group_keeps_hash_in_sync():
+    class Faller(pygame.sprite.Sprite):
+        def __init__(self, x):
+            super().__init__()
+            self.image = pygame.Surface((10, 10))
+            self.rect = self.image.get_rect(topleft=(x, 0))
+
+        def update(self, dt):
+            self.rect.y += 100
+
+    group = SpatialGroup(cell_size=32)
+    sprites = [Faller(x) for x in (0, 50, 100)]
+    group.add(*sprites)
+    group.update(0.1)
+    player = Box(45, 95, 20, 20)
+    assert collide(player, group, dokill=False) == [sprites[1]]
+    assert collide(player, group, dokill=True) == [sprites[1]]
+    assert sprites[1] not in group
+    assert len(group.spatial) == 2
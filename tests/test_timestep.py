@@ -0,0 +1,70 @@
+import pygame
+import pytest
+
+from core.timestep import FixedTimestep, interpolated_topleft
+
+
+class CountingScene:
+    def __init__(self):
+        self.ticks = []
+        self.next_scene = self
+
+    def fixed_update(self, dt):
+        self.ticks.append(dt)
+
+
+class SwitchingScene(CountingScene):
+    def fixed_update(self, dt):
+        super().fixed_update(dt)
+        self.next_scene = None
+
+
+def test_ticks_follow_accumulated_time():
+    # 1/64 é exato em float: um tick por frame, sem sobra
+    timestep = FixedTimestep(tick_rate=64, max_ticks=5)
+    scene = CountingScene()
+    for _ in range(120):
+        timestep.advance(scene, 1 / 64)
+    assert len(scene.ticks) == 120
+    assert set(scene.ticks) == {1 / 64}
+    assert timestep.accumulator == 0.0
+
+
+def test_partial_frame_returns_interpolation_alpha():
+    timestep = FixedTimestep(tick_rate=60)
+    scene = CountingScene()
+    alpha = timestep.advance(scene, 1.5 / 60)
+    assert len(scene.ticks) == 1
+    assert alpha == pytest.approx(0.5)
+
+
+def test_long_frame_is_clamped_to_tick_budget():
+    timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+    scene = CountingScene()
+    alpha = timestep.advance(scene, 1.0)
+    assert len(scene.ticks) == 5
+    # Atraso guardado nunca passa de um orçamento inteiro
+    assert timestep.accumulator == pytest.approx(5 / 60)
+    assert timestep.dropped_time == pytest.approx(1.0 - 10 / 60)
+    assert alpha == 1.0
+
+
+def test_scene_change_stops_remaining_ticks():
+    timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+    scene = SwitchingScene()
+    assert timestep.advance(scene, 4 / 60) == 1.0
+    assert len(scene.ticks) == 1
+    assert timestep.accumulator == 0.0
+
+
+def test_interpolated_topleft():
+    class Sprite:
+        pass
+
+    sprite = Sprite()
+    sprite.rect = pygame.Rect(10, 20, 5, 5)
+    sprite.prev_pos = (0, 0)
+    assert interpolated_topleft(sprite, 0.5) == (5, 10)
+    assert interpolated_topleft(sprite, 1.0) == (10, 20)
+    sprite.prev_pos = None
+    assert interpolated_topleft(sprite, 0.5) == (10, 20)
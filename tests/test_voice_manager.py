@@ -0,0 +1,74 @@
+import pygame
+import pytest
+
+from core.voice_manager import VoiceManager
+
+
+def _make_sound():
+    """1 s de silêncio: continua tocando durante o teste."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=b"\0" * (frequency * channels * abs(size) // 8))
+
+
+def test_single_trigger_plays_at_unity_gain(mixer):
+    voices = VoiceManager({"combat": 1}, first_channel=2)
+    voices.play(_make_sound(), "combat")
+    voices.flush()
+    assert voices.pools["combat"][0].channel.get_volume() == pytest.approx(1.0, abs=0.01)
+
+
+def test_same_tick_triggers_merge_into_louder_voice(mixer):
+    sound = _make_sound()
+    voices = VoiceManager({"combat": 4}, first_channel=2)
+    voices.play(sound, "combat", volume=0.25)
+    voices.flush()
+    single = voices.pools["combat"][0].channel.get_volume()
+
+    for _ in range(4):
+        voices.play(sound, "combat", volume=0.25)
+    voices.flush()
+    assert voices.played == 2
+    assert voices.merged == 3
+    merged = voices.pools["combat"][1].channel.get_volume()
+    assert single == pytest.approx(0.25, abs=0.01)
+    assert merged == pytest.approx(0.5, abs=0.01)  # 0.25 * sqrt(4)
+
+    for _ in range(4):
+        voices.play(sound, "combat")
+    voices.flush()
+    assert voices.pools["combat"][2].channel.get_volume() == pytest.approx(1.0, abs=0.01)  # teto do canal
+
+
+def test_full_pool_steals_lowest_priority(mixer):
+    voices = VoiceManager({"combat": 2}, first_channel=2)
+    low, high, newer = _make_sound(), _make_sound(), _make_sound()
+    voices.play(low, "combat", priority=1)
+    voices.play(high, "combat", priority=3)
+    voices.flush()
+    pool = voices.pools["combat"]
+    low_voice = next(voice for voice in pool if voice.priority == 1)
+
+    voices.play(newer, "combat", priority=2)
+    voices.flush()
+    assert voices.stolen == 1
+    assert low_voice.channel.get_sound() is newer
+    assert sorted(voice.priority for voice in pool) == [2, 3]
+
+
+def test_never_steals_more_important_voice(mixer):
+    voices = VoiceManager({"ui": 1}, first_channel=2)
+    voices.play(_make_sound(), "ui", priority=5)
+    voices.flush()
+    voices.play(_make_sound(), "ui", priority=1)
+    voices.flush()
+    assert voices.dropped == 1
+    assert voices.stolen == 0
+
+
+def test_categories_do_not_share_channels(mixer):
+    voices = VoiceManager({"ui": 1, "combat": 1}, first_channel=2)
+    voices.play(_make_sound(), "combat", priority=9)
+    voices.play(_make_sound(), "ui", priority=1)
+    voices.flush()
+    assert voices.played == 2
+    assert voices.stolen == voices.dropped == 0
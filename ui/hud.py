@@ -1,5 +1,6 @@
 import pygame, os
-from assets.loader import load_image
+from assets.loader import load_image, asset_exists
+from assets.atlas import sprite_atlas
 from core.config import WIDTH
 
 # Carregar ícones uma única vez
@@ -11,35 +12,39 @@ def init_hud_icons():
     global HEART_ICON, SHIELD_ICON
     heart_path = os.path.join("assets", "images", "efeitos", "heart.png")
     shield_path = os.path.join("assets", "images", "efeitos", "shield_icon.png")
-    if os.path.exists(heart_path):
+    if asset_exists(heart_path):
         HEART_ICON = load_image(heart_path, (32, 32))
     else:
         HEART_ICON = pygame.Surface((32, 32))
         HEART_ICON.fill((255, 0, 0))
-    if os.path.exists(shield_path):
+    if asset_exists(shield_path):
         SHIELD_ICON = load_image(shield_path, (32, 32))
     else:
         SHIELD_ICON = pygame.Surface((32, 32))
         SHIELD_ICON.fill((0, 0, 255))
+    sprite_atlas.add_many({"hud_heart": HEART_ICON, "hud_shield": SHIELD_ICON})
 
 def draw_hud(screen, pontos, vida, shield_available):
+    """Desenha o HUD e retorna o Rect da região alterada."""
     # Desenha um painel semitransparente
     panel_w, panel_h = 200, 70
     panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
     panel.fill((0, 0, 0, 150))  # RGBA, alpha 150
-    screen.blit(panel, (10, 10))
+    area = screen.blit(panel, (10, 10))
 
     # Texto de pontos
     font = pygame.font.SysFont(None, 28)
     txt = font.render(f"Pontos: {pontos}", True, (255, 255, 255))
-    screen.blit(txt, (20, 20))
+    area.union_ip(screen.blit(txt, (20, 20)))
 
-    # Ícones de vida
+    # Ícones de vida (do atlas de sprites, se registrados)
+    heart_icon = sprite_atlas.get("hud_heart") or HEART_ICON
     x = 20
     for i in range(vida):
-        screen.blit(HEART_ICON, (x, 45))
-        x += HEART_ICON.get_width() + 5
+        area.union_ip(screen.blit(heart_icon, (x, 45)))
+        x += heart_icon.get_width() + 5
 
     # Ícone de escudo (mostra se disponível)
     if shield_available:
-        screen.blit(SHIELD_ICON, (x + 10, 45))
+        area.union_ip(screen.blit(sprite_atlas.get("hud_shield") or SHIELD_ICON, (x + 10, 45)))
+    return area